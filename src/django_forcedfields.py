@@ -50,10 +50,38 @@ See:
 
 """
 
+import abc
+import base64
+import binascii
+import collections
+import collections.abc
+import copy
+import datetime
+import json
+import re
+import secrets
+import threading
+import time
+import uuid
+import weakref
+
+import django.apps
+import django.conf
 import django.core.checks
+import django.core.exceptions
+import django.core.management.base
+import django.core.paginator
+import django.db
+import django.db.backends.utils
 import django.db.models
+import django.db.models.constants
+import django.db.models.lookups
+import django.db.models.query_utils
+import django.db.models.sql
+import django.db.transaction
 import django.db.utils
 import django.utils.functional
+import django.utils.timezone
 
 
 class DefaultValueMixin:
@@ -124,6 +152,49 @@ class DefaultValueMixin:
 
         return default_value
 
+    def has_ddl_default(self):
+        """
+        Determine whether the column DDL holds a DEFAULT clause standing in for the field value.
+
+        Callable defaults are excluded since the DEFAULT clause only holds the value returned when
+        the DDL was generated.
+
+        Returns:
+            boolean: True if the DEFAULT clause produces the field's default value.
+
+        """
+        return self.has_default() and not callable(self.default)
+
+    def is_db_default(self, model_instance, connection):
+        """
+        Determine whether the column's DDL DEFAULT clause would produce the instance's field value.
+
+        If so, the field may be omitted from the INSERT statement altogether. See
+        OmitDBDefaultsQuerySetMixin.
+
+        Callable defaults are never considered equal. See has_ddl_default(). The column must have
+        been created or added with its DEFAULT clause intact. See DefaultValueSchemaEditorMixin.
+
+        Args:
+            model_instance: The model instance about to be inserted.
+            connection: The Django connection object with which the instance will be inserted.
+
+        Returns:
+            boolean: True if the field may be omitted from the INSERT statement.
+
+        """
+        if connection.vendor not in ('mysql', 'postgresql', 'sqlite'):
+            return False
+        if not self.has_ddl_default():
+            return False
+        return getattr(model_instance, self.attname) == self.get_default()
+
+
+InternCacheInfo = collections.namedtuple( # pylint: disable=invalid-name
+    'InternCacheInfo',
+    ['hits', 'misses', 'maxsize', 'currsize']
+)
+
 
 class FixedCharField(django.db.models.CharField, DefaultValueMixin):
     """
@@ -143,7 +214,8 @@ class FixedCharField(django.db.models.CharField, DefaultValueMixin):
     have not yet figured out how to do it. The ORM seems to absolutely require and depend upon a
     value for a field in a model at insert/update time, regardless of whether or not an explicit
     "default" kwarg value was passed to the CharField's constructor or an explicit value was defined
-    on the model's field attribute.
+    on the model's field attribute. The one exception is the opt-in OmitDBDefaultsQuerySetMixin,
+    which omits fields whose values equal their DDL DEFAULT.
 
     Obviously, it would be best to omit a value altogether and let the underlying DB handle it
     when no value and no default value is defined for the field in a model. But, since that seems
@@ -169,6 +241,109 @@ class FixedCharField(django.db.models.CharField, DefaultValueMixin):
 
     empty_strings_allowed = False
 
+    def __init__(self, *args, charset=None, intern_cache_size=None, strip_padding=False,
+                 **kwargs):
+        """
+        Override the init method to add additional keyword arguments.
+
+        Args:
+            charset (str): The column character set. Only emitted in MySQL DDL since PostgreSQL and
+                SQLite define encoding at the database level. See db_type().
+            intern_cache_size (int): When a positive integer, enables a bounded intern table of at
+                most this many distinct values. See _intern_db_value().
+            strip_padding (boolean): When true, trailing pad spaces are removed from CHAR values in
+                the database as part of the SELECT expression. See select_format().
+
+        """
+        self.charset = charset
+        self.intern_cache_size = intern_cache_size
+        self.strip_padding = strip_padding
+        self._intern_table = {}
+        self._intern_hits = 0
+        self._intern_misses = 0
+        super().__init__(*args, **kwargs)
+
+    def _check_intern_cache_size(self):
+        """
+        Check that intern_cache_size is either None or a positive integer.
+
+        Returns:
+            list: A list of additional Django check messages.
+
+        """
+        failed_checks = []
+        size = self.intern_cache_size
+        if size is not None and (isinstance(size, bool) or not isinstance(size, int) or size < 1):
+            failed_checks.append(
+                django.core.checks.Error(
+                    'The option intern_cache_size must be None or a positive integer.',
+                    obj=self,
+                    id=__name__ + '.E170'
+                )
+            )
+
+        return failed_checks
+
+    def _intern_db_value(self, value, expression, connection): # pylint: disable=unused-argument
+        """
+        Return a shared str instance for each distinct value retrieved from the database.
+
+        Each value retrieved from the database is otherwise a separate str object, even when a
+        column holds only a handful of distinct values such as ISO country or currency codes. When
+        tens of millions of these values are loaded, the duplicate objects dominate memory use. This
+        converter maps each value to the first equal instance seen by this field so that equal
+        values share one object.
+
+        The table is bounded by intern_cache_size. Once full, new values are no longer added and
+        are returned unchanged. Entries are never evicted since, for the low-cardinality columns
+        this option is intended for, the table fills with the hot values almost immediately.
+
+        The hit and miss counters are not synchronized between threads and are therefore
+        approximate under concurrent use. The table itself is only ever mutated with single dict
+        operations.
+
+        This method is registered as a converter in get_db_converters() instead of being named
+        from_db_value() so that fields without intern_cache_size incur no per-row call at all.
+
+        See:
+            https://docs.djangoproject.com/en/dev/ref/models/fields/#django.db.models.Field.from_db_value
+
+        Args:
+            value (str): The value retrieved from the database.
+            expression: The expression from which the value was selected.
+            connection: The Django connection object from which the value was retrieved.
+
+        Returns:
+            str: The interned value.
+
+        """
+        if value is None:
+            return value
+
+        interned_value = self._intern_table.get(value)
+        if interned_value is None:
+            self._intern_misses += 1
+            if len(self._intern_table) < self.intern_cache_size:
+                interned_value = self._intern_table.setdefault(value, value)
+            else:
+                interned_value = value
+        else:
+            self._intern_hits += 1
+
+        return interned_value
+
+    def check(self, **kwargs):
+        """
+        Override check() to add the intern_cache_size check.
+
+        See:
+            https://docs.djangoproject.com/en/dev/topics/checks/
+
+        """
+        failed_checks = super().check(**kwargs)
+        failed_checks.extend(self._check_intern_cache_size())
+        return failed_checks
+
     def db_type(self, connection):
         """
         Override db_type().
@@ -182,317 +357,5011 @@ class FixedCharField(django.db.models.CharField, DefaultValueMixin):
             https://docs.djangoproject.com/en/dev/ref/checks/
             https://github.com/django/django/blob/master/django/db/models/fields/__init__.py
 
+        The character set clause immediately follows the data type. In MySQL, a column inherits
+        the table's character set, commonly utf8mb4, which reserves up to four bytes per character
+        in CHAR columns and index keys. Declaring "CHARACTER SET ascii" for codes and hashes reduces
+        that to one byte per character. The collation is left to the inherited db_collation option,
+        for which Django's schema editor emits the COLLATE clause. A binary collation such as
+        "ascii_bin" or PostgreSQL's "C" collation additionally makes comparisons simple byte
+        comparisons.
+
+        See:
+            https://dev.mysql.com/doc/refman/en/charset-column.html
+            https://dev.mysql.com/doc/refman/en/storage-requirements.html
+            https://docs.djangoproject.com/en/dev/ref/models/fields/#django.db.models.CharField.db_collation
+
         """
         type_spec = []
         db_type_format = 'CHAR({!s})'
         db_type_default_format = 'DEFAULT {!s}'
 
         type_spec.append(db_type_format.format(self.max_length))
+
+        if connection.vendor == 'mysql' and self.charset:
+            type_spec.append('CHARACTER SET {!s}'.format(self.charset))
+
         if self.has_default():
             default_value = self._get_db_type_default_value(self.get_default(), connection)
             type_spec.append(db_type_default_format.format(default_value))
 
         return ' '.join(type_spec)
 
+    def deconstruct(self):
+        """
+        Override the deconstruct method to ensure additional keyword argument values are preserved.
 
-class TimestampField(django.db.models.DateTimeField, DefaultValueMixin):
-    """
-    A custom Django ORM field class designed for use as a timezone-free system timestamp field.
+        See:
+            https://docs.djangoproject.com/en/dev/ref/models/fields/#django.db.models.Field.deconstruct
 
-    System timestamps are intended to record system-level events and timezone-independent moments in
-    time. They contribute to database and record metadata.
+        """
+        name, path, args, kwargs = super().deconstruct()
+        if self.charset is not None:
+            kwargs['charset'] = self.charset
+        if self.intern_cache_size is not None:
+            kwargs['intern_cache_size'] = self.intern_cache_size
+        if self.strip_padding:
+            kwargs['strip_padding'] = True
+        return (name, path, args, kwargs)
 
-    See:
-        http://stackoverflow.com/a/410458
+    def get_db_converters(self, connection):
+        """
+        Override get_db_converters() to add the intern table converter when it is enabled.
 
-    MySQL/MariaDB supports the TIMESTAMP data type which includes special modifiers to ease its use
-    as a system utility. These include the ON UPDATE CURRENT_TIMESTAMP modifier which essentially
-    creates an implicit trigger. Django uses MySQL's DATETIME data type by default while this class
-    overrides this and uses MySQL's TIMESTAMP data type instead.
+        See:
+            https://github.com/django/django/blob/master/django/db/models/fields/__init__.py
 
-    Warning:
-        When using the MySQL backend, the database TIMESTAMP field will also be updated when
-        auto_now or auto_now_update is True and when calling QuerySet.update(). In constrast,
-        Django's DateField and DateTimeField only set current timestamp under auto_now when calling
-        Model.save().
+        """
+        converters = super().get_db_converters(connection)
+        if self.intern_cache_size:
+            converters.append(self._intern_db_value)
+        return converters
 
-    See:
-        https://docs.djangoproject.com/en/dev/ref/models/fields/#datefield
-        https://mariadb.com/kb/en/mariadb/timestamp/
-        https://github.com/django/django/blob/master/django/db/backends/mysql/base.py
+    def intern_cache_clear(self):
+        """
+        Empty the intern table and reset its statistics.
 
-    PostgreSQL does not have anything resembling ON UPDATE CURRENT_TIMESTAMP aside from custom
-    triggers. However, its equivalent of MySQL's DATETIME data type is "timestamp", which does
-    include the option to save without timezone. This explciit lack of timezone most closely aligns
-    with the intended use case of this field class and is therefore used.
+        """
+        self._intern_table.clear()
+        self._intern_hits = 0
+        self._intern_misses = 0
 
-    See:
-        https://www.postgresql.org/docs/current/static/datatype-datetime.html
-        https://github.com/django/django/blob/master/django/db/backends/postgresql/base.py
+    def intern_cache_info(self):
+        """
+        Report intern table statistics.
 
-    """
+        The interface mimics that of functools.lru_cache(). The hit rate is hits / (hits + misses).
+        Every hit is one str object that was not retained.
 
-    def __init__(self, *args, auto_now_update=False, **kwargs):
-        """
-        Override the init method to add the auto_now_update keyword argument.
+        See:
+            https://docs.python.org/3/library/functools.html#functools.lru_cache
 
-        Args:
-            auto_now_update (boolean): When true, enables the automatic setting of the current
-                timestamp on update operations only. Mutually exclusive with auto_now.
+        Returns:
+            InternCacheInfo: A named tuple of hits, misses, maxsize, and currsize.
 
         """
-        self.auto_now_update = auto_now_update
-        super().__init__(*args, **kwargs)
+        return InternCacheInfo(
+            self._intern_hits,
+            self._intern_misses,
+            self.intern_cache_size,
+            len(self._intern_table)
+        )
 
-    def _check_mutually_exclusive_options(self):
+    def select_format(self, compiler, sql, params):
         """
-        Override the mutual exclusivity check in parent class.
-
-        django.db.models.fields.DateTimeCheckMixin is used to enforce mutual exclusivity between
-        auto_now, auto_now_add, and default keyword arguments. This method also adds a check for
-        auto_now_update and auto_now exclusivity.
+        Wrap the selected column in RTRIM() under PostgreSQL when strip_padding is enabled.
 
-        auto_now, auto_now_add, and default all logically define a DEFAULT clause and are therefore
-        mutually exclusive. auto_now logically defines DEFAULT and ON UPDATE clauses and is
-        therefore mutually exclusive with auto_now_add (DEFAULT) and auto_now_update (ON UPDATE).
-
-        Valid permutations:
-            <empty set>
-            null
-            auto_now
-            auto_now + null
-            auto_now_add
-            auto_now_add + auto_now_update
-            auto_now_add + auto_now_update + null
-            auto_now_add + null
-            auto_now_update
-            auto_now_update + null
-            default
-            default + auto_now_update
-            default + auto_now_update + null
-            default + null
+        PostgreSQL returns CHAR(n) values padded with spaces to the full column length. MySQL strips
+        trailing spaces on retrieval unless the PAD_CHAR_TO_FULL_LENGTH SQL mode is enabled and
+        SQLite stores and returns values exactly as inserted. Trimming in the SELECT expression
+        moves the work to the database and avoids a Python str.rstrip() call per row, per column in
+        from_db_value(). Because select_format() is applied to every selected column, the trim also
+        applies to values() and values_list() querysets.
 
-        Returns:
-            list: A list of additional Django check messages.
+        WHERE clauses, ORDER BY clauses, and indexes still operate on the untrimmed column.
 
         See:
-            https://github.com/django/django/blob/master/django/db/models/fields/__init__.py
-            https://docs.djangoproject.com/en/dev/ref/models/fields/#django.db.models.DateField
-            https://docs.djangoproject.com/en/dev/topics/checks/
+            https://www.postgresql.org/docs/current/static/datatype-character.html
+            https://dev.mysql.com/doc/refman/en/sql-mode.html#sqlmode_pad_char_to_full_length
+            https://github.com/django/django/blob/master/django/db/models/expressions.py
+                django.db.models.expressions.BaseExpression.select_format
 
         """
-        # Checks auto_now, auto_now_add, and default mutual exclusivity.
-        failed_checks = super()._check_mutually_exclusive_options()
+        sql, params = super().select_format(compiler, sql, params)
+        vendor = compiler.connection.vendor
+        if self.strip_padding and vendor == 'postgresql':
+            sql = 'RTRIM({!s})'.format(sql)
+        return sql, params
 
-        if self.auto_now and self.auto_now_update:
-            failed_checks.append(
-                django.core.checks.Error(
-                    'The option auto_now is mutually exclusive with the option auto_now_update.',
-                    obj=self,
-                    id=__name__ + '.E160'
-                )
-            )
 
-        return failed_checks
+class BpcharLookupMixin:
+    """
+    A lookup class mixin that binds FixedCharField lookup parameters as PostgreSQL bpchar values.
 
-    def _db_type_mysql(self, connection):
-        """
-        Assemble the db_type string for the MySQL backend.
+    PostgreSQL stores CHAR(n) columns as the "bpchar" (blank-padded char) type. Lookup parameters,
+    however, may reach the server typed as text or varchar. When that happens, the planner resolves
+    the comparison with the text operators, implicitly casting the column instead of the parameter,
+    and the column's bpchar btree index can no longer be used. On large tables, the result is a
+    sequential scan.
 
-        Note that in MySQL, if no DEFAULT or ON UPDATE clauses are specified for a TIMESTAMP field
-        in a CREATE TABLE statement, certain DEFAULT CURRENT_TIMESTAMP and ON UPDATE
-        CURRENT_TIMESTAMP values are automatically applied depending upon server configuration.
-        Enable the "explicit_defaults_for_timestamp" server system variable to disable this. See
-        README for more details.
+    This mixin explicitly casts each direct lookup parameter to bpchar(n), where n is the field's
+    max_length, and pads each parameter to max_length so that the value sent matches the value
+    stored. Comparisons are then resolved with the bpchar operators and the index is eligible.
 
-        At minimum, a DEFAULT clause must be specified in order to be compatible with MySQL server
-        system variable explicit_defaults_for_timestamp. MySQL strict mode, NO_ZERO_DATE,
-        NO_ZERO_IN_DATE, and explicit_defaults_for_timestamp all affect what values and defaults are
-        valid and it is the user's responsibility to effect the desired database behavior by setting
-        these configurations on the database server. See README and your database engine's
-        documentation for more details.
+    Casting to bpchar(n) silently truncates longer values. A lookup value that exceeds max_length
+    could then match a row that it should not match. When any parameter is longer than max_length,
+    parameters are left unpadded and cast to the unbounded bpchar type instead, which preserves
+    both correctness and index eligibility.
 
-        See:
-            https://dev.mysql.com/doc/refman/en/timestamp-initialization.html
-            https://dev.mysql.com/doc/refman/en/server-system-variables.html#sysvar_explicit_defaults_for_timestamp
-            https://jira.mariadb.org/browse/MDEV-10802
+    Other backends are unaffected. MySQL and SQLite compare CHAR columns without a cast.
 
-        I'm concerned about outputting the DEFAULT clause here. The Django schema editor mechanism
-        already seems to provide a way to output DEFAULT although it doesn't appear to be used in
-        core and it appears narrow in scope. Default values are (sigh) usually applied in the
-        application layer in a model's __init__ method if no field value was explicitly defined in
-        model's initial kwargs.
+    See:
+        https://www.postgresql.org/docs/current/static/datatype-character.html
+        https://www.postgresql.org/docs/current/static/typeconv-oper.html
+        https://docs.djangoproject.com/en/dev/howto/custom-lookups/
 
-        See:
-            https://github.com/django/django/blob/master/django/db/models/base.py
-            https://github.com/django/django/blob/master/django/db/backends/base/schema.py
-                django.db.backends.base.BaseDatabaseSchemaEditor.column_sql
-                django.db.backends.base.BaseDatabaseSchemaEditor.create_model
+    """
 
-        Args:
-            connection: The Django connection object that was passed to the db_type() override.
+    def process_rhs(self, compiler, connection):
+        """
+        Override process_rhs() to cast and pad direct values under the PostgreSQL backend.
 
-        Returns:
-            string: The db_type field definition string.
+        Depending upon the lookup, the parent returns the right-hand side SQL as a single
+        placeholder string ("%s"), a parenthesized list of placeholders ("(%s, %s)"), or a list of
+        placeholder strings (range). Expressions and subqueries are left untouched.
 
         """
-        type_spec = ['TIMESTAMP']
-        ts_default_default = 'DEFAULT CURRENT_TIMESTAMP'
-        ts_default_on_update = 'ON UPDATE CURRENT_TIMESTAMP'
-        if self.auto_now:
-            # CURRENT_TIMESTAMP on create and on update.
-            type_spec.extend([ts_default_default, ts_default_on_update])
-        elif self.auto_now_add:
-            # CURRENT_TIMESTAMP on create only.
-            type_spec.append(ts_default_default)
-        elif self.has_default():
-            # Set specified default on creation, no ON UPDATE action.
-            default_value = self._get_db_type_default_value(self.get_default(), connection)
-            type_spec.append('DEFAULT {!s}'.format(default_value))
+        rhs_sql, rhs_params = super().process_rhs(compiler, connection)
+        vendor = connection.vendor
+        if vendor != 'postgresql' or not self.rhs_is_direct_value():
+            return rhs_sql, rhs_params
 
-        if self.auto_now_update:
-            # CURRENT_TIMESTAMP on update only.
-            # Mutual exclusivity between auto_now and auto_now_update has already been ensured by
-            # self._check_mutually_exclusive_options() by the time this method has been called.
-            type_spec.append(ts_default_on_update)
+        max_length = self.lhs.output_field.max_length
+        if all(isinstance(param, str) and len(param) <= max_length for param in rhs_params):
+            cast = '::bpchar({!s})'.format(max_length)
+            rhs_params = [param.ljust(max_length) for param in rhs_params]
+        else:
+            cast = '::bpchar'
 
-        return ' '.join(type_spec)
+        if isinstance(rhs_sql, str):
+            rhs_sql = rhs_sql.replace('%s', '%s' + cast)
+        else:
+            rhs_sql = [sql.replace('%s', '%s' + cast) for sql in rhs_sql]
 
-    def _db_type_postgresql(self, connection):
-        """
-        Assemble the db_type string for the PostgreSQL backend.
+        return rhs_sql, rhs_params
 
-        PostgreSQL has no equivalent to MySQL's ON UPDATE clause. Values on update are handled
-        manually in the ORM layer. See pre_save().
 
-        Args:
-            connection: The Django connection object that was passed to the db_type() override.
+@FixedCharField.register_lookup
+class FixedCharExact(BpcharLookupMixin, django.db.models.lookups.Exact):
+    """
+    The "exact" lookup for FixedCharField. See BpcharLookupMixin.
 
-        Returns:
-            string: The db_type field definition string.
+    """
 
-        """
-        type_spec = ['TIMESTAMP WITHOUT TIME ZONE']
-        if self.auto_now or self.auto_now_add:
-            # CURRENT_TIMESTAMP on create
-            type_spec.append('DEFAULT CURRENT_TIMESTAMP')
-        elif self.has_default():
-            # Set specified default on creation, no ON UPDATE action.
-            # Warning: PostgreSQL uses double quotes only for system identifiers.
-            default_value = self._get_db_type_default_value(self.get_default(), connection)
-            type_spec.append('DEFAULT {!s}'.format(default_value))
 
-        return ' '.join(type_spec)
+@FixedCharField.register_lookup
+class FixedCharIn(BpcharLookupMixin, django.db.models.lookups.In):
+    """
+    The "in" lookup for FixedCharField. See BpcharLookupMixin.
 
-    def _db_type_sqlite(self, connection):
-        """
-        Assemble the db_type string for the sqlite3 backend.
+    """
 
-        SQLite has no equivalent to MySQL's ON UPDATE clause. Values on update are handled
-        manually in the ORM layer. See pre_save().
 
-        Args:
-            connection: The Django connection object that was passed to the db_type() override.
+@FixedCharField.register_lookup
+class FixedCharGreaterThan(BpcharLookupMixin, django.db.models.lookups.GreaterThan):
+    """
+    The "gt" lookup for FixedCharField. See BpcharLookupMixin.
 
-        Returns:
-            string: The db_type field definition string.
+    """
 
-        """
-        type_spec = ['DATETIME']
-        if self.auto_now or self.auto_now_add:
-            type_spec.append('DEFAULT CURRENT_TIMESTAMP')
-        elif self.has_default():
-            default_value = self._get_db_type_default_value(self.get_default(), connection)
-            type_spec.append('DEFAULT {!s}'.format(default_value))
 
-        return ' '.join(type_spec)
+@FixedCharField.register_lookup
+class FixedCharGreaterThanOrEqual(BpcharLookupMixin, django.db.models.lookups.GreaterThanOrEqual):
+    """
+    The "gte" lookup for FixedCharField. See BpcharLookupMixin.
 
-    def db_type(self, connection):
+    """
+
+
+@FixedCharField.register_lookup
+class FixedCharLessThan(BpcharLookupMixin, django.db.models.lookups.LessThan):
+    """
+    The "lt" lookup for FixedCharField. See BpcharLookupMixin.
+
+    """
+
+
+@FixedCharField.register_lookup
+class FixedCharLessThanOrEqual(BpcharLookupMixin, django.db.models.lookups.LessThanOrEqual):
+    """
+    The "lte" lookup for FixedCharField. See BpcharLookupMixin.
+
+    """
+
+
+@FixedCharField.register_lookup
+class FixedCharRange(BpcharLookupMixin, django.db.models.lookups.Range):
+    """
+    The "range" lookup for FixedCharField. See BpcharLookupMixin.
+
+    """
+
+
+class FixedBinaryField(django.db.models.BinaryField, DefaultValueMixin):
+    """
+    A custom Django ORM field class that stores values in fixed-length binary database fields.
+
+    Django's core BinaryField class saves all values in variable-length BLOB data types. Hash
+    digests, packed identifiers, and similar values have an exact, known length and are often stored
+    as hexadecimal strings in CHAR fields instead, doubling their storage and index size. This class
+    stores the raw bytes in a fixed-length field.
+
+    BinaryField's max_length kwarg is kept for simplicity. In this class, the value of max_length is
+    required and will be the exact length of the field in bytes.
+
+    MySQL/MariaDB supports the fixed-length BINARY(n) data type. Values shorter than n bytes are
+    right-padded with 0x00 bytes by the database. PostgreSQL and SQLite have no fixed-length binary
+    data type so their variable-length types, bytea and BLOB, are used with a CHECK constraint
+    enforcing the exact length.
+
+    See:
+        https://dev.mysql.com/doc/refman/en/binary-varbinary.html
+        https://www.postgresql.org/docs/current/static/datatype-binary.html
+        https://www.sqlite.org/datatype3.html
+
+    As with FixedCharField, a NULL value rather than an empty byte string will be inserted when no
+    value and no default value are defined.
+
+    Values retrieved from the database are returned to the model exactly as the database driver
+    provides them, without any conversion in from_db_value(). psycopg2 returns bytea values as
+    memoryview objects, a zero-copy view on the driver's buffer, while the MySQL and SQLite drivers
+    return bytes objects. Both support the buffer protocol and compare equal to bytes. Call bytes()
+    on the value only where a bytes object is actually required.
+
+    See:
+        http://initd.org/psycopg/docs/usage.html#adapt-binary
+
+    """
+
+    empty_strings_allowed = False
+
+    def _check_max_length_attribute(self):
         """
-        Override the db_type method.
+        Check that max_length is a positive integer.
 
-        Type spec additions for self.null are not needed. Django magically appends NULL or NOT NULL
-        to the end of the generated SQL.
+        Unlike CharField, BinaryField does not require max_length. Since max_length is the length of
+        the fixed-length field, this class does.
+
+        Returns:
+            list: A list of additional Django check messages.
+
+        """
+        failed_checks = []
+        max_length = self.max_length
+        if isinstance(max_length, bool) or not isinstance(max_length, int) or max_length < 1:
+            failed_checks.append(
+                django.core.checks.Error(
+                    'FixedBinaryField must define a "max_length" attribute that is a positive '
+                    'integer.',
+                    obj=self,
+                    id=__name__ + '.E180'
+                )
+            )
+
+        return failed_checks
+
+    def _get_db_type_default_value(self, value, connection):
+        """
+        Override DefaultValueMixin._get_db_type_default_value() to generate binary literals.
+
+        The parent's get_db_prep_value() wraps values in driver-specific binary adapter objects
+        that have no usable string representation in DDL. Instead, the value is emitted as a
+        hexadecimal binary literal in the syntax of the connection's database engine.
+
+        Args:
+            value: The desired value of the field class' "default" kwarg and instance attribute.
+            connection: The Django connection object that was passed to db_type().
+
+        Returns:
+            str: A valid SQL DEFAULT value usable in a column's DDL statement.
+
+        """
+        if value is None:
+            return super()._get_db_type_default_value(value, connection)
+
+        hex_value = bytes(value).hex()
+        vendor = connection.vendor
+        if vendor == 'postgresql':
+            # bytea hex format. Assumes standard_conforming_strings is on, the default since 9.1.
+            default_value = "'\\x{!s}'::bytea".format(hex_value)
+        else:
+            # MySQL and SQLite hexadecimal literal.
+            default_value = "X'{!s}'".format(hex_value)
+
+        return default_value
+
+    def check(self, **kwargs):
+        """
+        Override check() to add the max_length check.
+
+        See:
+            https://docs.djangoproject.com/en/dev/topics/checks/
+
+        """
+        failed_checks = super().check(**kwargs)
+        failed_checks.extend(self._check_max_length_attribute())
+        return failed_checks
+
+    def db_check(self, connection):
+        """
+        Override db_check() to enforce the exact value length on PostgreSQL and SQLite.
+
+        Django's schema editor appends the returned string to the column definition in a CHECK
+        clause. MySQL enforces the length through the BINARY(n) data type itself.
 
         See:
             https://github.com/django/django/blob/master/django/db/backends/base/schema.py
-                BaseDatabaseSchemaEditor.column_sql
+                BaseDatabaseSchemaEditor.create_model
 
-        Note that returning None from this method will cause Django to simply skip this field in its
-        generated CREATE TABLE statements. This allows one to define the field manually outside of
-        the ORM, a feature that may prove useful in the future.
+        """
+        vendor = connection.vendor
+        column = connection.ops.quote_name(self.column)
+        if vendor == 'postgresql':
+            db_check = 'octet_length({!s}) = {!s}'.format(column, self.max_length)
+        elif vendor == 'sqlite':
+            # length() returns the number of bytes for BLOB values.
+            db_check = 'length({!s}) = {!s}'.format(column, self.max_length)
+        else:
+            db_check = super().db_check(connection)
+
+        return db_check
+
+    def db_type(self, connection):
+        """
+        Override db_type().
 
         See:
-            https://github.com/django/django/blob/master/django/db/models/fields/__init__.py
-            https://docs.djangoproject.com/en/dev/howto/custom-model-fields/#useful-methods
+            https://docs.djangoproject.com/en/dev/ref/models/fields/#django.db.models.Field.db_type
 
         """
-        engine = connection.settings_dict['ENGINE']
-        if engine == 'django.db.backends.mysql':
-            db_type = self._db_type_mysql(connection)
-        elif engine == 'django.db.backends.postgresql':
-            db_type = self._db_type_postgresql(connection)
-        elif engine == 'django.db.backends.sqlite3':
-            db_type = self._db_type_sqlite(connection)
+        vendor = connection.vendor
+        if vendor == 'mysql':
+            type_spec = ['BINARY({!s})'.format(self.max_length)]
+        elif vendor == 'postgresql':
+            type_spec = ['BYTEA']
+        elif vendor == 'sqlite':
+            type_spec = ['BLOB']
         else:
-            db_type = super().db_type(connection)
+            return super().db_type(connection)
+
+        if self.has_default():
+            default_value = self._get_db_type_default_value(self.get_default(), connection)
+            type_spec.append('DEFAULT {!s}'.format(default_value))
+
+        return ' '.join(type_spec)
+
+
+class CompactUUIDField(django.db.models.UUIDField, DefaultValueMixin):
+    """
+    A custom Django ORM field class that stores UUIDs in 16 bytes on every database engine.
+
+    Django's core UUIDField uses PostgreSQL's native uuid data type but falls back to a 32-character
+    hexadecimal CHAR field on MySQL and SQLite. Every value and index key is therefore twice the
+    size of the UUID itself, which is particularly costly for primary and foreign keys since they
+    are copied into every secondary index and join. This class stores the raw 16 bytes instead.
+
+    ========== =========
+    database   data type
+    ========== =========
+    MySQL      BINARY(16)
+    PostgreSQL UUID
+    SQLite     BLOB
+    ========== =========
+
+    On SQLite, a CHECK constraint enforces the 16-byte length.
+
+    Values are converted directly between uuid.UUID instances and their 16-byte representation
+    with UUID.bytes and uuid.UUID(bytes=...), avoiding the intermediate hexadecimal string used by
+    UUIDField. On PostgreSQL, the database driver already adapts uuid.UUID instances natively and no
+    conversion is performed.
+
+    Warning:
+        Since the stored value is binary on MySQL and SQLite, get_internal_type() reports
+        "BinaryField". Otherwise, the MySQL and SQLite backends would apply their UUIDField
+        converters, which parse hexadecimal strings, to values retrieved from the database.
+
+    See:
+        https://docs.djangoproject.com/en/dev/ref/models/fields/#uuidfield
+        https://github.com/django/django/blob/master/django/db/backends/mysql/operations.py
+        https://docs.python.org/3/library/uuid.html
+
+    """
+
+    def _get_db_type_default_value(self, value, connection):
+        """
+        Override DefaultValueMixin._get_db_type_default_value() to generate UUID literals.
+
+        Args:
+            value: The desired value of the field class' "default" kwarg and instance attribute.
+            connection: The Django connection object that was passed to db_type().
+
+        Returns:
+            str: A valid SQL DEFAULT value usable in a column's DDL statement.
+
+        """
+        if value is None:
+            return super()._get_db_type_default_value(value, connection)
+
+        value = self.to_python(value)
+        if connection.vendor == 'postgresql':
+            default_value = "'{!s}'".format(value)
+        else:
+            # MySQL and SQLite hexadecimal literal.
+            default_value = "X'{!s}'".format(value.hex)
+
+        return default_value
+
+    def _get_db_type_base(self, connection):
+        """
+        Return the column data type without any modifiers.
+
+        Args:
+            connection: The Django connection object that was passed to db_type().
+
+        Returns:
+            str: The data type or None if the connection's database engine is not supported.
+
+        """
+        vendor = connection.vendor
+        if vendor == 'mysql':
+            db_type = 'BINARY(16)'
+        elif vendor == 'postgresql':
+            db_type = 'UUID'
+        elif vendor == 'sqlite':
+            db_type = 'BLOB'
+        else:
+            db_type = None
 
         return db_type
 
-    def deconstruct(self):
+    def db_check(self, connection):
         """
-        Override the deconstruct method to ensure auto_now_update value is preserved.
+        Override db_check() to enforce the 16-byte value length on SQLite.
+
+        See FixedBinaryField.db_check().
+
+        """
+        if connection.vendor == 'sqlite':
+            db_check = 'length({!s}) = 16'.format(connection.ops.quote_name(self.column))
+        else:
+            db_check = super().db_check(connection)
+
+        return db_check
+
+    def db_type(self, connection):
+        """
+        Override db_type().
+
+        Callable defaults, such as the common default=uuid.uuid4, generate a new value for each
+        model instance and therefore have no DEFAULT clause equivalent. Only static default values
+        are emitted.
 
         See:
-            https://docs.djangoproject.com/en/dev/ref/models/fields/#django.db.models.Field.deconstruct
+            https://docs.djangoproject.com/en/dev/ref/models/fields/#django.db.models.Field.db_type
 
         """
-        name, path, args, kwargs = super().deconstruct()
-        if self.auto_now_update:
-            kwargs['auto_now_update'] = True
-        return (name, path, args, kwargs)
+        db_type = self._get_db_type_base(connection)
+        if db_type is None:
+            return super().db_type(connection)
 
-    def pre_save(self, model_instance, add):
+        type_spec = [db_type]
+        if self.has_default() and not callable(self.default):
+            default_value = self._get_db_type_default_value(self.get_default(), connection)
+            type_spec.append('DEFAULT {!s}'.format(default_value))
+
+        return ' '.join(type_spec)
+
+    def from_db_value(self, value, expression, connection): # pylint: disable=unused-argument
         """
-        Set current timestamp if auto_now_update option is active.
+        Convert 16-byte database values to uuid.UUID instances.
 
-        If an auto_now, auto_now_add, or auto_now_update condition is active, override the field
-        value with current timestamp. This may not reflect underlying DB behavior in which explicit
-        values override DEFAULT and ON UPDATE, but it remains consistent with parent DateTimeField
-        behavior.
+        See:
+            https://docs.djangoproject.com/en/dev/ref/models/fields/#django.db.models.Field.from_db_value
 
-        The model's attribute value will be set to a Django Func() expression when an auto_now
-        conditions are active. Given the common use cases of the auto_now options, I deem this
-        acceptable as historically, one would expect automatic timestamps to be generated in the
-        database instead of the application.
+        """
+        if value is None or isinstance(value, uuid.UUID):
+            return value
+        return uuid.UUID(bytes=bytes(value))
 
-        The only other options are to set the model attribute to a Python datetime value and hope
-        that it is not too different from the value that the database generated or to issue a second
-        query after successful save to retrieve the generated current timestamp.
+    def get_db_prep_value(self, value, connection, prepared=False):
+        """
+        Override get_db_prep_value() to pass 16-byte values to MySQL and SQLite.
 
-        For future reference, note that in the parent DateTimeField, date parse validation is
-        triggered by SQL compiler through get_db_prep_save(), get_db_prep_value(), get_prep_value(),
-        which finally calls to_python(), which in turn raises ValidationError if date parse fails.
+        See:
+            https://docs.djangoproject.com/en/dev/ref/models/fields/#django.db.models.Field.get_db_prep_value
 
-        The SQL compiler (django.db.models.sql.compiler.SQLInsertCompiler) calls this method on
-        fields to get the value to be inserted in the SQL insert VALUES list.
+        """
+        if value is None:
+            return value
+        if not isinstance(value, uuid.UUID):
+            value = self.to_python(value)
+
+        if connection.vendor == 'postgresql':
+            return value
+        return value.bytes
+
+    def get_internal_type(self):
+        """
+        Override get_internal_type(). See the class doc block.
+
+        """
+        return 'BinaryField'
+
+    def rel_db_type(self, connection):
+        """
+        Override rel_db_type() so that foreign keys use the same data type without a DEFAULT clause.
 
         See:
-            https://github.com/django/django/blob/master/django/db/models/sql/compiler.py
-            https://docs.djangoproject.com/en/dev/ref/models/fields/#django.db.models.Field.pre_save
+            https://docs.djangoproject.com/en/dev/ref/models/fields/#django.db.models.Field.rel_db_type
 
         """
-        # Based on my review of Django source, I do not believe one can omit a value altogether for
-        # a field in an INSERT or UPDATE SQL statement. The ModelBase.save() method seems to
-        # indiscriminately sweep all fields into the insert process. Therefore, use explicit value.
-        if self.auto_now or (self.auto_now_update and not add) or (self.auto_now_add and add):
-            value = django.db.models.functions.Now()
-            setattr(model_instance, self.attname, value)
-        else:
-            # This super() call is correct. Leave it alone.
-            # Skips DateTimeField and DateField pre_save() overrides while maintaining binding to
-            # current class instance.
-            # See: https://docs.python.org/3/library/functions.html#super
-            value = super(django.db.models.DateField, self).pre_save(model_instance, add) # pylint: disable=bad-super-call
+        db_type = self._get_db_type_base(connection)
+        if db_type is None:
+            db_type = super().rel_db_type(connection)
+        return db_type
 
-        return value
+
+class TimeOrderedIDGenerator:
+    """
+    Generates monotonically increasing time-ordered identifiers as integers.
+
+    Each identifier consists of a 48-bit Unix timestamp in milliseconds followed by a number of
+    random bits. The random bits are freshly drawn for the first identifier in each millisecond and
+    incremented by one for each subsequent identifier in the same millisecond, as described in the
+    ULID specification's monotonicity section and RFC 9562's "Monotonic Random" method. Identifiers
+    generated in the same process are therefore strictly increasing, even if the system clock moves
+    backwards.
+
+    The most significant random bit is cleared when the random bits are drawn, leaving at least
+    2^(random_bits - 1) increments before the counter would overflow into the timestamp. Should it
+    overflow anyway, the timestamp is advanced by one millisecond.
+
+    See:
+        https://github.com/ulid/spec#monotonicity
+        https://www.rfc-editor.org/rfc/rfc9562#section-6.2
+
+    """
+
+    def __init__(self, random_bits):
+        """
+        Args:
+            random_bits (int): The number of random bits following the timestamp.
+
+        """
+        self.random_bits = random_bits
+        self._lock = threading.Lock()
+        self._last_timestamp_ms = -1
+        self._last_random = 0
+
+    def generate(self, count=1):
+        """
+        Generate a batch of consecutive identifiers.
+
+        Only a single clock read, random draw, and lock acquisition are required for the whole
+        batch, making this considerably faster than generating identifiers one at a time.
+
+        Args:
+            count (int): The number of identifiers to generate.
+
+        Returns:
+            list: A list of integers in ascending order.
+
+        """
+        random_max = (1 << self.random_bits) - 1
+        timestamp_ms = int(time.time() * 1000)
+        with self._lock:
+            if timestamp_ms > self._last_timestamp_ms:
+                random_value = secrets.randbits(self.random_bits - 1)
+            else:
+                timestamp_ms = self._last_timestamp_ms
+                random_value = self._last_random + 1
+            if random_value + count - 1 > random_max:
+                timestamp_ms += 1
+                random_value = secrets.randbits(self.random_bits - 1)
+            self._last_timestamp_ms = timestamp_ms
+            self._last_random = random_value + count - 1
+
+        base_value = timestamp_ms << self.random_bits
+        return [base_value | (random_value + offset) for offset in range(count)]
+
+
+class TimeOrderedIDMixin(metaclass=abc.ABCMeta):
+    """
+    A class that adds generation of time-ordered identifiers to a field class.
+
+    Random identifiers such as version 4 UUIDs scatter inserts across the whole primary key index.
+    In clustered indexes such as InnoDB's, this causes frequent page splits and leaves little of the
+    index in the buffer pool's working set. Time-ordered identifiers are instead appended near the
+    right edge of the index like an auto-increment integer would be.
+
+    A value is generated when a model instance is first saved without a value for the field. Since
+    identifiers begin with their creation timestamp, the primary key can also stand in for a
+    separate, indexed creation timestamp. See get_id_range().
+
+    Inheriting classes must define the _id_generator class attribute, an instance of
+    TimeOrderedIDGenerator, and implement the abstract _encode_id() and _decode_timestamp_ms()
+    methods. This mixin must precede the field class in the list of parent classes.
+
+    """
+
+    _EPOCH = datetime.datetime(1970, 1, 1, tzinfo=datetime.timezone.utc)
+
+    @abc.abstractmethod
+    def _decode_timestamp_ms(self, value):
+        """
+        Return the Unix timestamp in milliseconds embedded in an identifier.
+
+        Args:
+            value: A Python value of the field.
+
+        Returns:
+            int: The timestamp in milliseconds.
+
+        """
+
+    @abc.abstractmethod
+    def _encode_id(self, id_int):
+        """
+        Convert an integer produced by the TimeOrderedIDGenerator to a Python value of the field.
+
+        Args:
+            id_int (int): The timestamp in milliseconds followed by the random bits.
+
+        """
+
+    def _get_timestamp_ms(self, value):
+        """
+        Convert a datetime to a Unix timestamp in milliseconds.
+
+        Naive datetimes are interpreted in the current time zone, as with
+        django.utils.timezone.make_aware().
+
+        """
+        if django.utils.timezone.is_naive(value):
+            value = django.utils.timezone.make_aware(value)
+        return (value - self._EPOCH) // datetime.timedelta(milliseconds=1)
+
+    def generate_ids(self, count=1):
+        """
+        Generate a batch of new identifiers in ascending order.
+
+        Args:
+            count (int): The number of identifiers to generate.
+
+        Returns:
+            list: A list of Python values of the field.
+
+        """
+        return [self._encode_id(id_int) for id_int in self._id_generator.generate(count)]
+
+    def get_id_range(self, start, end):
+        """
+        Convert a timestamp interval to the range of identifiers generated within it.
+
+        The returned tuple can be passed directly to a "range" lookup, allowing the field's index
+        to serve queries on creation time:
+
+            Model.objects.filter(pk__range=Model._meta.pk.get_id_range(start, end))
+
+        Args:
+            start (datetime.datetime): The inclusive start of the interval.
+            end (datetime.datetime): The inclusive end of the interval, in millisecond resolution.
+
+        Returns:
+            tuple: The lowest and highest possible identifiers within the interval.
+
+        """
+        random_bits = self._id_generator.random_bits
+        start_int = self._get_timestamp_ms(start) << random_bits
+        end_int = (self._get_timestamp_ms(end) << random_bits) | ((1 << random_bits) - 1)
+        return (self._encode_id(start_int), self._encode_id(end_int))
+
+    def get_pk_value_on_save(self, instance):
+        """
+        Override get_pk_value_on_save() to generate an identifier for primary keys.
+
+        See:
+            https://github.com/django/django/blob/master/django/db/models/base.py
+
+        """
+        value = super().get_pk_value_on_save(instance)
+        if value is None:
+            value = self.generate_ids()[0]
+        return value
+
+    def get_timestamp(self, value):
+        """
+        Return the creation timestamp embedded in an identifier.
+
+        Args:
+            value: A Python value of the field.
+
+        Returns:
+            datetime.datetime: An aware datetime in UTC with millisecond resolution.
+
+        """
+        timestamp_ms = self._decode_timestamp_ms(self.to_python(value))
+        return self._EPOCH + datetime.timedelta(milliseconds=timestamp_ms)
+
+    def populate_ids(self, model_instances):
+        """
+        Assign identifiers to all given model instances lacking a value, in a single batch.
+
+        Use before QuerySet.bulk_create() to avoid generating identifiers one at a time.
+
+        Args:
+            model_instances (iterable): Model instances of the field's model class.
+
+        Returns:
+            list: The given model instances, in the same order.
+
+        """
+        model_instances = list(model_instances)
+        empty_instances = [
+            instance for instance in model_instances if getattr(instance, self.attname) is None
+        ]
+        for instance, value in zip(empty_instances, self.generate_ids(len(empty_instances))):
+            setattr(instance, self.attname, value)
+        return model_instances
+
+    def pre_save(self, model_instance, add):
+        """
+        Override pre_save() to generate an identifier on insert if the field has no value.
+
+        See:
+            https://docs.djangoproject.com/en/dev/ref/models/fields/#django.db.models.Field.pre_save
+
+        """
+        value = super().pre_save(model_instance, add)
+        if value is None and add:
+            value = self.generate_ids()[0]
+            setattr(model_instance, self.attname, value)
+        return value
+
+
+class ULIDField(TimeOrderedIDMixin, FixedCharField):
+    """
+    A custom Django ORM field class that generates and stores ULIDs in a CHAR(26) field.
+
+    A ULID is a 128-bit identifier consisting of a 48-bit millisecond timestamp followed by 80
+    random bits, encoded in 26 characters of Crockford's base32. The encoding preserves sort order
+    so that ULIDs sort by creation time both in Python and in the database.
+
+    The character set defaults to "ascii" so that each character occupies a single byte in MySQL
+    columns and index keys. Values are converted to upper case since Crockford's base32 is case
+    insensitive but the database collation may not be.
+
+    See:
+        https://github.com/ulid/spec
+        https://www.crockford.com/base32.html
+
+    """
+
+    _ALPHABET = '0123456789ABCDEFGHJKMNPQRSTVWXYZ'
+    _LENGTH = 26
+    _id_generator = TimeOrderedIDGenerator(80)
+
+    def __init__(self, *args, **kwargs):
+        """
+        Override the init method to fix max_length and to default to the ASCII character set.
+
+        """
+        kwargs['max_length'] = self._LENGTH
+        kwargs.setdefault('charset', 'ascii')
+        super().__init__(*args, **kwargs)
+
+    def _decode_timestamp_ms(self, value):
+        """
+        See TimeOrderedIDMixin._decode_timestamp_ms().
+
+        """
+        id_int = 0
+        for character in value:
+            id_int = (id_int << 5) | self._ALPHABET.index(character)
+        return id_int >> 80
+
+    def _encode_id(self, id_int):
+        """
+        See TimeOrderedIDMixin._encode_id().
+
+        """
+        return ''.join(
+            self._ALPHABET[(id_int >> shift) & 31] for shift in range(125, -5, -5)
+        )
+
+    def deconstruct(self):
+        """
+        Override the deconstruct method to omit the fixed max_length and default charset.
+
+        See:
+            https://docs.djangoproject.com/en/dev/ref/models/fields/#django.db.models.Field.deconstruct
+
+        """
+        name, path, args, kwargs = super().deconstruct()
+        del kwargs['max_length']
+        if self.charset == 'ascii':
+            del kwargs['charset']
+        elif self.charset is None:
+            kwargs['charset'] = None
+        return (name, path, args, kwargs)
+
+    def to_python(self, value):
+        """
+        Override to_python() to convert values to upper case.
+
+        """
+        value = super().to_python(value)
+        if value is not None:
+            value = value.upper()
+        return value
+
+
+class UUID7Field(TimeOrderedIDMixin, CompactUUIDField):
+    """
+    A custom Django ORM field class that generates version 7 UUIDs and stores them in 16 bytes.
+
+    A version 7 UUID consists of a 48-bit millisecond timestamp followed by the version and variant
+    bits and 74 random bits. Since the timestamp occupies the most significant bytes, values sort by
+    creation time under the byte-wise comparison of MySQL's BINARY, PostgreSQL's uuid, and SQLite's
+    BLOB data types. See CompactUUIDField for storage details.
+
+    See:
+        https://www.rfc-editor.org/rfc/rfc9562#section-5.7
+
+    """
+
+    _id_generator = TimeOrderedIDGenerator(74)
+
+    def _decode_timestamp_ms(self, value):
+        """
+        See TimeOrderedIDMixin._decode_timestamp_ms().
+
+        """
+        return value.int >> 80
+
+    def _encode_id(self, id_int):
+        """
+        See TimeOrderedIDMixin._encode_id().
+
+        The 74 random bits are split into the 12-bit rand_a and 62-bit rand_b fields.
+
+        """
+        random_value = id_int & ((1 << 74) - 1)
+        uuid_int = (
+            ((id_int >> 74) << 80)
+            | (0x7 << 76)
+            | ((random_value >> 62) << 64)
+            | (0x2 << 62)
+            | (random_value & ((1 << 62) - 1))
+        )
+        return uuid.UUID(int=uuid_int)
+
+
+class CompiledExpression(django.db.models.Expression):
+    """
+    An expression holding SQL compiled once in advance, to be reused in many rows of a query.
+
+    When an expression such as Now() is the value of a field in each of many model instances, the
+    SQL compiler resolves a copy of the expression and compiles it again for each row. This class
+    instead resolves to itself and returns its stored SQL and parameters. The stored SQL is only
+    valid for the database vendor of the connection with which it was compiled. An instance left on
+    a model instance may later be saved to a database of another vendor, for which the original
+    expression is compiled again instead.
+
+    See:
+        https://github.com/django/django/blob/master/django/db/models/sql/compiler.py
+            SQLInsertCompiler.prepare_value()
+
+    """
+
+    def __init__(self, sql, params, expression, vendor, output_field=None):
+        """
+        Args:
+            sql (str): The compiled SQL.
+            params (tuple): The compiled SQL's parameters.
+            expression: The resolved Django expression from which the SQL was compiled.
+            vendor (str): The vendor of the connection with which the SQL was compiled.
+            output_field: The Django field instance describing the expression's value.
+
+        """
+        super().__init__(output_field=output_field)
+        self.expression = expression
+        self.params = params
+        self.sql = sql
+        self.vendor = vendor
+
+    @classmethod
+    def compile(cls, expression, query, using):
+        """
+        Resolve and compile an expression for the given query and database.
+
+        Args:
+            expression: The Django expression to compile.
+            query: The Django query object, e.g. django.db.models.sql.InsertQuery.
+            using (str): The database alias.
+
+        Returns:
+            CompiledExpression: The compiled expression.
+
+        """
+        compiler = query.get_compiler(using)
+        resolved_expression = expression.resolve_expression(query, allow_joins=False, for_save=True)
+        sql, params = compiler.compile(resolved_expression)
+        return cls(
+            sql,
+            tuple(params),
+            resolved_expression,
+            compiler.connection.vendor,
+            output_field=resolved_expression.output_field
+        )
+
+    def as_sql(self, compiler, connection):
+        """
+        Return the stored SQL and parameters or, for another database vendor, compile them again.
+
+        """
+        if connection.vendor != self.vendor:
+            return compiler.compile(self.expression)
+        return self.sql, self.params
+
+    def resolve_expression(self, *args, **kwargs): # pylint: disable=unused-argument
+        """
+        Return the expression itself, since it was resolved before being compiled.
+
+        """
+        return self
+
+
+class EpochMillisecondsNow(django.db.models.functions.Now):
+    """
+    The current timestamp as an integer number of milliseconds since the Unix epoch.
+
+    Used in place of Now() by TimestampFields with storage='epoch_ms'. Inheriting from Now allows
+    the expression to be recognized wherever a pending current timestamp is expected, such as in
+    TimestampField.pre_save() and TimestampDeferredAttribute.
+
+    See:
+        https://dev.mysql.com/doc/refman/en/date-and-time-functions.html#function_unix-timestamp
+        https://www.postgresql.org/docs/current/static/functions-datetime.html#FUNCTIONS-DATETIME-EXTRACT
+        https://www.sqlite.org/lang_datefunc.html
+
+    """
+
+    output_field = django.db.models.BigIntegerField()
+
+    vendor_sql = {
+        'mysql': 'FLOOR(UNIX_TIMESTAMP(CURRENT_TIMESTAMP(3)) * 1000)',
+        'postgresql': 'CAST(FLOOR(EXTRACT(EPOCH FROM CURRENT_TIMESTAMP) * 1000) AS BIGINT)',
+        'sqlite': (
+            'CAST(STRFTIME(\'%s\', \'now\') AS INTEGER) * 1000'
+            ' + CAST(SUBSTR(STRFTIME(\'%f\', \'now\'), 4) AS INTEGER)'
+        )
+    }
+
+    @classmethod
+    def get_sql(cls, connection):
+        """
+        Return the SQL expression for the connection's database, without parameter escaping.
+
+        Databases other than MySQL and SQLite receive the PostgreSQL expression, which only uses
+        standard SQL aside from the EPOCH field of EXTRACT.
+
+        Args:
+            connection: The Django connection object.
+
+        Returns:
+            str: The SQL expression.
+
+        """
+        return cls.vendor_sql.get(connection.vendor, cls.vendor_sql['postgresql'])
+
+    def as_sql(self, compiler, connection, **extra_context): # pylint: disable=unused-argument
+        """
+        Return the SQL expression with its percent signs escaped for the query parameters.
+
+        """
+        return self.get_sql(connection).replace('%', '%%'), []
+
+    # Now() defines vendor-specific methods which would otherwise take precedence over as_sql().
+    as_mysql = as_sql
+    as_oracle = as_sql
+    as_postgresql = as_sql
+    as_sqlite = as_sql
+
+
+class PrecisionNow(django.db.models.functions.Now):
+    """
+    The current timestamp at a given number of fractional second digits.
+
+    Used in place of Now() by TimestampFields with an explicit precision, whose DDL defaults and
+    triggers follow that precision. Now() itself has microseconds on MySQL and PostgreSQL and
+    milliseconds on SQLite, regardless of the column. Fields without a precision keep Now().
+    Inheriting from Now allows the expression to be recognized wherever a pending current
+    timestamp is expected, as with EpochMillisecondsNow.
+
+    See:
+        https://dev.mysql.com/doc/refman/en/fractional-seconds.html
+        https://www.postgresql.org/docs/current/static/functions-datetime.html#FUNCTIONS-DATETIME-CURRENT
+        https://www.sqlite.org/lang_datefunc.html
+
+    """
+
+    def __init__(self, precision=None, **extra):
+        """
+        Args:
+            precision (int): The number of fractional second digits, or None for whole seconds.
+
+        """
+        super().__init__(**extra)
+        self.precision = precision
+
+    def get_sql(self, connection):
+        """
+        Return the SQL expression for the connection's database, without parameter escaping.
+
+        MySQL requires the precision of CURRENT_TIMESTAMP in DEFAULT and ON UPDATE clauses to match
+        that of the column. SQLite's CURRENT_TIMESTAMP only has whole seconds, so fractional seconds
+        are formatted with STRFTIME's %f, which is limited to milliseconds. Precisions above 3
+        therefore produce milliseconds in SQLite.
+
+        Args:
+            connection: The Django connection object.
+
+        Returns:
+            str: The SQL expression.
+
+        """
+        if not self.precision:
+            return 'CURRENT_TIMESTAMP'
+        if connection.vendor == 'sqlite':
+            current_timestamp_sql = 'STRFTIME(\'%Y-%m-%d %H:%M:%f\', \'now\')'
+            if self.precision < 3:
+                current_timestamp_sql = 'SUBSTR({!s}, 1, {:d})'.format(
+                    current_timestamp_sql,
+                    20 + self.precision
+                )
+            return current_timestamp_sql
+        return 'CURRENT_TIMESTAMP({:d})'.format(self.precision)
+
+    def as_sql(self, compiler, connection, **extra_context): # pylint: disable=unused-argument
+        """
+        Return the SQL expression with its percent signs escaped for the query parameters.
+
+        """
+        return self.get_sql(connection).replace('%', '%%'), []
+
+    # Now() defines vendor-specific methods which would otherwise take precedence over as_sql().
+    as_mysql = as_sql
+    as_oracle = as_sql
+    as_postgresql = as_sql
+    as_sqlite = as_sql
+
+
+class RowValueComparison(django.db.models.Expression):
+    """
+    A condition comparing a row of expressions to a row of values, e.g. "(a, b) > (1, 2)".
+
+    Row values compare lexicographically, which is exactly the condition needed to seek past a
+    position in a multi-column ordering. PostgreSQL and SQLite 3.15 or later turn the comparison
+    into a single range scan of a composite index on the columns. MySQL supports the syntax but does
+    not use indexes for it, so callers should use the equivalent expanded form there instead. See
+    supports_row_values() and TimestampCursorPaginator.get_queryset().
+
+    See:
+        https://www.postgresql.org/docs/current/static/functions-comparisons.html#ROW-WISE-COMPARISON
+        https://www.sqlite.org/rowvalue.html
+        https://dev.mysql.com/doc/refman/en/row-constructor-optimization.html
+
+    """
+
+    conditional = True
+    output_field = django.db.models.BooleanField()
+
+    def __init__(self, expressions, values, operator='>'):
+        """
+        Args:
+            expressions (list): Field names or expressions forming the left-hand row.
+            values (list): The values of the right-hand row, prepared for the database by the
+                output fields of the corresponding expressions.
+            operator (str): One of '<', '<=', '>', or '>='.
+
+        """
+        super().__init__()
+        self.expressions = [
+            django.db.models.F(expression) if isinstance(expression, str) else expression
+            for expression in expressions
+        ]
+        self.operator = operator
+        self.values = list(values)
+
+    def as_sql(self, compiler, connection):
+        """
+        Return the row value comparison SQL.
+
+        """
+        sql_list = []
+        params = []
+        for expression in self.expressions:
+            sql, expression_params = compiler.compile(expression)
+            sql_list.append(sql)
+            params.extend(expression_params)
+        params.extend(
+            expression.output_field.get_db_prep_value(value, connection)
+            for expression, value in zip(self.expressions, self.values)
+        )
+
+        return '({!s}) {!s} ({!s})'.format(
+            ', '.join(sql_list),
+            self.operator,
+            ', '.join(['%s'] * len(self.values))
+        ), params
+
+    def get_source_expressions(self):
+        """
+        Return the left-hand expressions so that Django resolves them.
+
+        """
+        return self.expressions
+
+    def set_source_expressions(self, exprs):
+        """
+        Set the resolved left-hand expressions.
+
+        """
+        self.expressions = list(exprs)
+
+    @staticmethod
+    def supports_row_values(connection):
+        """
+        Determine whether the database uses indexes for row value comparisons.
+
+        Args:
+            connection: The Django connection object.
+
+        Returns:
+            boolean: True for PostgreSQL and for SQLite 3.15 or later.
+
+        """
+        return connection.vendor == 'postgresql' or (
+            connection.vendor == 'sqlite' and connection.Database.sqlite_version_info >= (3, 15)
+        )
+
+
+class TimestampDeferredAttribute(django.db.models.query_utils.DeferredAttribute):
+    """
+    The model attribute descriptor of TimestampField, resolving current timestamp expressions.
+
+    After a save without RETURNING support, such as on MySQL, the attribute holds the Now()
+    expression set by TimestampField.pre_save(). Refreshing each instance separately would cost one
+    query per instance. Instead, pre_save() and TimestampQuerySet.bulk_update() register every
+    instance whose attribute they set to such an expression. On first access to one of them, a
+    single SELECT of primary keys and values resolves it along with up to batch_size - 1 other
+    pending instances of the same model saved to the same database.
+
+    Pending instances are grouped in batches of at most batch_size instances in the order in which
+    they were registered, so that resolving one instance only considers the others of its batch,
+    such as those of the same bulk_create() or bulk_update() call. An instance leaves its batch when
+    it is resolved, when its batch is resolved after another value was set, or when it is garbage
+    collected, since pending instances are only weakly referenced. Batches are recorded per thread
+    since each thread uses its own database connections and transactions. Instances whose rows no
+    longer exist or are not yet visible keep their expression.
+
+    Only TimestampFields with an auto option use this descriptor. Setting a value does nothing more
+    than Django's own assignment, so that loading rows is not slowed down. The other fields use
+    Django's non-data DeferredAttribute. See TimestampField.__init__().
+
+    See:
+        https://github.com/django/django/blob/master/django/db/models/query_utils.py
+
+    """
+
+    batch_size = 100
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._local = threading.local()
+
+    @staticmethod
+    def _remove(state, instance_id):
+        """
+        Remove an instance from its batch.
+
+        This is also the callback of the instance's weak reference, which may be called from another
+        thread, so the thread's state is passed explicitly.
+
+        Args:
+            state (threading.local): The state of the thread that recorded the instance.
+            instance_id (int): The id() of the instance.
+
+        """
+        batch_number = state.batch_numbers.pop(instance_id, None)
+        if batch_number is not None:
+            batch = state.batches[batch_number]
+            batch.pop(instance_id, None)
+            if not batch and batch_number != state.open_batch_number:
+                del state.batches[batch_number]
+
+    def _get_state(self):
+        """
+        Return the current thread's pending instances.
+
+        The state holds the batches, dicts of weak references to the instances keyed by their ids,
+        keyed by batch number, and the batch number of each instance id.
+
+        Returns:
+            threading.local: The thread's state.
+
+        """
+        state = self._local
+        if not hasattr(state, 'batches'):
+            state.batch_numbers = {}
+            state.batches = {0: {}}
+            state.open_batch_number = 0
+        return state
+
+    def _is_pending(self, instance):
+        """
+        Determine whether the instance has been saved and still holds a timestamp expression.
+
+        Args:
+            instance: The model instance.
+
+        Returns:
+            bool: True if the instance's value can be resolved.
+
+        """
+        return (
+            isinstance(
+                instance.__dict__.get(self.field.attname),
+                (django.db.models.functions.Now, CompiledExpression)
+            )
+            and not instance._state.adding
+            and instance.pk is not None
+        )
+
+    def _resolve(self, instance):
+        """
+        Retrieve the values of the instance and of the other pending instances of its batch.
+
+        Args:
+            instance: The model instance whose attribute is being accessed.
+
+        """
+        state = self._get_state()
+        db_alias = instance._state.db
+        batch = collections.defaultdict(list)
+        batch[instance.pk].append(instance)
+        batch_number = state.batch_numbers.get(id(instance))
+        if batch_number is not None:
+            for instance_id, reference in list(state.batches[batch_number].items()):
+                pending_instance = reference()
+                if pending_instance is None or pending_instance is instance:
+                    continue
+                if not self._is_pending(pending_instance):
+                    # Another value was set since the instance was registered.
+                    self._remove(state, instance_id)
+                elif pending_instance._state.db == db_alias:
+                    batch[pending_instance.pk].append(pending_instance)
+
+        rows = self.field.model._base_manager.using(db_alias) \
+            .filter(pk__in=list(batch)) \
+            .values_list('pk', self.field.attname)
+        for pk_value, value in rows:
+            for resolved_instance in batch[pk_value]:
+                resolved_instance.__dict__[self.field.attname] = value
+                self._remove(state, id(resolved_instance))
+                # Resolving the value is not a change to be saved. See DirtyFieldsModelMixin.
+                loaded_values = getattr(resolved_instance, '_loaded_values', None)
+                if loaded_values is not None and self.field.attname in loaded_values:
+                    loaded_values[self.field.attname] = value
+
+    def discard(self, instance):
+        """
+        Stop tracking an instance whose expression cannot be resolved.
+
+        For example, instances inserted by QuerySet.bulk_create() on databases that do not return
+        primary keys are never resolved.
+
+        Args:
+            instance: The model instance.
+
+        """
+        self._remove(self._get_state(), id(instance))
+
+    def register(self, instance):
+        """
+        Record an instance whose attribute has been set to a timestamp expression.
+
+        Args:
+            instance: The model instance.
+
+        """
+        state = self._get_state()
+        instance_id = id(instance)
+        if instance_id not in state.batch_numbers:
+            if len(state.batches[state.open_batch_number]) >= self.batch_size:
+                state.open_batch_number += 1
+                state.batches[state.open_batch_number] = {}
+            state.batches[state.open_batch_number][instance_id] = weakref.ref(
+                instance,
+                lambda reference: self._remove(state, instance_id)
+            )
+            state.batch_numbers[instance_id] = state.open_batch_number
+
+    def __get__(self, instance, cls=None):
+        """
+        Return the attribute value, resolving a pending timestamp expression first.
+
+        """
+        if instance is not None and self._is_pending(instance):
+            self._resolve(instance)
+        return super().__get__(instance, cls)
+
+    def __set__(self, instance, value):
+        """
+        Set the attribute value.
+
+        Unlike its parent, this descriptor must be a data descriptor in order to intercept access to
+        values held in the instance's __dict__. Instances are registered by register() rather than
+        here, since this method is called for every field of every loaded row.
+
+        """
+        instance.__dict__[self.field.attname] = value
+
+
+class TimestampField(django.db.models.DateTimeField, DefaultValueMixin):
+    """
+    A custom Django ORM field class designed for use as a timezone-free system timestamp field.
+
+    System timestamps are intended to record system-level events and timezone-independent moments in
+    time. They contribute to database and record metadata.
+
+    See:
+        http://stackoverflow.com/a/410458
+
+    MySQL/MariaDB supports the TIMESTAMP data type which includes special modifiers to ease its use
+    as a system utility. These include the ON UPDATE CURRENT_TIMESTAMP modifier which essentially
+    creates an implicit trigger. Django uses MySQL's DATETIME data type by default while this class
+    overrides this and uses MySQL's TIMESTAMP data type instead.
+
+    Warning:
+        When using the MySQL backend, the database TIMESTAMP field will also be updated when
+        auto_now or auto_now_update is True and when calling QuerySet.update(). In constrast,
+        Django's DateField and DateTimeField only set current timestamp under auto_now when calling
+        Model.save().
+
+    See:
+        https://docs.djangoproject.com/en/dev/ref/models/fields/#datefield
+        https://mariadb.com/kb/en/mariadb/timestamp/
+        https://github.com/django/django/blob/master/django/db/backends/mysql/base.py
+
+    PostgreSQL does not have anything resembling ON UPDATE CURRENT_TIMESTAMP aside from custom
+    triggers. However, its equivalent of MySQL's DATETIME data type is "timestamp", which does
+    include the option to save without timezone. This explciit lack of timezone most closely aligns
+    with the intended use case of this field class and is therefore used.
+
+    See:
+        https://www.postgresql.org/docs/current/static/datatype-datetime.html
+        https://github.com/django/django/blob/master/django/db/backends/postgresql/base.py
+
+    With storage='epoch_ms', the column is instead a BIGINT holding the number of milliseconds since
+    the Unix epoch, which is compact, free of time zone and DST ambiguity, and cheap to compare. The
+    model attribute still holds datetime values, converted by get_db_prep_value() and by a database
+    converter. See get_db_converters(). The column's DEFAULT clause computes the current time in
+    milliseconds in the database. MySQL has no ON UPDATE clause for integer columns so a trigger
+    takes its place, as in the other databases. See get_trigger_sql().
+
+    """
+
+    _EPOCH = datetime.datetime(1970, 1, 1, tzinfo=datetime.timezone.utc)
+
+    descriptor_class = TimestampDeferredAttribute
+
+    def __init__(self, *args, auto_now_update=False, index_type=None, pages_per_range=None,
+                 partition_interval=None, precision=None, storage='datetime', **kwargs):
+        """
+        Override the init method to add additional keyword arguments.
+
+        Args:
+            auto_now_update (boolean): When true, enables the automatic setting of the current
+                timestamp on update operations only. Mutually exclusive with auto_now.
+            index_type (str): The index method of the db_index index in PostgreSQL: 'btree',
+                'brin', or 'hash'. Other databases always use btree. See get_index_type().
+            pages_per_range (int): The number of table pages summarized by each BRIN index entry.
+                Only valid with index_type 'brin'. When None, PostgreSQL's default of 128 applies.
+            partition_interval (str): The period of the model's range partitions, 'day', 'month',
+                or 'year', which makes this field the partition key. See TimestampPartitioning.
+            precision (int): The number of fractional second digits stored, from 0 to 6. When None,
+                the database's default applies: whole seconds in MySQL and microseconds in
+                PostgreSQL. See get_current_timestamp_sql().
+            storage (str): Either 'datetime', storing the database's native timestamp data type, or
+                'epoch_ms', storing milliseconds since the Unix epoch in a BIGINT column.
+
+        """
+        self.auto_now_update = auto_now_update
+        self.index_type = index_type
+        self.pages_per_range = pages_per_range
+        self.partition_interval = partition_interval
+        self.precision = precision
+        self.storage = storage
+        super().__init__(*args, **kwargs)
+        if not (self.auto_now or self.auto_now_add or self.auto_now_update):
+            # Only automatic timestamps are ever pending. See TimestampDeferredAttribute.
+            self.descriptor_class = django.db.models.query_utils.DeferredAttribute
+
+    def _check_index_type(self):
+        """
+        Check the index_type and pages_per_range options.
+
+        Returns:
+            list: A list of additional Django check messages.
+
+        """
+        failed_checks = []
+        if self.index_type not in (None, 'brin', 'btree', 'hash'):
+            failed_checks.append(
+                django.core.checks.Error(
+                    'The option index_type must be None, \'brin\', \'btree\', or \'hash\'.',
+                    obj=self,
+                    id=__name__ + '.E220'
+                )
+            )
+        elif self.index_type is not None and (not self.db_index or self.unique):
+            failed_checks.append(
+                django.core.checks.Error(
+                    'The option index_type requires db_index=True and unique=False.',
+                    obj=self,
+                    id=__name__ + '.E230'
+                )
+            )
+
+        pages_per_range = self.pages_per_range
+        if pages_per_range is not None and (
+                self.index_type != 'brin' or isinstance(pages_per_range, bool)
+                or not isinstance(pages_per_range, int) or pages_per_range < 1):
+            failed_checks.append(
+                django.core.checks.Error(
+                    'The option pages_per_range must be a positive integer and requires '
+                    'index_type \'brin\'.',
+                    obj=self,
+                    id=__name__ + '.E240'
+                )
+            )
+
+        return failed_checks
+
+    def _check_mutually_exclusive_options(self):
+        """
+        Override the mutual exclusivity check in parent class.
+
+        django.db.models.fields.DateTimeCheckMixin is used to enforce mutual exclusivity between
+        auto_now, auto_now_add, and default keyword arguments. This method also adds a check for
+        auto_now_update and auto_now exclusivity.
+
+        auto_now, auto_now_add, and default all logically define a DEFAULT clause and are therefore
+        mutually exclusive. auto_now logically defines DEFAULT and ON UPDATE clauses and is
+        therefore mutually exclusive with auto_now_add (DEFAULT) and auto_now_update (ON UPDATE).
+
+        Valid permutations:
+            <empty set>
+            null
+            auto_now
+            auto_now + null
+            auto_now_add
+            auto_now_add + auto_now_update
+            auto_now_add + auto_now_update + null
+            auto_now_add + null
+            auto_now_update
+            auto_now_update + null
+            default
+            default + auto_now_update
+            default + auto_now_update + null
+            default + null
+
+        Returns:
+            list: A list of additional Django check messages.
+
+        See:
+            https://github.com/django/django/blob/master/django/db/models/fields/__init__.py
+            https://docs.djangoproject.com/en/dev/ref/models/fields/#django.db.models.DateField
+            https://docs.djangoproject.com/en/dev/topics/checks/
+
+        """
+        # Checks auto_now, auto_now_add, and default mutual exclusivity.
+        failed_checks = super()._check_mutually_exclusive_options()
+
+        if self.auto_now and self.auto_now_update:
+            failed_checks.append(
+                django.core.checks.Error(
+                    'The option auto_now is mutually exclusive with the option auto_now_update.',
+                    obj=self,
+                    id=__name__ + '.E160'
+                )
+            )
+
+        return failed_checks
+
+    def _check_partition_interval(self):
+        """
+        Check that partition_interval is a known period and that the partition key is not null.
+
+        Returns:
+            list: A list of additional Django check messages.
+
+        """
+        failed_checks = []
+        if self.partition_interval is None:
+            return failed_checks
+
+        if self.partition_interval not in TimestampPartitioning.INTERVALS:
+            failed_checks.append(
+                django.core.checks.Error(
+                    'The option partition_interval must be None, \'day\', \'month\', or '
+                    '\'year\'.',
+                    obj=self,
+                    id=__name__ + '.E270'
+                )
+            )
+        if self.null:
+            failed_checks.append(
+                django.core.checks.Error(
+                    'The option partition_interval cannot be used with null=True.',
+                    obj=self,
+                    id=__name__ + '.E260'
+                )
+            )
+
+        return failed_checks
+
+    def _check_precision(self):
+        """
+        Check that precision is either None or an integer from 0 to 6.
+
+        Returns:
+            list: A list of additional Django check messages.
+
+        """
+        failed_checks = []
+        precision = self.precision
+        if precision is not None and (
+                isinstance(precision, bool) or not isinstance(precision, int)
+                or not 0 <= precision <= 6):
+            failed_checks.append(
+                django.core.checks.Error(
+                    'The option precision must be None or an integer from 0 to 6.',
+                    obj=self,
+                    id=__name__ + '.E190'
+                )
+            )
+
+        return failed_checks
+
+    def _check_storage(self):
+        """
+        Check that storage is a known storage mode and that precision is not set with epoch_ms.
+
+        Returns:
+            list: A list of additional Django check messages.
+
+        """
+        failed_checks = []
+        if self.storage not in ('datetime', 'epoch_ms'):
+            failed_checks.append(
+                django.core.checks.Error(
+                    'The option storage must be either \'datetime\' or \'epoch_ms\'.',
+                    obj=self,
+                    id=__name__ + '.E200'
+                )
+            )
+        elif self.storage == 'epoch_ms' and self.precision is not None:
+            failed_checks.append(
+                django.core.checks.Error(
+                    'The option precision cannot be used with storage \'epoch_ms\', which always '
+                    'stores milliseconds.',
+                    obj=self,
+                    id=__name__ + '.E210'
+                )
+            )
+
+        return failed_checks
+
+    def _db_type_epoch_ms(self, connection):
+        """
+        Assemble the db_type string for storage='epoch_ms' in all supported backends.
+
+        Args:
+            connection: The Django connection object that was passed to the db_type() override.
+
+        Returns:
+            string: The db_type field definition string.
+
+        """
+        type_spec = ['BIGINT']
+        if self.auto_now or self.auto_now_add:
+            type_spec.append('DEFAULT {!s}'.format(self.get_current_timestamp_sql(connection)))
+        elif self.has_default():
+            default_value = self._get_db_type_default_value(self.get_default(), connection)
+            type_spec.append('DEFAULT {!s}'.format(default_value))
+
+        return ' '.join(type_spec)
+
+    def _db_type_mysql(self, connection):
+        """
+        Assemble the db_type string for the MySQL backend.
+
+        Note that in MySQL, if no DEFAULT or ON UPDATE clauses are specified for a TIMESTAMP field
+        in a CREATE TABLE statement, certain DEFAULT CURRENT_TIMESTAMP and ON UPDATE
+        CURRENT_TIMESTAMP values are automatically applied depending upon server configuration.
+        Enable the "explicit_defaults_for_timestamp" server system variable to disable this. See
+        README for more details.
+
+        At minimum, a DEFAULT clause must be specified in order to be compatible with MySQL server
+        system variable explicit_defaults_for_timestamp. MySQL strict mode, NO_ZERO_DATE,
+        NO_ZERO_IN_DATE, and explicit_defaults_for_timestamp all affect what values and defaults are
+        valid and it is the user's responsibility to effect the desired database behavior by setting
+        these configurations on the database server. See README and your database engine's
+        documentation for more details.
+
+        See:
+            https://dev.mysql.com/doc/refman/en/timestamp-initialization.html
+            https://dev.mysql.com/doc/refman/en/server-system-variables.html#sysvar_explicit_defaults_for_timestamp
+            https://jira.mariadb.org/browse/MDEV-10802
+
+        I'm concerned about outputting the DEFAULT clause here. The Django schema editor mechanism
+        already seems to provide a way to output DEFAULT although it doesn't appear to be used in
+        core and it appears narrow in scope. Default values are (sigh) usually applied in the
+        application layer in a model's __init__ method if no field value was explicitly defined in
+        model's initial kwargs.
+
+        See:
+            https://github.com/django/django/blob/master/django/db/models/base.py
+            https://github.com/django/django/blob/master/django/db/backends/base/schema.py
+                django.db.backends.base.BaseDatabaseSchemaEditor.column_sql
+                django.db.backends.base.BaseDatabaseSchemaEditor.create_model
+
+        Args:
+            connection: The Django connection object that was passed to the db_type() override.
+
+        Returns:
+            string: The db_type field definition string.
+
+        """
+        type_spec = [self._get_type_name('TIMESTAMP')]
+        current_timestamp_sql = self.get_current_timestamp_sql(connection)
+        ts_default_default = 'DEFAULT {!s}'.format(current_timestamp_sql)
+        ts_default_on_update = 'ON UPDATE {!s}'.format(current_timestamp_sql)
+        if self.auto_now:
+            # CURRENT_TIMESTAMP on create and on update.
+            type_spec.extend([ts_default_default, ts_default_on_update])
+        elif self.auto_now_add:
+            # CURRENT_TIMESTAMP on create only.
+            type_spec.append(ts_default_default)
+        elif self.has_default():
+            # Set specified default on creation, no ON UPDATE action.
+            default_value = self._get_db_type_default_value(self.get_default(), connection)
+            type_spec.append('DEFAULT {!s}'.format(default_value))
+
+        if self.auto_now_update:
+            # CURRENT_TIMESTAMP on update only.
+            # Mutual exclusivity between auto_now and auto_now_update has already been ensured by
+            # self._check_mutually_exclusive_options() by the time this method has been called.
+            type_spec.append(ts_default_on_update)
+
+        return ' '.join(type_spec)
+
+    def _db_type_postgresql(self, connection):
+        """
+        Assemble the db_type string for the PostgreSQL backend.
+
+        PostgreSQL has no equivalent to MySQL's ON UPDATE clause. Values on update are handled
+        manually in the ORM layer, see pre_save(), and optionally by a trigger, see
+        get_trigger_sql().
+
+        Args:
+            connection: The Django connection object that was passed to the db_type() override.
+
+        Returns:
+            string: The db_type field definition string.
+
+        """
+        type_spec = [self._get_type_name('TIMESTAMP'), 'WITHOUT TIME ZONE']
+        if self.auto_now or self.auto_now_add:
+            # CURRENT_TIMESTAMP on create
+            type_spec.append('DEFAULT {!s}'.format(self.get_current_timestamp_sql(connection)))
+        elif self.has_default():
+            # Set specified default on creation, no ON UPDATE action.
+            # Warning: PostgreSQL uses double quotes only for system identifiers.
+            default_value = self._get_db_type_default_value(self.get_default(), connection)
+            type_spec.append('DEFAULT {!s}'.format(default_value))
+
+        return ' '.join(type_spec)
+
+    def _db_type_sqlite(self, connection):
+        """
+        Assemble the db_type string for the sqlite3 backend.
+
+        SQLite has no equivalent to MySQL's ON UPDATE clause. Values on update are handled
+        manually in the ORM layer, see pre_save(), and optionally by a trigger, see
+        get_trigger_sql().
+
+        Args:
+            connection: The Django connection object that was passed to the db_type() override.
+
+        Returns:
+            string: The db_type field definition string.
+
+        """
+        type_spec = ['DATETIME']
+        if self.auto_now or self.auto_now_add:
+            type_spec.append('DEFAULT {!s}'.format(self.get_current_timestamp_sql(connection)))
+        elif self.has_default():
+            default_value = self._get_db_type_default_value(self.get_default(), connection)
+            type_spec.append('DEFAULT {!s}'.format(default_value))
+
+        return ' '.join(type_spec)
+
+    def _epoch_ms_db_value(self, value, expression, connection): # pylint: disable=unused-argument
+        """
+        Database converter of storage='epoch_ms' values. See get_db_converters().
+
+        """
+        if value is None:
+            return value
+        return self._from_epoch_ms(value)
+
+    def _from_epoch_ms(self, value):
+        """
+        Convert milliseconds since the Unix epoch to a datetime.
+
+        Returns:
+            datetime.datetime: An aware datetime in UTC if USE_TZ is enabled, otherwise a naive
+                datetime in the current time zone.
+
+        """
+        value = self._EPOCH + datetime.timedelta(milliseconds=int(value))
+        if not django.conf.settings.USE_TZ:
+            value = django.utils.timezone.make_naive(value)
+        return value
+
+    def _get_db_type_default_value(self, value, connection):
+        """
+        Override DefaultValueMixin._get_db_type_default_value() to generate integer literals.
+
+        With storage='epoch_ms', the default is emitted as an unquoted number of milliseconds.
+
+        """
+        if self.storage != 'epoch_ms' or value is None:
+            return super()._get_db_type_default_value(value, connection)
+        return '{:d}'.format(self.get_db_prep_value(value, connection))
+
+    def _get_type_name(self, type_name):
+        """
+        Append the precision, if any, to a data type name.
+
+        Args:
+            type_name (str): The data type name.
+
+        Returns:
+            str: The data type name with an optional precision argument.
+
+        """
+        if self.precision is None:
+            return type_name
+        return '{!s}({:d})'.format(type_name, self.precision)
+
+    def _get_trigger_name(self, schema_editor, db_table):
+        """
+        Generate the name of the trigger and trigger function for this field.
+
+        Names exceeding the database's identifier length limit are truncated and suffixed with a
+        hash, as with Django's own generated table names.
+
+        Args:
+            schema_editor: The Django schema editor object.
+            db_table (str): The name of the field's database table.
+
+        Returns:
+            str: The quoted name.
+
+        """
+        name = django.db.backends.utils.truncate_name(
+            '{!s}_{!s}_auto_now'.format(db_table, self.column),
+            schema_editor.connection.ops.max_name_length()
+        )
+        return schema_editor.quote_name(name)
+
+    def _trigger_sql_mysql(self, schema_editor, db_table):
+        """
+        Assemble the statement creating the trigger for the MySQL backend with storage='epoch_ms'.
+
+        The ON UPDATE clause is limited to TIMESTAMP and DATETIME columns. A BEFORE UPDATE trigger
+        sets the column to the current timestamp unless the UPDATE statement itself changed the
+        column's value. Unlike ON UPDATE, the trigger cannot detect whether any other column
+        changed, so it also applies to rows updated with unchanged values.
+
+        See:
+            https://dev.mysql.com/doc/refman/en/create-trigger.html
+
+        Args:
+            schema_editor: The Django schema editor object.
+            db_table (str): The name of the field's database table.
+
+        Returns:
+            list: A list of SQL statement strings.
+
+        """
+        trigger_sql = (
+            'CREATE TRIGGER {name!s} BEFORE UPDATE ON {table!s} FOR EACH ROW '
+            'SET NEW.{column!s} = IF(NEW.{column!s} <=> OLD.{column!s}, '
+            '{current_timestamp!s}, NEW.{column!s})'
+        ).format(
+            name=self._get_trigger_name(schema_editor, db_table),
+            table=schema_editor.quote_name(db_table),
+            column=schema_editor.quote_name(self.column),
+            current_timestamp=self.get_current_timestamp_sql(schema_editor.connection)
+        )
+
+        return [trigger_sql]
+
+    def _trigger_sql_postgresql(self, schema_editor, db_table):
+        """
+        Assemble the statements creating the trigger for the PostgreSQL backend.
+
+        A BEFORE UPDATE trigger sets the column to the current timestamp unless the UPDATE statement
+        itself changed the column's value, mimicking MySQL's ON UPDATE CURRENT_TIMESTAMP. The
+        trigger's WHEN condition skips rows in which no column changes at all so that no-op updates
+        do not produce a new timestamp and therefore do not produce a changed row.
+
+        See:
+            https://www.postgresql.org/docs/current/static/sql-createtrigger.html
+            https://www.postgresql.org/docs/current/static/plpgsql-trigger.html
+
+        Args:
+            schema_editor: The Django schema editor object.
+            db_table (str): The name of the field's database table.
+
+        Returns:
+            list: A list of SQL statement strings.
+
+        """
+        name = self._get_trigger_name(schema_editor, db_table)
+        column = schema_editor.quote_name(self.column)
+        function_sql = (
+            'CREATE OR REPLACE FUNCTION {name!s}() RETURNS trigger AS $$\n'
+            'BEGIN\n'
+            '    IF NEW.{column!s} IS NOT DISTINCT FROM OLD.{column!s} THEN\n'
+            '        NEW.{column!s} := {current_timestamp!s};\n'
+            '    END IF;\n'
+            '    RETURN NEW;\n'
+            'END;\n'
+            '$$ LANGUAGE plpgsql'
+        ).format(
+            name=name,
+            column=column,
+            current_timestamp=self.get_current_timestamp_sql(schema_editor.connection)
+        )
+        trigger_sql = (
+            'CREATE TRIGGER {name!s} BEFORE UPDATE ON {table!s} FOR EACH ROW '
+            'WHEN (OLD.* IS DISTINCT FROM NEW.*) EXECUTE PROCEDURE {name!s}()'
+        ).format(name=name, table=schema_editor.quote_name(db_table))
+
+        return [function_sql, trigger_sql]
+
+    def _trigger_sql_sqlite(self, schema_editor, db_table, fields):
+        """
+        Assemble the statements creating the trigger for the sqlite3 backend.
+
+        SQLite triggers cannot modify the NEW row. Instead, an AFTER UPDATE trigger issues a second
+        UPDATE of the same row by its rowid. The trigger's WHEN condition limits it to rows in which
+        the statement did not assign the column itself and in which at least one other column
+        changed, skipping no-op updates. Since the second UPDATE changes the column, it does not
+        trigger itself again even if recursive triggers are enabled.
+
+        See:
+            https://www.sqlite.org/lang_createtrigger.html
+            https://www.sqlite.org/lang_expr.html#isisnot
+
+        Args:
+            schema_editor: The Django schema editor object.
+            db_table (str): The name of the field's database table.
+            fields (list): All concrete fields of the field's database table.
+
+        Returns:
+            list: A list of SQL statement strings.
+
+        """
+        column = schema_editor.quote_name(self.column)
+        other_columns = [
+            schema_editor.quote_name(field.column) for field in fields
+            if field.column is not None and field.column != self.column
+        ]
+        if not other_columns:
+            return []
+
+        changed_conditions = ' OR '.join(
+            'NEW.{0!s} IS NOT OLD.{0!s}'.format(other_column) for other_column in other_columns
+        )
+        trigger_sql = (
+            'CREATE TRIGGER {name!s} AFTER UPDATE ON {table!s} FOR EACH ROW\n'
+            'WHEN NEW.{column!s} IS OLD.{column!s} AND ({changed_conditions!s})\n'
+            'BEGIN\n'
+            '    UPDATE {table!s} SET {column!s} = {current_timestamp!s} WHERE rowid = NEW.rowid;\n'
+            'END'
+        ).format(
+            name=self._get_trigger_name(schema_editor, db_table),
+            table=schema_editor.quote_name(db_table),
+            column=column,
+            current_timestamp=self.get_current_timestamp_sql(schema_editor.connection),
+            changed_conditions=changed_conditions
+        )
+
+        return [trigger_sql]
+
+    def check(self, **kwargs):
+        """
+        Override check() to add the index type, partition interval, precision, and storage checks.
+
+        See:
+            https://docs.djangoproject.com/en/dev/topics/checks/
+
+        """
+        failed_checks = super().check(**kwargs)
+        failed_checks.extend(self._check_index_type())
+        failed_checks.extend(self._check_partition_interval())
+        failed_checks.extend(self._check_precision())
+        failed_checks.extend(self._check_storage())
+        return failed_checks
+
+    def db_type(self, connection):
+        """
+        Override the db_type method.
+
+        Type spec additions for self.null are not needed. Django magically appends NULL or NOT NULL
+        to the end of the generated SQL.
+
+        See:
+            https://github.com/django/django/blob/master/django/db/backends/base/schema.py
+                BaseDatabaseSchemaEditor.column_sql
+
+        Note that returning None from this method will cause Django to simply skip this field in its
+        generated CREATE TABLE statements. This allows one to define the field manually outside of
+        the ORM, a feature that may prove useful in the future.
+
+        See:
+            https://github.com/django/django/blob/master/django/db/models/fields/__init__.py
+            https://docs.djangoproject.com/en/dev/howto/custom-model-fields/#useful-methods
+
+        """
+        vendor = connection.vendor
+        if self.storage == 'epoch_ms' and vendor in ('mysql', 'postgresql', 'sqlite'):
+            db_type = self._db_type_epoch_ms(connection)
+        elif vendor == 'mysql':
+            db_type = self._db_type_mysql(connection)
+        elif vendor == 'postgresql':
+            db_type = self._db_type_postgresql(connection)
+        elif vendor == 'sqlite':
+            db_type = self._db_type_sqlite(connection)
+        else:
+            db_type = super().db_type(connection)
+
+        return db_type
+
+    def deconstruct(self):
+        """
+        Override the deconstruct method to ensure auto_now_update value is preserved.
+
+        See:
+            https://docs.djangoproject.com/en/dev/ref/models/fields/#django.db.models.Field.deconstruct
+
+        """
+        name, path, args, kwargs = super().deconstruct()
+        if self.auto_now_update:
+            kwargs['auto_now_update'] = True
+        if self.index_type is not None:
+            kwargs['index_type'] = self.index_type
+        if self.pages_per_range is not None:
+            kwargs['pages_per_range'] = self.pages_per_range
+        if self.partition_interval is not None:
+            kwargs['partition_interval'] = self.partition_interval
+        if self.precision is not None:
+            kwargs['precision'] = self.precision
+        if self.storage != 'datetime':
+            kwargs['storage'] = self.storage
+        return (name, path, args, kwargs)
+
+    @property
+    def db_returning(self):
+        """
+        Declare auto_now and auto_now_add fields as database-generated on insert.
+
+        Django includes such fields in the RETURNING clause of INSERT statements on databases that
+        support it and assigns the returned values to the model instances, replacing the Now()
+        expressions set by pre_save(). This applies to both Model.save() and
+        QuerySet.bulk_create(). On other databases, Django only retrieves an AutoField primary key
+        and the Now() expressions remain. See TimestampModelMixin for UPDATE statements.
+
+        Unlike Django's own implementation, this property does not consult the default database
+        connection. Fields are only returned from databases whose features allow it.
+
+        See:
+            https://github.com/django/django/blob/master/django/db/models/sql/compiler.py
+                SQLInsertCompiler.execute_sql
+
+        """
+        return self.auto_now or self.auto_now_add
+
+    def get_current_timestamp_expression(self):
+        """
+        Create the Django expression of the current timestamp in the field's storage format.
+
+        Returns:
+            django.db.models.functions.Now: A Now() expression, a PrecisionNow() expression at the
+                field's explicit precision, or an EpochMillisecondsNow() expression.
+
+        """
+        if self.storage == 'epoch_ms':
+            return EpochMillisecondsNow()
+        if self.precision is None:
+            return django.db.models.functions.Now()
+        return PrecisionNow(self.precision)
+
+    def get_current_timestamp_sql(self, connection):
+        """
+        Generate the SQL expression of the current timestamp at the field's precision.
+
+        The SQL is that of the field's get_current_timestamp_expression(), so that DDL defaults,
+        triggers, and ORM writes store the same precision. The SQLite expression of a fractional
+        precision is parenthesized as required in DEFAULT clauses.
+
+        With storage='epoch_ms', the expression of EpochMillisecondsNow is returned, parenthesized
+        as required in DEFAULT clauses of MySQL and SQLite.
+
+        Args:
+            connection: The Django connection object.
+
+        Returns:
+            str: The SQL expression.
+
+        """
+        if self.storage == 'epoch_ms':
+            return '({!s})'.format(EpochMillisecondsNow.get_sql(connection))
+
+        current_timestamp_sql = PrecisionNow(self.precision).get_sql(connection)
+        if self.precision and connection.vendor == 'sqlite':
+            current_timestamp_sql = '({!s})'.format(current_timestamp_sql)
+        return current_timestamp_sql
+
+    def get_db_converters(self, connection):
+        """
+        Override get_db_converters() to convert storage='epoch_ms' values to datetimes.
+
+        The converter is only added in epoch_ms mode so that other fields do not pay a per-row
+        function call.
+
+        See:
+            https://github.com/django/django/blob/master/django/db/models/sql/compiler.py
+                SQLCompiler.get_converters()
+
+        """
+        converters = super().get_db_converters(connection)
+        if self.storage == 'epoch_ms':
+            converters.append(self._epoch_ms_db_value)
+        return converters
+
+    def get_db_prep_value(self, value, connection, prepared=False):
+        """
+        Override get_db_prep_value() to convert datetimes to milliseconds with storage='epoch_ms'.
+
+        Naive datetimes are interpreted in the current time zone. Integers are passed through as
+        milliseconds. Lookups are converted as well, so filters accept datetimes.
+
+        See:
+            https://docs.djangoproject.com/en/dev/ref/models/fields/#django.db.models.Field.get_db_prep_value
+
+        """
+        if self.storage != 'epoch_ms':
+            return super().get_db_prep_value(value, connection, prepared)
+        if value is None or (isinstance(value, int) and not isinstance(value, bool)):
+            return value
+
+        if not prepared:
+            value = self.get_prep_value(value)
+        if django.utils.timezone.is_naive(value):
+            value = django.utils.timezone.make_aware(value)
+        return (value - self._EPOCH) // datetime.timedelta(milliseconds=1)
+
+    def get_drop_trigger_sql(self, schema_editor, db_table):
+        """
+        Generate the statements dropping the trigger created by get_trigger_sql(), if any.
+
+        The statements do not fail if the trigger does not exist.
+
+        Args:
+            schema_editor: The Django schema editor object.
+            db_table (str): The name of the field's database table.
+
+        Returns:
+            list: A list of SQL statement strings.
+
+        """
+        vendor = schema_editor.connection.vendor
+        name = self._get_trigger_name(schema_editor, db_table)
+        if vendor == 'postgresql':
+            drop_sql = [
+                'DROP TRIGGER IF EXISTS {!s} ON {!s}'.format(
+                    name,
+                    schema_editor.quote_name(db_table)
+                ),
+                'DROP FUNCTION IF EXISTS {!s}()'.format(name)
+            ]
+        elif vendor == 'sqlite' or (vendor == 'mysql' and self.storage == 'epoch_ms'):
+            drop_sql = ['DROP TRIGGER IF EXISTS {!s}'.format(name)]
+        else:
+            drop_sql = []
+
+        return drop_sql
+
+    def get_trigger_sql(self, schema_editor, db_table, fields):
+        """
+        Generate the statements creating a trigger that sets the current timestamp on update.
+
+        Triggers are only generated when auto_now or auto_now_update is active and only for
+        databases lacking MySQL's ON UPDATE clause, or for MySQL with storage='epoch_ms'. Unlike
+        pre_save(), a trigger also applies to QuerySet.update() and to raw SQL updates.
+
+        The statements are executed by TimestampTriggerSchemaEditorMixin.
+
+        Args:
+            schema_editor: The Django schema editor object.
+            db_table (str): The name of the field's database table.
+            fields (list): All concrete fields of the field's database table.
+
+        Returns:
+            list: A list of SQL statement strings.
+
+        """
+        vendor = schema_editor.connection.vendor
+        if not (self.auto_now or self.auto_now_update):
+            trigger_sql = []
+        elif vendor == 'postgresql':
+            trigger_sql = self._trigger_sql_postgresql(schema_editor, db_table)
+        elif vendor == 'sqlite':
+            trigger_sql = self._trigger_sql_sqlite(schema_editor, db_table, fields)
+        elif vendor == 'mysql' and self.storage == 'epoch_ms':
+            trigger_sql = self._trigger_sql_mysql(schema_editor, db_table)
+        else:
+            trigger_sql = []
+
+        return trigger_sql
+
+    def get_index_params(self, connection):
+        """
+        Generate the storage parameters of the db_index index. See TimestampIndexSchemaEditorMixin.
+
+        Args:
+            connection: The Django connection object.
+
+        Returns:
+            list: A list of "name = value" SQL strings for the index's WITH clause.
+
+        """
+        if self.get_index_type(connection) == 'brin' and self.pages_per_range is not None:
+            return ['pages_per_range = {:d}'.format(self.pages_per_range)]
+        return []
+
+    def get_index_type(self, connection):
+        """
+        Return the index method of the db_index index. See TimestampIndexSchemaEditorMixin.
+
+        A BRIN index stores only the minimum and maximum values of each range of table pages. For
+        append-only columns whose values increase with their physical position in the table, such
+        as auto_now_add timestamps, it serves range scans at a small fraction of the size of a btree
+        index. A hash index only serves equality comparisons.
+
+        MySQL's InnoDB and SQLite only support btree indexes, which are therefore used instead.
+
+        See:
+            https://www.postgresql.org/docs/current/static/brin-intro.html
+            https://www.postgresql.org/docs/current/static/indexes-types.html
+
+        Args:
+            connection: The Django connection object.
+
+        Returns:
+            str: The index method, or None for the database's default btree index.
+
+        """
+        if connection.vendor == 'postgresql' and self.index_type in ('brin', 'hash'):
+            return self.index_type
+        return None
+
+    def get_internal_type(self):
+        """
+        Override get_internal_type() so that backends treat storage='epoch_ms' values as integers.
+
+        The database backends' own DateTimeField converters would otherwise be applied to the
+        integer values.
+
+        """
+        if self.storage == 'epoch_ms':
+            return 'BigIntegerField'
+        return super().get_internal_type()
+
+    def has_ddl_default(self):
+        """
+        Override DefaultValueMixin.has_ddl_default() to account for DEFAULT CURRENT_TIMESTAMP.
+
+        """
+        return self.auto_now or self.auto_now_add or super().has_ddl_default()
+
+    def is_db_default(self, model_instance, connection):
+        """
+        Override DefaultValueMixin.is_db_default() to account for DEFAULT CURRENT_TIMESTAMP.
+
+        With auto_now or auto_now_add, the value is always overwritten with the current timestamp on
+        insert. See pre_save(). The column's DEFAULT CURRENT_TIMESTAMP produces the same.
+
+        """
+        if connection.vendor in ('mysql', 'postgresql', 'sqlite') and \
+                (self.auto_now or self.auto_now_add):
+            return True
+        return super().is_db_default(model_instance, connection)
+
+    def pre_save(self, model_instance, add):
+        """
+        Set current timestamp if auto_now_update option is active.
+
+        If an auto_now, auto_now_add, or auto_now_update condition is active, override the field
+        value with current timestamp. This may not reflect underlying DB behavior in which explicit
+        values override DEFAULT and ON UPDATE, but it remains consistent with parent DateTimeField
+        behavior.
+
+        The model's attribute value will be set to a Django Func() expression when an auto_now
+        conditions are active. Given the common use cases of the auto_now options, I deem this
+        acceptable as historically, one would expect automatic timestamps to be generated in the
+        database instead of the application.
+
+        The only other options are to set the model attribute to a Python datetime value and hope
+        that it is not too different from the value that the database generated or to issue a second
+        query after successful save to retrieve the generated current timestamp. Where the database
+        supports RETURNING, the expression is replaced with the generated timestamp by the same
+        statement instead. See db_returning and TimestampModelMixin.
+
+        For future reference, note that in the parent DateTimeField, date parse validation is
+        triggered by SQL compiler through get_db_prep_save(), get_db_prep_value(), get_prep_value(),
+        which finally calls to_python(), which in turn raises ValidationError if date parse fails.
+
+        The SQL compiler (django.db.models.sql.compiler.SQLInsertCompiler) calls this method on
+        fields to get the value to be inserted in the SQL insert VALUES list.
+
+        See:
+            https://github.com/django/django/blob/master/django/db/models/sql/compiler.py
+            https://docs.djangoproject.com/en/dev/ref/models/fields/#django.db.models.Field.pre_save
+
+        """
+        # Based on my review of Django source, I do not believe one can omit a value altogether for
+        # a field in an INSERT or UPDATE SQL statement. The ModelBase.save() method seems to
+        # indiscriminately sweep all fields into the insert process. Therefore, use explicit value.
+        if self.auto_now or (self.auto_now_update and not add) or (self.auto_now_add and add):
+            # Reuse a current timestamp expression already held by the attribute, such as one shared
+            # by all instances of a TimestampQuerySet.bulk_create() batch. A CompiledExpression
+            # compares its vendor with that of the database saved to. See CompiledExpression.
+            # The instance's __dict__ is read directly so as not to resolve a pending expression.
+            # See TimestampDeferredAttribute.
+            value = model_instance.__dict__.get(self.attname)
+            if not isinstance(value, (django.db.models.functions.Now, CompiledExpression)):
+                value = self.get_current_timestamp_expression()
+                setattr(model_instance, self.attname, value)
+            descriptor = getattr(model_instance.__class__, self.attname)
+            if isinstance(descriptor, TimestampDeferredAttribute):
+                descriptor.register(model_instance)
+        else:
+            # This super() call is correct. Leave it alone.
+            # Skips DateTimeField and DateField pre_save() overrides while maintaining binding to
+            # current class instance.
+            # See: https://docs.python.org/3/library/functions.html#super
+            value = super(django.db.models.DateField, self).pre_save(model_instance, add) # pylint: disable=bad-super-call
+
+        return value
+
+    def to_python(self, value):
+        """
+        Override to_python() to accept milliseconds since the Unix epoch with storage='epoch_ms'.
+
+        """
+        if self.storage == 'epoch_ms' and isinstance(value, int) and not isinstance(value, bool):
+            return self._from_epoch_ms(value)
+        return super().to_python(value)
+
+
+class TimestampPeriodTransformMixin(metaclass=abc.ABCMeta):
+    """
+    A transform class mixin that maps a date or year of a TimestampField to a range of timestamps.
+
+    Django compares the transformed value in SQL, wrapping the column in a function such as
+    CAST(column AS DATE) or EXTRACT(YEAR FROM column). No btree index on the column can serve such
+    a comparison, so filters such as "timestamp__date=value" scan the whole table. Each date or year
+    instead corresponds to a half-open range of timestamps, "start <= column < end". The lookups of
+    TimestampPeriodLookupMixin compare the column itself to these bounds.
+
+    Month, day, and hour transforms extract a periodic part of the timestamp that no single range
+    can express and are therefore left to Django.
+
+    """
+
+    @abc.abstractmethod
+    def _get_next_value(self, value):
+        """
+        Return the transformed value following the given one, e.g. the next date.
+
+        Args:
+            value: The transformed value, e.g. a date.
+
+        Returns:
+            The next transformed value.
+
+        """
+
+    @abc.abstractmethod
+    def _get_period_start(self, value):
+        """
+        Return the naive datetime at which the period of the given transformed value starts.
+
+        Args:
+            value: The transformed value, e.g. a date.
+
+        Returns:
+            datetime.datetime: The start of the period.
+
+        """
+
+    def get_period_bounds(self, value):
+        """
+        Return the bounds of the range of timestamps whose transformed value equals the given value.
+
+        With USE_TZ enabled, the bounds are aware datetimes in the transform's time zone, which
+        defaults to the current time zone as in the transform's SQL.
+
+        Args:
+            value: The transformed value, e.g. a date.
+
+        Returns:
+            tuple: The inclusive start and exclusive end datetimes. The end is None if it exceeds
+                the range of datetime.
+
+        """
+        start = self._get_period_start(value)
+        try:
+            end = self._get_period_start(self._get_next_value(value))
+        except (OverflowError, ValueError):
+            end = None
+
+        if django.conf.settings.USE_TZ:
+            tzinfo = getattr(self, 'tzinfo', None) or django.utils.timezone.get_current_timezone()
+            start = django.utils.timezone.make_aware(start, tzinfo)
+            if end is not None:
+                end = django.utils.timezone.make_aware(end, tzinfo)
+        return start, end
+
+
+@TimestampField.register_lookup
+class TimestampDate(TimestampPeriodTransformMixin, django.db.models.functions.TruncDate):
+    """
+    The "date" transform for TimestampField. See TimestampPeriodTransformMixin.
+
+    """
+
+    def _get_next_value(self, value):
+        """
+        See TimestampPeriodTransformMixin._get_next_value().
+
+        """
+        return value + datetime.timedelta(days=1)
+
+    def _get_period_start(self, value):
+        """
+        See TimestampPeriodTransformMixin._get_period_start().
+
+        """
+        return datetime.datetime.combine(value, datetime.time.min)
+
+
+@TimestampField.register_lookup
+class TimestampYear(TimestampPeriodTransformMixin, django.db.models.functions.ExtractYear):
+    """
+    The "year" transform for TimestampField. See TimestampPeriodTransformMixin.
+
+    Django's own year lookups already compare the column to a range but format the bounds as
+    datetime strings, which are not valid with storage='epoch_ms'.
+
+    """
+
+    def _get_next_value(self, value):
+        """
+        See TimestampPeriodTransformMixin._get_next_value().
+
+        """
+        return value + 1
+
+    def _get_period_start(self, value):
+        """
+        See TimestampPeriodTransformMixin._get_period_start().
+
+        """
+        return datetime.datetime(value, 1, 1)
+
+
+class TimestampPeriodLookupMixin(metaclass=abc.ABCMeta):
+    """
+    A lookup class mixin that compares a TimestampField column to the bounds of dates or years.
+
+    Registered on the transforms of TimestampPeriodTransformMixin. For example, with the "date"
+    transform:
+
+        ==================== =========================================
+        filter               condition
+        ==================== =========================================
+        date=d               start(d) <= column AND column < end(d)
+        date__gt=d           end(d) <= column
+        date__gte=d          start(d) <= column
+        date__lt=d           column < start(d)
+        date__lte=d          column < end(d)
+        date__range=(d, e)   start(d) <= column AND column < end(e)
+        date__in=[d, e]      one range per value, combined with OR
+        ==================== =========================================
+
+    The bounds are converted by the field's get_db_prep_value() and therefore match the column's
+    storage. Lookup values that are expressions or subqueries are left to the parent lookup.
+
+    See:
+        https://docs.djangoproject.com/en/dev/howto/custom-lookups/
+        https://use-the-index-luke.com/sql/where-clause/obfuscation/dates
+
+    """
+
+    @abc.abstractmethod
+    def _get_ranges(self):
+        """
+        Return the ranges of timestamps matched by the lookup.
+
+        Returns:
+            list: A list of (start, end) tuples in which None denotes an unbounded end.
+
+        """
+
+    def _rhs_is_direct(self):
+        """
+        Determine whether the lookup value or values are all plain Python values.
+
+        Returns:
+            boolean: True if the comparison can be rewritten.
+
+        """
+        if isinstance(self.rhs, (list, tuple, set, frozenset)):
+            values = self.rhs
+        else:
+            values = [self.rhs]
+        return not any(hasattr(value, 'resolve_expression') for value in values)
+
+    def as_sql(self, compiler, connection):
+        """
+        Override as_sql() to compare the untransformed column to the bounds of the ranges.
+
+        """
+        if not self._rhs_is_direct():
+            return super().as_sql(compiler, connection)
+
+        column = self.lhs.lhs
+        column_sql, column_params = compiler.compile(column)
+        conditions = []
+        params = []
+        for start, end in self._get_ranges():
+            range_conditions = []
+            for operator, bound in (('>=', start), ('<', end)):
+                if bound is not None:
+                    range_conditions.append('{!s} {!s} %s'.format(column_sql, operator))
+                    params.extend(column_params)
+                    params.append(column.output_field.get_db_prep_value(bound, connection))
+            if not range_conditions:
+                range_conditions.append('{!s} IS NOT NULL'.format(column_sql))
+                params.extend(column_params)
+            conditions.append(' AND '.join(range_conditions))
+
+        if not conditions:
+            raise django.core.exceptions.EmptyResultSet
+        return '({!s})'.format(' OR '.join(conditions)), params
+
+
+@TimestampDate.register_lookup
+@TimestampYear.register_lookup
+class TimestampPeriodExact(TimestampPeriodLookupMixin, django.db.models.lookups.Exact):
+    """
+    The "exact" lookup of TimestampField dates and years. See TimestampPeriodLookupMixin.
+
+    """
+
+    def _get_ranges(self):
+        """
+        See TimestampPeriodLookupMixin._get_ranges().
+
+        """
+        return [self.lhs.get_period_bounds(self.rhs)]
+
+
+@TimestampDate.register_lookup
+@TimestampYear.register_lookup
+class TimestampPeriodGreaterThan(TimestampPeriodLookupMixin, django.db.models.lookups.GreaterThan):
+    """
+    The "gt" lookup of TimestampField dates and years. See TimestampPeriodLookupMixin.
+
+    """
+
+    def _get_ranges(self):
+        """
+        See TimestampPeriodLookupMixin._get_ranges().
+
+        """
+        end = self.lhs.get_period_bounds(self.rhs)[1]
+        return [] if end is None else [(end, None)]
+
+
+@TimestampDate.register_lookup
+@TimestampYear.register_lookup
+class TimestampPeriodGreaterThanOrEqual(
+        TimestampPeriodLookupMixin, django.db.models.lookups.GreaterThanOrEqual):
+    """
+    The "gte" lookup of TimestampField dates and years. See TimestampPeriodLookupMixin.
+
+    """
+
+    def _get_ranges(self):
+        """
+        See TimestampPeriodLookupMixin._get_ranges().
+
+        """
+        return [(self.lhs.get_period_bounds(self.rhs)[0], None)]
+
+
+@TimestampDate.register_lookup
+@TimestampYear.register_lookup
+class TimestampPeriodLessThan(TimestampPeriodLookupMixin, django.db.models.lookups.LessThan):
+    """
+    The "lt" lookup of TimestampField dates and years. See TimestampPeriodLookupMixin.
+
+    """
+
+    def _get_ranges(self):
+        """
+        See TimestampPeriodLookupMixin._get_ranges().
+
+        """
+        return [(None, self.lhs.get_period_bounds(self.rhs)[0])]
+
+
+@TimestampDate.register_lookup
+@TimestampYear.register_lookup
+class TimestampPeriodLessThanOrEqual(
+        TimestampPeriodLookupMixin, django.db.models.lookups.LessThanOrEqual):
+    """
+    The "lte" lookup of TimestampField dates and years. See TimestampPeriodLookupMixin.
+
+    """
+
+    def _get_ranges(self):
+        """
+        See TimestampPeriodLookupMixin._get_ranges().
+
+        """
+        return [(None, self.lhs.get_period_bounds(self.rhs)[1])]
+
+
+@TimestampDate.register_lookup
+@TimestampYear.register_lookup
+class TimestampPeriodIn(TimestampPeriodLookupMixin, django.db.models.lookups.In):
+    """
+    The "in" lookup of TimestampField dates and years. See TimestampPeriodLookupMixin.
+
+    """
+
+    def _get_ranges(self):
+        """
+        See TimestampPeriodLookupMixin._get_ranges().
+
+        """
+        return [
+            self.lhs.get_period_bounds(value) for value in sorted(set(self.rhs))
+            if value is not None
+        ]
+
+
+@TimestampDate.register_lookup
+@TimestampYear.register_lookup
+class TimestampPeriodRange(TimestampPeriodLookupMixin, django.db.models.lookups.Range):
+    """
+    The "range" lookup of TimestampField dates and years. See TimestampPeriodLookupMixin.
+
+    """
+
+    def _get_ranges(self):
+        """
+        See TimestampPeriodLookupMixin._get_ranges().
+
+        """
+        return [(
+            self.lhs.get_period_bounds(self.rhs[0])[0],
+            self.lhs.get_period_bounds(self.rhs[1])[1]
+        )]
+
+
+class DefaultValueSchemaEditorMixin:
+    """
+    A schema editor class mixin that preserves the DEFAULT clauses emitted by db_type().
+
+    When a field with a default is added to an existing table, Django's schema editor appends its
+    own DEFAULT clause holding the field's default value as of the migration, in order to fill the
+    existing rows, and then drops the column's default. For the field classes in this module, the
+    result is a second DEFAULT clause, which PostgreSQL rejects, and a column without any default,
+    on which the inserts of OmitDBDefaultsQuerySetMixin store NULL. The auto_now and auto_now_add
+    options of TimestampField are especially affected since their default is the timestamp at which
+    the migration was run rather than CURRENT_TIMESTAMP.
+
+    This mixin skips Django's default handling for each field whose
+    DefaultValueMixin.has_ddl_default() is true, so that the DEFAULT clause of db_type() both fills
+    the existing rows and remains in place. To use it, define a database backend whose schema editor
+    class inherits from this mixin and from the schema editor of the original backend. See README.
+
+    See:
+        https://github.com/django/django/blob/master/django/db/backends/base/schema.py
+            BaseDatabaseSchemaEditor.add_field()
+
+    """
+
+    def skip_default(self, field):
+        """
+        Override skip_default() to omit Django's DEFAULT clause where db_type() emits one.
+
+        """
+        if isinstance(field, DefaultValueMixin) and field.has_ddl_default():
+            return True
+        return super().skip_default(field)
+
+    def skip_default_on_alter(self, field):
+        """
+        Override skip_default_on_alter() to keep the DEFAULT clause emitted by db_type().
+
+        """
+        if isinstance(field, DefaultValueMixin) and field.has_ddl_default():
+            return True
+        return super().skip_default_on_alter(field)
+
+
+class TimestampTriggerSchemaEditorMixin:
+    """
+    A schema editor class mixin that maintains the triggers generated by TimestampField.
+
+    Django offers no hook with which a field could emit statements other than its column definition
+    during migrations. This mixin creates and drops the statements of
+    TimestampField.get_trigger_sql() whenever a table or field is created, altered, renamed, or
+    dropped. To use it, define a database backend whose schema editor class inherits from this
+    mixin and from the schema editor of the original backend. See README.
+
+    Triggers are always dropped before being created so that each operation is idempotent. This
+    also accommodates schema editors that rebuild tables by calling create_model(),
+    delete_model(), and alter_db_table() internally, such as that of the sqlite3 backend.
+
+    See:
+        https://github.com/django/django/blob/master/django/db/backends/base/schema.py
+        https://docs.djangoproject.com/en/dev/ref/databases/#subclassing-the-built-in-database-backends
+
+    """
+
+    def _create_triggers(self, db_table, fields):
+        """
+        Create the triggers of all TimestampFields among the given fields.
+
+        Args:
+            db_table (str): The name of the database table.
+            fields (list): All concrete fields of the database table.
+
+        """
+        for field in fields:
+            if isinstance(field, TimestampField):
+                for sql in field.get_drop_trigger_sql(self, db_table):
+                    self.execute(sql)
+                for sql in field.get_trigger_sql(self, db_table, fields):
+                    self.execute(sql)
+
+    def _drop_triggers(self, db_table, fields):
+        """
+        Drop the triggers of all TimestampFields among the given fields.
+
+        Args:
+            db_table (str): The name of the database table.
+            fields (list): The fields of the database table.
+
+        """
+        for field in fields:
+            if isinstance(field, TimestampField):
+                for sql in field.get_drop_trigger_sql(self, db_table):
+                    self.execute(sql)
+
+    def add_field(self, model, field):
+        """
+        Override add_field() to create triggers after the column is added.
+
+        """
+        super().add_field(model, field)
+        self._create_triggers(
+            model._meta.db_table,
+            model._meta.local_concrete_fields + (field,)
+        )
+
+    def alter_db_table(self, model, old_db_table, new_db_table):
+        """
+        Override alter_db_table() to recreate triggers under names derived from the new table name.
+
+        """
+        fields = model._meta.local_concrete_fields
+        self._drop_triggers(old_db_table, fields)
+        super().alter_db_table(model, old_db_table, new_db_table)
+        self._create_triggers(new_db_table, fields)
+
+    def alter_field(self, model, old_field, new_field, strict=False):
+        """
+        Override alter_field() to replace the triggers of the old field with those of the new one.
+
+        """
+        self._drop_triggers(model._meta.db_table, [old_field])
+        super().alter_field(model, old_field, new_field, strict=strict)
+        self._create_triggers(
+            model._meta.db_table,
+            tuple(
+                new_field if field.name == old_field.name else field
+                for field in model._meta.local_concrete_fields
+            )
+        )
+
+    def create_model(self, model):
+        """
+        Override create_model() to create triggers after the table is created.
+
+        """
+        super().create_model(model)
+        self._create_triggers(model._meta.db_table, model._meta.local_concrete_fields)
+
+    def delete_model(self, model, *args, **kwargs):
+        """
+        Override delete_model() to drop triggers, and any trigger functions, before the table.
+
+        """
+        self._drop_triggers(model._meta.db_table, model._meta.local_concrete_fields)
+        super().delete_model(model, *args, **kwargs)
+
+    def remove_field(self, model, field):
+        """
+        Override remove_field() to drop the field's triggers before the column is dropped.
+
+        """
+        self._drop_triggers(model._meta.db_table, [field])
+        super().remove_field(model, field)
+        self._create_triggers(
+            model._meta.db_table,
+            tuple(
+                remaining_field for remaining_field in model._meta.local_concrete_fields
+                if remaining_field.name != field.name
+            )
+        )
+
+
+class TimestampIndexSchemaEditorMixin:
+    """
+    A schema editor class mixin that creates the db_index indexes of TimestampFields by index_type.
+
+    Django creates the index of a db_index field without an index method, producing a btree index.
+    This mixin adds the method and storage parameters of TimestampField.get_index_type() and
+    TimestampField.get_index_params() to the CREATE INDEX statements of such fields. Indexes
+    declared in Meta.indexes are left untouched. Like TimestampTriggerSchemaEditorMixin, it must be
+    added to a custom database backend. See README.
+
+    See:
+        https://www.postgresql.org/docs/current/static/sql-createindex.html
+        https://github.com/django/django/blob/master/django/db/backends/base/schema.py
+        https://github.com/django/django/blob/master/django/contrib/postgres/indexes.py
+
+    """
+
+    def _create_index_sql(self, model, *args, **kwargs):
+        """
+        Override _create_index_sql() to add the index method of a single TimestampField.
+
+        Field indexes are distinguished from Meta.indexes, which Django always names, by the absence
+        of a name.
+
+        """
+        fields = kwargs['fields'] if 'fields' in kwargs else (args[0] if args else None)
+        index_type = None
+        if fields and len(fields) == 1 and isinstance(fields[0], TimestampField) \
+                and kwargs.get('name') is None and not kwargs.get('using'):
+            index_type = fields[0].get_index_type(self.connection)
+        if index_type is not None:
+            kwargs['using'] = ' USING {!s}'.format(index_type)
+
+        statement = super()._create_index_sql(model, *args, **kwargs)
+        if index_type is not None:
+            index_params = fields[0].get_index_params(self.connection)
+            if index_params:
+                statement.parts['extra'] = ' WITH ({!s}){!s}'.format(
+                    ', '.join(index_params),
+                    statement.parts['extra']
+                )
+        return statement
+
+    def _get_index_definition(self, field):
+        """
+        Describe the db_index index of a field in terms of this mixin's options.
+
+        Args:
+            field: The Django field instance.
+
+        Returns:
+            tuple: The index method and storage parameters, or None if the field has no db_index
+                index.
+
+        """
+        if not field.db_index or field.unique:
+            return None
+        if isinstance(field, TimestampField):
+            return (
+                field.get_index_type(self.connection),
+                tuple(field.get_index_params(self.connection))
+            )
+        return (None, ())
+
+    def alter_field(self, model, old_field, new_field, strict=False):
+        """
+        Override alter_field() to recreate the db_index index when its method or parameters change.
+
+        Django only creates or drops a field's index when db_index itself changes. Moreover, Django
+        looks for the index to drop among btree indexes only. Therefore, if the index changes and is
+        not a plain btree index before and after the alteration, it is dropped here and Django is
+        told that the old field had no index, so that it creates the new index if any.
+
+        """
+        old_index = self._get_index_definition(old_field)
+        new_index = self._get_index_definition(new_field)
+        if old_index is not None and old_index != new_index and (
+                new_index is not None or old_index[0] is not None):
+            meta_index_names = {index.name for index in model._meta.indexes}
+            index_names = self._constraint_names(
+                model,
+                [old_field.column],
+                index=True,
+                type_=old_index[0] or django.db.models.Index.suffix,
+                exclude=meta_index_names
+            )
+            for index_name in index_names:
+                self.execute(self._delete_index_sql(model, index_name))
+            old_field = copy.copy(old_field)
+            old_field.db_index = False
+
+        super().alter_field(model, old_field, new_field, strict=strict)
+
+
+class TimestampPartitioning:
+    """
+    Describes the range partitions of a model partitioned by a TimestampField.
+
+    A model is partitioned by the TimestampField whose partition_interval option is set. Each
+    partition then holds the rows of one day, month, or year, as chosen by the option. Queries
+    filtering on the partition key only scan the matching
+    partitions and expired rows are removed by detaching or dropping whole partitions, which unlike
+    DELETE statements neither rewrites the table nor scans its indexes.
+
+    PostgreSQL's declarative partitions are separate tables attached to the partitioned table.
+    MySQL's partitions are part of the table and are partitioned by UNIX_TIMESTAMP() of a
+    TIMESTAMP column since MySQL cannot partition by the column itself. Both databases require the
+    partition key in every unique constraint, so the primary key is extended with the partition key
+    column. See TimestampPartitionSchemaEditorMixin. SQLite does not support partitioning.
+
+    Partitions are named after the date on which they start, e.g. "p20180101" in MySQL and
+    "<table>_p20180101" in PostgreSQL. Bounds are in UTC with USE_TZ enabled, as are the stored
+    values, and in the default time zone otherwise.
+
+    See:
+        https://www.postgresql.org/docs/current/static/ddl-partitioning.html
+        https://dev.mysql.com/doc/refman/en/partitioning-range.html
+        https://dev.mysql.com/doc/refman/en/partitioning-limitations-partitioning-keys-unique-keys.html
+
+    """
+
+    INTERVALS = ('day', 'month', 'year')
+
+    _NAME_PATTERN = re.compile(r'p(\d{8})$')
+
+    def __init__(self, model, connection):
+        """
+        Args:
+            model (class): The partitioned model class.
+            connection: The Django connection object.
+
+        """
+        self.connection = connection
+        self.field = self.get_partition_key(model)
+        self.interval = self.field.partition_interval
+        self.model = model
+
+    def _get_bound_sql(self, value):
+        """
+        Return the SQL literal of a partition bound.
+
+        Args:
+            value (datetime.datetime): The naive start of a period.
+
+        Returns:
+            str: The SQL literal.
+
+        """
+        if self.field.storage == 'epoch_ms':
+            if django.conf.settings.USE_TZ:
+                value = django.utils.timezone.make_aware(value, datetime.timezone.utc)
+            return str(self.field.get_db_prep_value(value, self.connection))
+
+        sql = '\'{:%Y-%m-%d %H:%M:%S}\''.format(value)
+        if self.connection.vendor == 'mysql':
+            sql = 'UNIX_TIMESTAMP({!s})'.format(sql)
+        return sql
+
+    def _get_key_sql(self):
+        """
+        Return the SQL of the partition key expression.
+
+        Returns:
+            str: The SQL of the expression.
+
+        """
+        sql = self.connection.ops.quote_name(self.field.column)
+        if self.connection.vendor == 'mysql' and self.field.storage != 'epoch_ms':
+            sql = 'UNIX_TIMESTAMP({!s})'.format(sql)
+        return sql
+
+    @staticmethod
+    def get_partition_key(model):
+        """
+        Return the TimestampField by which a model is partitioned.
+
+        Args:
+            model (class): The model class.
+
+        Returns:
+            TimestampField: The first TimestampField with a partition_interval, or None.
+
+        """
+        for field in model._meta.concrete_fields:
+            if isinstance(field, TimestampField) and field.partition_interval is not None:
+                return field
+        return None
+
+    @classmethod
+    def is_partitioned(cls, model, connection):
+        """
+        Determine whether a model's table is range partitioned in the given database.
+
+        Args:
+            model (class): The model class.
+            connection: The Django connection object.
+
+        Returns:
+            boolean: True if the model has a partition key and the database supports partitions.
+
+        """
+        return cls.get_partition_key(model) is not None \
+            and connection.vendor in ('mysql', 'postgresql')
+
+    def get_create_partition_sql(self, start, unbounded=False):
+        """
+        Generate the statement creating the partition of the period beginning at start.
+
+        MySQL only adds partitions after the last existing one.
+
+        Args:
+            start (datetime.datetime): The naive start of the period.
+            unbounded (boolean): When true, the PostgreSQL partition also holds all values preceding
+                start, like the first partition of a MySQL table. Ignored in MySQL.
+
+        Returns:
+            str: The SQL statement.
+
+        """
+        quote_name = self.connection.ops.quote_name
+        if self.connection.vendor == 'mysql':
+            return 'ALTER TABLE {table!s} ADD PARTITION ({partition!s})'.format(
+                table=quote_name(self.model._meta.db_table),
+                partition=self.get_partition_definition_sql(start)
+            )
+
+        return (
+            'CREATE TABLE {partition!s} PARTITION OF {table!s} '
+            'FOR VALUES FROM ({start!s}) TO ({end!s})'
+        ).format(
+            partition=quote_name(self.get_partition_name(start)),
+            table=quote_name(self.model._meta.db_table),
+            start='MINVALUE' if unbounded else self._get_bound_sql(start),
+            end=self._get_bound_sql(self.get_period_start(start, 1))
+        )
+
+    def get_current_period_start(self):
+        """
+        Return the start of the period containing the current time.
+
+        Returns:
+            datetime.datetime: The naive start of the period.
+
+        """
+        now = django.utils.timezone.now()
+        if django.utils.timezone.is_aware(now):
+            now = django.utils.timezone.make_naive(now, datetime.timezone.utc)
+        return self.get_period_start(now)
+
+    def get_partition_by_sql(self, start):
+        """
+        Generate the PARTITION BY clause of the CREATE TABLE statement.
+
+        MySQL requires at least one partition in the statement. The partition of the period
+        beginning at start is therefore included. In PostgreSQL, it is created separately.
+
+        Args:
+            start (datetime.datetime): The naive start of the first period.
+
+        Returns:
+            str: The SQL clause.
+
+        """
+        sql = 'PARTITION BY RANGE ({!s})'.format(self._get_key_sql())
+        if self.connection.vendor == 'mysql':
+            sql = '{!s} ({!s})'.format(sql, self.get_partition_definition_sql(start))
+        return sql
+
+    def get_partition_definition_sql(self, start):
+        """
+        Generate the MySQL partition definition of the period beginning at start.
+
+        Args:
+            start (datetime.datetime): The naive start of the period.
+
+        Returns:
+            str: The SQL partition definition.
+
+        """
+        return 'PARTITION {!s} VALUES LESS THAN ({!s})'.format(
+            self.connection.ops.quote_name(self.get_partition_name(start)),
+            self._get_bound_sql(self.get_period_start(start, 1))
+        )
+
+    def get_partition_name(self, start):
+        """
+        Return the name of the partition of the period beginning at start.
+
+        PostgreSQL partitions are tables, so the name is prefixed with the partitioned table's name,
+        shortened if necessary to fit the database's maximum name length.
+
+        Args:
+            start (datetime.datetime): The naive start of the period.
+
+        Returns:
+            str: The partition name.
+
+        """
+        name = 'p{:%Y%m%d}'.format(start)
+        if self.connection.vendor == 'postgresql':
+            prefix_length = self.connection.ops.max_name_length() - len(name) - 1
+            name = '{!s}_{!s}'.format(self.model._meta.db_table[:prefix_length], name)
+        return name
+
+    def get_partitions(self):
+        """
+        Introspect the table's existing partitions.
+
+        Partitions whose names were not generated by get_partition_name(), such as PostgreSQL
+        default partitions, are omitted.
+
+        Returns:
+            collections.OrderedDict: The partition names keyed by the naive start of their periods,
+                in ascending order.
+
+        """
+        if self.connection.vendor == 'mysql':
+            sql = """
+                SELECT
+                    PARTITION_NAME
+                FROM
+                    information_schema.PARTITIONS
+                WHERE
+                    TABLE_SCHEMA = DATABASE()
+                    AND TABLE_NAME = %s
+                    AND PARTITION_NAME IS NOT NULL
+            """
+            params = [self.model._meta.db_table]
+        else:
+            sql = """
+                SELECT
+                    pg_class.relname
+                FROM
+                    pg_inherits
+                    JOIN pg_class ON pg_class.oid = pg_inherits.inhrelid
+                WHERE
+                    pg_inherits.inhparent = %s::regclass
+            """
+            params = [self.connection.ops.quote_name(self.model._meta.db_table)]
+
+        with self.connection.cursor() as cursor:
+            cursor.execute(sql, params)
+            names = [row[0] for row in cursor.fetchall()]
+
+        partitions = {}
+        for name in names:
+            match = self._NAME_PATTERN.search(name)
+            if match:
+                partitions[datetime.datetime.strptime(match.group(1), '%Y%m%d')] = name
+        return collections.OrderedDict(sorted(partitions.items()))
+
+    def get_period_start(self, value, periods=0):
+        """
+        Return the start of the period containing value, shifted by a number of periods.
+
+        Args:
+            value (datetime.datetime): A naive datetime.
+            periods (int): The number of periods by which to shift the start. May be negative.
+
+        Returns:
+            datetime.datetime: The naive start of the period.
+
+        """
+        start = value.replace(hour=0, minute=0, second=0, microsecond=0)
+        if self.interval == 'day':
+            return start + datetime.timedelta(days=periods)
+        if self.interval == 'month':
+            year, month = divmod(start.year * 12 + start.month - 1 + periods, 12)
+            return start.replace(year=year, month=month + 1, day=1)
+        return start.replace(year=start.year + periods, month=1, day=1)
+
+    def get_remove_partition_sql(self, start, drop=False):
+        """
+        Generate the statement detaching or dropping the partition of the period beginning at start.
+
+        A detached PostgreSQL partition remains as an ordinary table, e.g. for archival.
+
+        Args:
+            start (datetime.datetime): The naive start of the period.
+            drop (boolean): When true, the partition and its rows are dropped instead.
+
+        Returns:
+            str: The SQL statement.
+
+        Raises:
+            django.db.utils.NotSupportedError: If detaching is requested in MySQL, whose partitions
+                can only be dropped.
+
+        """
+        quote_name = self.connection.ops.quote_name
+        partition = quote_name(self.get_partition_name(start))
+        table = quote_name(self.model._meta.db_table)
+        if self.connection.vendor == 'mysql':
+            if not drop:
+                raise django.db.utils.NotSupportedError(
+                    'MySQL partitions cannot be detached, only dropped.'
+                )
+            return 'ALTER TABLE {!s} DROP PARTITION {!s}'.format(table, partition)
+
+        if drop:
+            return 'DROP TABLE {!s}'.format(partition)
+        return 'ALTER TABLE {!s} DETACH PARTITION {!s}'.format(table, partition)
+
+
+@django.core.checks.register(django.core.checks.Tags.models)
+def check_partition_keys(app_configs=None, **kwargs):
+    """
+    Check that no model has more than one TimestampField with a partition_interval.
+
+    The partition_interval option itself is checked by TimestampField.check().
+
+    Args:
+        app_configs (list): The app configs to check. Defaults to all installed apps.
+
+    Returns:
+        list: A list of Django check messages.
+
+    See:
+        https://docs.djangoproject.com/en/dev/topics/checks/
+
+    """
+    if app_configs is None:
+        models = django.apps.apps.get_models()
+    else:
+        models = (model for app_config in app_configs for model in app_config.get_models())
+
+    failed_checks = []
+    for model in models:
+        partition_keys = [
+            field for field in model._meta.concrete_fields
+            if isinstance(field, TimestampField) and field.partition_interval is not None
+        ]
+        if len(partition_keys) > 1:
+            failed_checks.append(
+                django.core.checks.Error(
+                    'Only one TimestampField of a model can set the option partition_interval.',
+                    obj=model,
+                    id=__name__ + '.E250'
+                )
+            )
+
+    return failed_checks
+
+
+class TimestampPartitionSchemaEditorMixin:
+    """
+    A schema editor class mixin that creates the tables of models as range partitioned tables.
+
+    Tables of models with a partition key are created with a PARTITION BY RANGE clause and
+    with a primary key extended by the partition key column, as both MySQL and PostgreSQL require.
+    The partition of the current period is created along with the table. Later partitions are
+    created by TimestampPartitionCommand. Like TimestampTriggerSchemaEditorMixin, this mixin must
+    be added to a custom database backend. See README.
+
+    Since the primary key column alone is no longer unique, other models cannot reference a
+    partitioned model with a ForeignKey constraint. Changing the partitioning options of an existing
+    table has no effect.
+
+    See:
+        https://github.com/django/django/blob/master/django/db/backends/base/schema.py
+
+    """
+
+    def column_sql(self, model, field, include_default=False):
+        """
+        Override column_sql() to omit the PRIMARY KEY clause from the primary key of a partitioned
+        table. The primary key constraint is added by table_sql() instead.
+
+        """
+        if field.primary_key and TimestampPartitioning.is_partitioned(model, self.connection):
+            field = copy.copy(field)
+            field.primary_key = False
+        return super().column_sql(model, field, include_default=include_default)
+
+    def create_model(self, model):
+        """
+        Override create_model() to create the current period's partition of a PostgreSQL table.
+
+        Like the partition in MySQL's CREATE TABLE statement, the partition has no lower bound, so
+        that rows of earlier periods, such as those of a backfill, can be inserted.
+
+        """
+        super().create_model(model)
+        if self.connection.vendor == 'postgresql' \
+                and TimestampPartitioning.is_partitioned(model, self.connection):
+            partitioning = TimestampPartitioning(model, self.connection)
+            self.execute(
+                partitioning.get_create_partition_sql(
+                    partitioning.get_current_period_start(),
+                    unbounded=True
+                )
+            )
+
+    def table_sql(self, model):
+        """
+        Override table_sql() to add the primary key constraint and the PARTITION BY clause.
+
+        """
+        sql, params = super().table_sql(model)
+        if TimestampPartitioning.is_partitioned(model, self.connection):
+            partitioning = TimestampPartitioning(model, self.connection)
+            pk_columns = [model._meta.pk.column]
+            if partitioning.field.column not in pk_columns:
+                pk_columns.append(partitioning.field.column)
+
+            # Table options that Django appends after the statement template, such as a tablespace,
+            # may themselves contain parentheses. The end of the definition is therefore located by
+            # the lengths of the template's closing and of the options rather than searched for.
+            closing = self.sql_create_table.partition('%(definition)s')[2] % {
+                'table': self.quote_name(model._meta.db_table)
+            }
+            options = ''
+            if model._meta.db_tablespace:
+                options = self.connection.ops.tablespace_sql(model._meta.db_tablespace)
+                if options:
+                    options = ' ' + options
+            position = len(sql) - len(options) - len(closing)
+            sql = '{!s}, PRIMARY KEY ({!s}){!s} {!s}{!s}'.format(
+                sql[:position],
+                ', '.join(self.quote_name(column) for column in pk_columns),
+                closing,
+                partitioning.get_partition_by_sql(partitioning.get_current_period_start()),
+                sql[position + len(closing):]
+            )
+        return sql, params
+
+
+class TimestampPartitionCommand(django.core.management.base.BaseCommand):
+    """
+    A management command that maintains the range partitions of models. See TimestampPartitioning.
+
+    Partitions are created ahead of time for the current and the following periods, so that rows
+    never lack a partition, and those of periods older than the retention period are detached or
+    dropped. Neither rewrites the table. Run the command periodically, e.g. daily from cron.
+
+    This module is not a Django app and cannot provide management commands itself. To install the
+    command, create a module such as "myapp/management/commands/partitions.py" containing:
+
+        from django_forcedfields import TimestampPartitionCommand as Command
+
+    See:
+        https://docs.djangoproject.com/en/dev/howto/custom-management-commands/
+
+    """
+
+    help = (
+        'Creates upcoming range partitions of models partitioned by a TimestampField and detaches '
+        'or drops expired ones.'
+    )
+
+    def add_arguments(self, parser):
+        """
+        Define the command's arguments.
+
+        """
+        parser.add_argument(
+            'model_labels',
+            metavar='app_label.ModelName',
+            nargs='*',
+            help='The models to maintain. Defaults to all partitioned models.'
+        )
+        parser.add_argument(
+            '--ahead',
+            default=3,
+            type=int,
+            help='The number of periods after the current one for which to create partitions.'
+        )
+        parser.add_argument(
+            '--database',
+            default=django.db.DEFAULT_DB_ALIAS,
+            help='The database alias. Defaults to "default".'
+        )
+        parser.add_argument(
+            '--drop',
+            action='store_true',
+            help='Drop expired partitions and their rows instead of detaching them.'
+        )
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='Print the statements without executing them.'
+        )
+        parser.add_argument(
+            '--retain',
+            type=int,
+            help=(
+                'The number of periods before the current one whose partitions are kept. Older '
+                'partitions are detached or dropped. By default, no partitions are removed.'
+            )
+        )
+
+    def get_statements(self, partitioning, ahead, retain=None, drop=False):
+        """
+        Generate the statements creating upcoming partitions and removing expired ones.
+
+        Args:
+            partitioning (TimestampPartitioning): The partitioning of a model.
+            ahead (int): The number of periods after the current one for which to create partitions.
+            retain (int): The number of periods before the current one whose partitions are kept.
+                When None, no partitions are removed.
+            drop (boolean): When true, expired partitions are dropped instead of detached.
+
+        Returns:
+            list: The SQL statements.
+
+        """
+        partitions = partitioning.get_partitions()
+        current_start = partitioning.get_current_period_start()
+        statements = []
+        for periods in range(ahead + 1):
+            start = partitioning.get_period_start(current_start, periods)
+            # MySQL can only add partitions after the last one.
+            if start not in partitions and not (
+                    partitioning.connection.vendor == 'mysql'
+                    and partitions and start < next(reversed(partitions))):
+                statements.append(partitioning.get_create_partition_sql(start))
+
+        if retain is not None:
+            retained_start = partitioning.get_period_start(current_start, -retain)
+            statements.extend(
+                partitioning.get_remove_partition_sql(start, drop=drop)
+                for start in partitions
+                if partitioning.get_period_start(start, 1) <= retained_start
+            )
+        return statements
+
+    def handle(self, *args, **options):
+        """
+        Maintain the partitions of the given models or of all partitioned models.
+
+        """
+        model_labels = options['model_labels']
+        if options['ahead'] < 0 or (options['retain'] is not None and options['retain'] < 0):
+            raise django.core.management.base.CommandError(
+                'The options --ahead and --retain must not be negative.'
+            )
+
+        connection = django.db.connections[options['database']]
+        if model_labels:
+            try:
+                models = [django.apps.apps.get_model(label) for label in model_labels]
+            except (LookupError, ValueError) as error:
+                raise django.core.management.base.CommandError(error)
+        else:
+            models = [
+                model for model in django.apps.apps.get_models()
+                if TimestampPartitioning.get_partition_key(model) is not None
+                and django.db.router.allow_migrate_model(connection.alias, model)
+            ]
+
+        for model in models:
+            if not TimestampPartitioning.is_partitioned(model, connection):
+                raise django.core.management.base.CommandError(
+                    'The model {!s} is not partitioned in the {!s} database.'.format(
+                        model._meta.label,
+                        connection.vendor
+                    )
+                )
+
+            try:
+                statements = self.get_statements(
+                    TimestampPartitioning(model, connection),
+                    options['ahead'],
+                    retain=options['retain'],
+                    drop=options['drop']
+                )
+            except django.db.utils.NotSupportedError as error:
+                raise django.core.management.base.CommandError(error)
+
+            for sql in statements:
+                self.stdout.write('{!s};'.format(sql))
+                if not options['dry_run']:
+                    with connection.cursor() as cursor:
+                        cursor.execute(sql)
+
+
+PurgeProgress = collections.namedtuple( # pylint: disable=invalid-name
+    'PurgeProgress',
+    ['chunks', 'elapsed', 'rows_deleted', 'rows_per_second']
+)
+
+
+class TimestampUpsertCompilerMixin:
+    """
+    An SQLInsertCompiler class mixin that sets TimestampFields to the current timestamp on conflict.
+
+    The conflict clause generated by the database backend only copies the values of the inserted
+    row to the existing row. This mixin appends an assignment of the current timestamp for each of
+    the query's timestamp_fields to that clause.
+
+    See:
+        https://docs.djangoproject.com/en/dev/ref/models/querysets/#bulk-create
+
+    """
+
+    def as_sql(self):
+        """
+        Override as_sql() to append the TimestampFields' assignments to the conflict clause.
+
+        """
+        connection = self.connection
+        conflict_sql = connection.ops.on_conflict_suffix_sql(
+            self.query.fields or [self.query.get_meta().pk],
+            self.query.on_conflict,
+            [field.column for field in self.query.update_fields],
+            [field.column for field in self.query.unique_fields]
+        )
+        # SQLite's current timestamp expression contains percent signs, escaped for the parameters.
+        assignments_sql = ', '.join(
+            '{!s} = {!s}'.format(
+                connection.ops.quote_name(field.column),
+                field.get_current_timestamp_sql(connection).replace('%', '%%')
+            )
+            for field in self.query.timestamp_fields
+        )
+
+        conflict_assignments_sql = '{!s}, {!s}'.format(conflict_sql, assignments_sql)
+        return [
+            (sql.replace(conflict_sql, conflict_assignments_sql, 1), params)
+            for sql, params in super().as_sql()
+        ]
+
+
+class TimestampUpsertQuery(django.db.models.sql.InsertQuery):
+    """
+    An InsertQuery compiled with TimestampUpsertCompilerMixin.
+
+    The mixin is combined with the SQLInsertCompiler class of each database backend once.
+
+    """
+
+    compiler_classes = {}
+
+    def __init__(self, *args, timestamp_fields=(), **kwargs):
+        super().__init__(*args, **kwargs)
+        self.timestamp_fields = list(timestamp_fields)
+
+    def get_compiler(self, using=None, connection=None, elide_empty=True):
+        """
+        Override get_compiler() to return the backend's compiler with TimestampUpsertCompilerMixin.
+
+        """
+        if using is None and connection is None:
+            raise ValueError('Need either using or connection')
+        if using:
+            connection = django.db.connections[using]
+        compiler_class = connection.ops.compiler(self.compiler)
+        if compiler_class not in self.compiler_classes:
+            self.compiler_classes[compiler_class] = type(
+                compiler_class.__name__,
+                (TimestampUpsertCompilerMixin, compiler_class),
+                {}
+            )
+
+        return self.compiler_classes[compiler_class](self, connection, using, elide_empty)
+
+
+class TimestampQuerySetMixin:
+    """
+    A QuerySet class mixin that sets the current timestamp in QuerySet.update() and bulk_update().
+
+    TimestampField.pre_save() only runs in Model.save(). Set-based updates therefore leave the
+    values of auto_now and auto_now_update TimestampFields unchanged unless the database maintains
+    them itself with MySQL's ON UPDATE clause or with the triggers of
+    TimestampTriggerSchemaEditorMixin. This mixin adds a Now() expression for each such field to
+    every update() call that does not assign the field explicitly.
+
+    QuerySet.bulk_update() performs its UPDATE statements through update() and is therefore covered
+    as well. The upsert() method applies the same rules to the conflicting rows of an insert. The
+    purge() method deletes expired rows in chunks and the seek() method paginates by keyset.
+
+    See:
+        https://docs.djangoproject.com/en/dev/ref/models/querysets/#update
+        https://docs.djangoproject.com/en/dev/ref/models/querysets/#bulk-update
+
+    """
+
+    # The TimestampFields set to the current timestamp on conflict by the INSERTs of upsert().
+    _upsert_timestamp_fields = ()
+
+    def _delete_chunk(self, queryset, field, chunk_size):
+        """
+        Delete the first chunk_size rows of the queryset in ascending order of the field.
+
+        MySQL alone supports DELETE ... ORDER BY ... LIMIT but rejects LIMIT in IN subqueries, which
+        PostgreSQL and SQLite use instead. If the queryset joins other tables, which a single-table
+        DELETE cannot reference, MySQL deletes the selected primary keys instead.
+
+        Args:
+            queryset: The queryset of the rows to delete.
+            field: The TimestampField instance.
+            chunk_size (int): The maximum number of rows deleted.
+
+        Returns:
+            int: The number of deleted rows.
+
+        """
+        connection = django.db.connections[self.db]
+        chunk_queryset = queryset.order_by(field.name, 'pk')
+        query = chunk_queryset.query
+        if connection.vendor == 'mysql' and len(query.alias_map) == 1:
+            where_sql, params = query.get_compiler(connection=connection).compile(query.where)
+            table = connection.ops.quote_name(self.model._meta.db_table)
+            sql = (
+                'DELETE FROM {table!s} WHERE {where!s} ORDER BY {ordering!s} LIMIT {limit:d}'
+            ).format(
+                table=table,
+                where=where_sql,
+                ordering=', '.join(
+                    '{!s}.{!s}'.format(table, connection.ops.quote_name(column))
+                    for column in (field.column, self.model._meta.pk.column)
+                ),
+                limit=chunk_size
+            )
+            with connection.cursor() as cursor:
+                cursor.execute(sql, params)
+                return cursor.rowcount
+
+        pks = chunk_queryset.values('pk')[:chunk_size]
+        if connection.vendor == 'mysql':
+            pks = list(pks.values_list('pk', flat=True))
+            if not pks:
+                return 0
+        return django.db.models.QuerySet(self.model, using=self.db).filter(pk__in=pks) \
+            ._raw_delete(self.db)
+
+    def _get_auto_insert_fields(self):
+        """
+        Return the model's TimestampFields whose values are set on insert.
+
+        Returns:
+            list: A list of TimestampField instances.
+
+        """
+        return [
+            field for field in self.model._meta.concrete_fields
+            if isinstance(field, TimestampField) and (field.auto_now or field.auto_now_add)
+        ]
+
+    def _get_auto_update_fields(self):
+        """
+        Return the model's TimestampFields whose values are set on update.
+
+        Returns:
+            list: A list of TimestampField instances.
+
+        """
+        return [
+            field for field in self.model._meta.concrete_fields
+            if isinstance(field, TimestampField) and (field.auto_now or field.auto_now_update)
+        ]
+
+    def _insert(self, objs, fields, returning_fields=None, raw=False, using=None,
+                on_conflict=None, update_fields=None, unique_fields=None):
+        """
+        Override the private QuerySet._insert() to compile the INSERTs of upsert() with
+        TimestampUpsertQuery.
+
+        """
+        if on_conflict != django.db.models.constants.OnConflict.UPDATE \
+                or not self._upsert_timestamp_fields:
+            return super()._insert(
+                objs,
+                fields,
+                returning_fields=returning_fields,
+                raw=raw,
+                using=using,
+                on_conflict=on_conflict,
+                update_fields=update_fields,
+                unique_fields=unique_fields
+            )
+
+        self._for_write = True
+        query = TimestampUpsertQuery(
+            self.model,
+            on_conflict=on_conflict,
+            update_fields=update_fields,
+            unique_fields=unique_fields,
+            timestamp_fields=self._upsert_timestamp_fields
+        )
+        query.insert_values(fields, objs, raw=raw)
+        return query.get_compiler(using=using or self.db).execute_sql(returning_fields)
+
+    _insert.alters_data = True
+
+    def _set_insert_expressions(self, objs, using):
+        """
+        Assign shared compiled current timestamp expressions to the instances' auto insert fields.
+
+        One expression is compiled per distinct expression, since fields with storage='epoch_ms'
+        use EpochMillisecondsNow() and fields with a precision use PrecisionNow() at that precision.
+
+        Args:
+            objs (list): The model instances about to be inserted.
+            using (str): The alias of the database written to.
+
+        """
+        expressions = {}
+        for field in self._get_auto_insert_fields():
+            expression = field.get_current_timestamp_expression()
+            if expression not in expressions:
+                expressions[expression] = CompiledExpression.compile(
+                    expression,
+                    django.db.models.sql.InsertQuery(self.model),
+                    using
+                )
+            for obj in objs:
+                setattr(obj, field.attname, expressions[expression])
+
+    def bulk_create(self, objs, *args, **kwargs):
+        """
+        Override bulk_create() to share one compiled current timestamp expression among all rows.
+
+        TimestampField.pre_save() would otherwise assign a new Now() expression to each instance,
+        each of which is then copied, resolved, and compiled by the SQL compiler. Instead, a single
+        Now() expression is compiled in advance for the target database and assigned to the
+        auto_now and auto_now_add fields of every instance, where pre_save() reuses it.
+
+        Where the database does not return primary keys, the expressions of the inserted instances
+        can never be resolved, so they are discarded from TimestampDeferredAttribute's batches, as
+        are the instances whose timestamps were returned by the INSERT.
+
+        See:
+            https://docs.djangoproject.com/en/dev/ref/models/querysets/#bulk-create
+
+        """
+        objs = list(objs)
+        if objs:
+            # As in the parent, so that the expressions are compiled for the database written to.
+            self._for_write = True
+            self._set_insert_expressions(objs, self.db)
+
+        objs = super().bulk_create(objs, *args, **kwargs)
+        for field in self._get_auto_insert_fields():
+            descriptor = self.model.__dict__.get(field.attname)
+            if isinstance(descriptor, TimestampDeferredAttribute):
+                for obj in objs:
+                    if obj.pk is None or not descriptor._is_pending(obj):
+                        descriptor.discard(obj)
+        return objs
+
+    def bulk_update(self, objs, fields, *args, **kwargs):
+        """
+        Override bulk_update() to set the model instances' timestamp attributes as pre_save() does.
+
+        The current timestamp itself is set in the database by update().
+
+        """
+        objs = list(objs)
+        field_names = set(fields)
+        rows_updated = super().bulk_update(objs, fields, *args, **kwargs)
+        for field in self._get_auto_update_fields():
+            if field.name not in field_names:
+                descriptor = getattr(self.model, field.attname)
+                for obj in objs:
+                    setattr(obj, field.attname, field.get_current_timestamp_expression())
+                    if isinstance(descriptor, TimestampDeferredAttribute):
+                        descriptor.register(obj)
+
+        return rows_updated
+
+    def purge(self, field_name, before, chunk_size=1000, chunk_interval=None, sleep=0,
+              throttle=None):
+        """
+        Delete the rows whose TimestampField value precedes before, one chunk at a time.
+
+        A single DELETE of many rows locks all of them until it commits and is replayed on replicas
+        as one long transaction. Instead, the rows are deleted in ascending order of the field,
+        which its index serves, by statements of at most chunk_size rows. With chunk_interval, each
+        statement is moreover restricted to values less than chunk_interval after the oldest
+        remaining value, bounding the range of the index that it scans and locks. In autocommit
+        mode, each statement is committed separately, so retention can run alongside production
+        traffic.
+
+        After each chunk, sleep seconds plus the seconds returned by throttle, if any, elapse before
+        the next one. See ReplicaLagThrottle.
+
+        As with QuerySet.update(), no model instances are loaded. No signals are sent and related
+        rows are not collected for on_delete handling, so foreign key constraints of the database
+        apply instead.
+
+        Args:
+            field_name (str): The name of a TimestampField of the model. It should be indexed.
+            before (datetime.datetime): Rows with earlier values are deleted.
+            chunk_size (int): The maximum number of rows deleted by a single statement.
+            chunk_interval (datetime.timedelta): The maximum range of values deleted by a single
+                statement.
+            sleep (float): The number of seconds to sleep between chunks.
+            throttle (callable): Called after each chunk with the PurgeProgress so far. It may
+                sleep itself or return a number of additional seconds to sleep.
+
+        Returns:
+            PurgeProgress: The number of chunks and rows deleted, the elapsed seconds, and the
+                resulting rate.
+
+        Raises:
+            TypeError: If the queryset is sliced.
+            ValueError: If the field is not a TimestampField or if chunk_size is less than 1.
+
+        """
+        if self.query.is_sliced:
+            raise TypeError('Cannot purge a query once a slice has been taken.')
+        if chunk_size < 1:
+            raise ValueError('The chunk size must be positive.')
+        field = self.model._meta.get_field(field_name)
+        if not isinstance(field, TimestampField):
+            raise ValueError(
+                'The field {!s} of the model {!s} is not a TimestampField.'.format(
+                    field_name,
+                    self.model._meta.label
+                )
+            )
+
+        self._for_write = True
+        queryset = self.filter(**{field.name + '__lt': before})
+        progress = PurgeProgress(chunks=0, elapsed=0.0, rows_deleted=0, rows_per_second=0.0)
+        start_time = time.monotonic()
+        window_end = None
+        while True:
+            if chunk_interval is not None and window_end is None:
+                window_start = queryset.aggregate(
+                    window_start=django.db.models.Min(field.name)
+                )['window_start']
+                if window_start is None:
+                    return progress
+                window_end = min(before, window_start + chunk_interval)
+
+            chunk_queryset = queryset
+            if window_end is not None:
+                chunk_queryset = queryset.filter(**{field.name + '__lt': window_end})
+            rows_deleted = self._delete_chunk(chunk_queryset, field, chunk_size)
+            elapsed = time.monotonic() - start_time
+            progress = PurgeProgress(
+                chunks=progress.chunks + 1,
+                elapsed=elapsed,
+                rows_deleted=progress.rows_deleted + rows_deleted,
+                rows_per_second=(progress.rows_deleted + rows_deleted) / elapsed if elapsed else 0.0
+            )
+            if rows_deleted < chunk_size:
+                if window_end is None or window_end >= before:
+                    return progress
+                window_end = None
+
+            delay = sleep
+            if throttle is not None:
+                delay += throttle(progress) or 0
+            if delay > 0:
+                time.sleep(delay)
+
+    def seek(self, field_name, cursor=None, descending=False):
+        """
+        Order the rows by a TimestampField and the primary key and skip those up to the cursor.
+
+        Unlike slicing with an offset, the rows preceding the cursor are not read. See
+        TimestampCursorPaginator.
+
+        Args:
+            field_name (str): The name of a TimestampField of the model.
+            cursor (str): A cursor of TimestampCursorPaginator, e.g. a page's next_cursor.
+            descending (boolean): When true, the newest rows come first.
+
+        Returns:
+            The Django queryset.
+
+        Raises:
+            django.core.paginator.InvalidPage: If the cursor is malformed.
+            ValueError: If the field is not a TimestampField.
+
+        """
+        return TimestampCursorPaginator(
+            self,
+            field_name,
+            per_page=None,
+            descending=descending
+        ).get_queryset(cursor)
+
+    def touch(self, chunk_size=None):
+        """
+        Set every auto_now and auto_now_update TimestampField to the current timestamp.
+
+        No model instances are loaded. Without chunk_size, a single UPDATE statement is issued. With
+        chunk_size, the rows are updated in ascending primary key order by one UPDATE statement per
+        range of at most chunk_size rows so that no statement holds locks on too many rows at once.
+        Each range's upper bound is found with a query on the primary key index. In autocommit mode,
+        each statement is committed separately.
+
+        Args:
+            chunk_size (int): The maximum number of rows updated by a single statement.
+
+        Returns:
+            int: The number of updated rows.
+
+        Raises:
+            ValueError: If the model has no auto_now or auto_now_update TimestampField.
+
+        """
+        fields = self._get_auto_update_fields()
+        if not fields:
+            raise ValueError(
+                'The model {!s} has no auto_now or auto_now_update TimestampField.'.format(
+                    self.model._meta.label
+                )
+            )
+        values = {field.name: field.get_current_timestamp_expression() for field in fields}
+        if not chunk_size:
+            return self.update(**values)
+
+        rows_updated = 0
+        queryset = self.order_by('pk')
+        while True:
+            # The row following the upper bound, if any, shows whether rows remain after the range.
+            upper_bounds = list(
+                queryset.values_list('pk', flat=True)[chunk_size - 1:chunk_size + 1]
+            )
+            if len(upper_bounds) < 2:
+                return rows_updated + queryset.update(**values)
+            rows_updated += queryset.filter(pk__lte=upper_bounds[0]).update(**values)
+            queryset = queryset.filter(pk__gt=upper_bounds[0])
+
+    def update(self, **kwargs):
+        """
+        Override update() to add Now() for each auto_now and auto_now_update TimestampField.
+
+        Fields explicitly assigned in kwargs are left untouched.
+
+        """
+        for field in self._get_auto_update_fields():
+            if field.name not in kwargs and field.attname not in kwargs:
+                kwargs[field.name] = field.get_current_timestamp_expression()
+
+        return super().update(**kwargs)
+
+    def upsert(self, objs, unique_fields, update_fields=None, batch_size=None):
+        """
+        Insert the model instances or update the existing rows with which they conflict.
+
+        Unlike get_or_create() and update_or_create(), each batch is a single atomic statement, so
+        concurrent upserts of the same rows cannot race. The statement is that of
+        QuerySet.bulk_create() with update_conflicts=True, ending in an ON CONFLICT DO UPDATE
+        clause on PostgreSQL and SQLite and in an ON DUPLICATE KEY UPDATE clause on MySQL.
+
+        TimestampFields follow the same rules as in Model.save(). Inserted rows receive the current
+        timestamp in auto_now and auto_now_add fields. On conflict, auto_now and auto_now_update
+        fields are set to CURRENT_TIMESTAMP while auto_now_add fields are left untouched, unless
+        they are explicitly listed in update_fields.
+
+        See:
+            https://docs.djangoproject.com/en/dev/ref/models/querysets/#bulk-create
+            https://www.postgresql.org/docs/current/static/sql-insert.html#SQL-ON-CONFLICT
+            https://www.sqlite.org/lang_upsert.html
+            https://dev.mysql.com/doc/refman/en/insert-on-duplicate.html
+
+        Args:
+            objs (iterable): The model instances to insert.
+            unique_fields (iterable): The names of the fields of the unique constraint against which
+                conflicts are detected. Ignored by MySQL, which checks all unique constraints.
+            update_fields (iterable): The names of the fields copied from the conflicting instance
+                to the existing row. Defaults to all fields other than the primary key, the unique
+                fields, and automatic TimestampFields.
+            batch_size (int): The maximum number of instances inserted in a single statement.
+
+        Returns:
+            list: The model instances.
+
+        Raises:
+            ValueError: If QuerySet.bulk_create() rejects the model or the fields, for example if
+                the model uses multi-table inheritance or if update_fields is empty.
+            django.db.utils.NotSupportedError: If the database does not support upserts.
+
+        """
+        self._for_write = True
+        opts = self.model._meta
+        unique_fields = list(unique_fields)
+        if update_fields is None:
+            update_fields = [
+                field.name for field in opts.concrete_fields
+                if not field.primary_key and field.name not in unique_fields and not (
+                    isinstance(field, TimestampField)
+                    and (field.auto_now or field.auto_now_add or field.auto_now_update)
+                )
+            ]
+        else:
+            update_fields = list(update_fields)
+        if not django.db.connections[self.db].features.supports_update_conflicts_with_target:
+            unique_fields = None
+
+        queryset = self._chain()
+        queryset._upsert_timestamp_fields = [
+            field for field in self._get_auto_update_fields()
+            if field.name not in update_fields and field.attname not in update_fields
+        ]
+        return queryset.bulk_create(
+            objs,
+            batch_size=batch_size,
+            update_conflicts=True,
+            update_fields=update_fields,
+            unique_fields=unique_fields
+        )
+
+
+class TimestampQuerySet(TimestampQuerySetMixin, django.db.models.QuerySet):
+    """
+    A QuerySet class including TimestampQuerySetMixin.
+
+    """
+
+
+class TimestampManager(django.db.models.Manager.from_queryset(TimestampQuerySet)):
+    """
+    A Manager class returning TimestampQuerySet instances.
+
+    """
+
+
+class TimestampModelMixin:
+    """
+    A Model class mixin that retrieves database-generated timestamps in Model.save() UPDATEs.
+
+    TimestampField declares auto_now and auto_now_add fields as database-generated. See
+    TimestampField.db_returning. Where the database supports INSERT ... RETURNING, Django therefore
+    replaces the Now() expression left on the model instance by pre_save() with the actual timestamp
+    in the same INSERT statement, both in Model.save() and in QuerySet.bulk_create().
+
+    Django offers no equivalent for UPDATE statements. This mixin overrides the private
+    Model._do_update() to append a RETURNING clause to the UPDATE statement of Model.save() when a
+    TimestampField is set to the current timestamp and to assign the returned values to the model
+    instance. PostgreSQL and SQLite 3.35 or later support UPDATE ... RETURNING. MariaDB only
+    supports INSERT ... RETURNING and MySQL supports neither. On other databases, and when
+    Meta.select_on_save is set, updates are performed by Django as usual.
+
+    See:
+        https://www.postgresql.org/docs/current/static/sql-update.html
+        https://www.sqlite.org/lang_returning.html
+        https://mariadb.com/kb/en/mariadb/insertreturning/
+        https://github.com/django/django/blob/master/django/db/models/base.py
+
+    """
+
+    def _do_update(self, base_qs, using, pk_val, values, update_fields, forced_update):
+        """
+        Override the private Model._do_update() to add a RETURNING clause to the UPDATE statement.
+
+        Returns:
+            bool: True if a row was updated.
+
+        """
+        connection = django.db.connections[using]
+        returning_fields = [
+            field for field, model, value in values
+            if isinstance(field, TimestampField)
+            and isinstance(value, (django.db.models.functions.Now, CompiledExpression))
+        ]
+        if not returning_fields or self._meta.select_on_save or not (
+                connection.vendor == 'postgresql'
+                or (
+                    connection.vendor == 'sqlite'
+                    and connection.Database.sqlite_version_info >= (3, 35)
+                )
+        ):
+            return super()._do_update(
+                base_qs,
+                using,
+                pk_val,
+                values,
+                update_fields,
+                forced_update
+            )
+
+        query = base_qs.filter(pk=pk_val).query.chain(django.db.models.sql.UpdateQuery)
+        query.add_update_fields(values)
+        compiler = query.get_compiler(using)
+        sql, params = compiler.as_sql()
+        sql = '{!s} RETURNING {!s}'.format(
+            sql,
+            ', '.join(connection.ops.quote_name(field.column) for field in returning_fields)
+        )
+        with connection.cursor() as cursor:
+            cursor.execute(sql, params)
+            row = cursor.fetchone()
+        if row is None:
+            return False
+
+        converters = compiler.get_converters(
+            [field.get_col(self._meta.db_table) for field in returning_fields]
+        )
+        if converters:
+            row = list(compiler.apply_converters([row], converters))[0]
+        for field, value in zip(returning_fields, row):
+            setattr(self, field.attname, value)
+
+        return True
+
+
+class TimestampTouchBuffer:
+    """
+    Coalesces frequent "touches" of records' auto_now and auto_now_update TimestampFields.
+
+    Recording the last access of records with a separate UPDATE statement per access is wasteful
+    when the same few records are accessed many times per second. Instead, touch() merely records
+    the primary keys in a set per model. Each set is flushed by TimestampQuerySet.touch() as a
+    single UPDATE ... WHERE pk IN (...) statement once it reaches max_size or, on the next touch,
+    once interval seconds have passed since the last flush. If a statement fails, its keys and
+    those of the models not yet flushed are returned to the pending sets before the error is raised.
+
+    Statements are executed outside the lock, with the database connection of the flushing thread.
+    A flush inside an atomic block would hold the locks of the touched rows until that transaction
+    ends and would be lost if it were rolled back, so touch() does not flush inside an atomic block
+    and flush() refuses to. Under ATOMIC_REQUESTS, touch() therefore never flushes.
+
+    After start(), a daemon thread also flushes all keys every interval seconds with its own
+    database connection, so that keys touched before a quiet period or inside atomic blocks are
+    written too. stop() stops the thread after a final flush. Otherwise, call flush() explicitly
+    when needed and at shutdown.
+
+    All methods are thread-safe.
+
+    """
+
+    def __init__(self, using=django.db.DEFAULT_DB_ALIAS, max_size=1000, interval=1.0):
+        """
+        Args:
+            using (str): The alias of the database to update.
+            max_size (int): The number of distinct primary keys of a model at which the model's keys
+                are flushed.
+            interval (float): The number of seconds after which all keys are flushed.
+
+        """
+        self.using = using
+        self.max_size = max_size
+        self.interval = interval
+        self.flush_count = 0
+        self.flushed_row_count = 0
+        self.flushed_touch_count = 0
+        self._lock = threading.Lock()
+        self._pending = {}
+        self._last_flush_time = time.monotonic()
+        self._stop_event = threading.Event()
+        self._thread = None
+
+    @property
+    def coalescing_ratio(self):
+        """
+        Return the average number of flushed touches per flushed primary key.
+
+        Returns:
+            float: The ratio, or 0.0 if nothing has been flushed yet.
+
+        """
+        with self._lock:
+            if not self.flushed_row_count:
+                return 0.0
+            return self.flushed_touch_count / self.flushed_row_count
+
+    def _pop_batches(self, models):
+        """
+        Remove and return the pending primary keys of the given models.
+
+        Must be called while holding the lock.
+
+        Args:
+            models (iterable): The Django model classes.
+
+        Returns:
+            list: A list of (model, primary key set, touch count) tuples.
+
+        """
+        return [(model,) + tuple(self._pending.pop(model)) for model in list(models)]
+
+    def _restore_batches(self, batches):
+        """
+        Return popped primary keys to the pending sets, merging them with keys touched since.
+
+        Must be called while holding the lock.
+
+        Args:
+            batches (list): A list of (model, primary key set, touch count) tuples.
+
+        """
+        for model, pks, touch_count in batches:
+            pending = self._pending.setdefault(model, [set(), 0])
+            pending[0].update(pks)
+            pending[1] += touch_count
+
+    def _write(self, batches):
+        """
+        Execute one UPDATE statement per model and record the statistics.
+
+        If a statement fails, the batches not yet written are restored before the error is raised.
+
+        Args:
+            batches (list): A list of (model, primary key set, touch count) tuples.
+
+        Returns:
+            int: The number of updated rows.
+
+        """
+        row_count = 0
+        for index, (model, pks, touch_count) in enumerate(batches):
+            try:
+                row_count += TimestampQuerySet(model, using=self.using).filter(pk__in=pks).touch()
+            except Exception:
+                with self._lock:
+                    self._restore_batches(batches[index:])
+                raise
+
+            with self._lock:
+                self.flush_count += 1
+                self.flushed_row_count += len(pks)
+                self.flushed_touch_count += touch_count
+
+        return row_count
+
+    def _in_atomic_block(self):
+        """
+        Determine whether the current thread's connection to the database is in an atomic block.
+
+        Returns:
+            bool: True if the connection is in an atomic block.
+
+        """
+        return django.db.connections[self.using].in_atomic_block
+
+    def _run(self):
+        """
+        Flush all keys every interval seconds until stop() is called, then flush a last time.
+
+        A failed flush is retried after the next interval since its keys remain pending.
+
+        """
+        connection = django.db.connections[self.using]
+        try:
+            stopping = False
+            while not stopping:
+                stopping = self._stop_event.wait(self.interval)
+                try:
+                    self.flush()
+                except django.db.Error:
+                    pass
+                connection.close_if_unusable_or_obsolete()
+        finally:
+            connection.close()
+
+    def flush(self):
+        """
+        Flush the pending primary keys of all models.
+
+        Returns:
+            int: The number of updated rows.
+
+        Raises:
+            django.db.transaction.TransactionManagementError: If called inside an atomic block.
+
+        """
+        if self._in_atomic_block():
+            raise django.db.transaction.TransactionManagementError(
+                'TimestampTouchBuffer.flush() cannot be called inside an atomic block.'
+            )
+
+        with self._lock:
+            batches = self._pop_batches(self._pending)
+            self._last_flush_time = time.monotonic()
+
+        return self._write(batches)
+
+    def touch(self, model, *pks):
+        """
+        Record that the given records are to be set to the current timestamp.
+
+        Args:
+            model: The Django model class. It must have at least one auto_now or auto_now_update
+                TimestampField.
+            *pks: The primary key values of the records.
+
+        Returns:
+            int: The number of rows updated by a resulting flush, if any.
+
+        Raises:
+            ValueError: If the model has no auto_now or auto_now_update TimestampField.
+
+        """
+        model = model._meta.concrete_model
+        if not any(
+                isinstance(field, TimestampField) and (field.auto_now or field.auto_now_update)
+                for field in model._meta.concrete_fields):
+            raise ValueError(
+                'The model {!s} has no auto_now or auto_now_update TimestampField.'.format(
+                    model._meta.label
+                )
+            )
+
+        in_atomic_block = self._in_atomic_block()
+        with self._lock:
+            pending = self._pending.setdefault(model, [set(), 0])
+            pending[0].update(pks)
+            pending[1] += len(pks)
+            if in_atomic_block:
+                return 0
+            elif time.monotonic() - self._last_flush_time >= self.interval:
+                batches = self._pop_batches(self._pending)
+                self._last_flush_time = time.monotonic()
+            elif len(pending[0]) >= self.max_size:
+                batches = self._pop_batches([model])
+            else:
+                return 0
+
+        return self._write(batches)
+
+    def start(self):
+        """
+        Start flushing all keys every interval seconds in a daemon thread.
+
+        Raises:
+            RuntimeError: If the thread is already running.
+
+        """
+        if self._thread is not None:
+            raise RuntimeError('The TimestampTouchBuffer is already started.')
+
+        self._stop_event.clear()
+        self._thread = threading.Thread(
+            target=self._run,
+            name='TimestampTouchBuffer',
+            daemon=True
+        )
+        self._thread.start()
+
+    def stop(self):
+        """
+        Stop the thread started by start() after a final flush.
+
+        Keys whose final flush failed remain pending.
+
+        """
+        if self._thread is not None:
+            self._stop_event.set()
+            self._thread.join()
+            self._thread = None
+
+
+class ReplicaLagThrottle:
+    """
+    A throttle for TimestampQuerySetMixin.purge() that waits while replicas lag behind.
+
+    Each call measures the replication lag of the given replica databases and sleeps until all of
+    them are at most max_lag seconds behind. Databases that are not replicas are ignored. A MySQL
+    replica whose SQL thread is stopped counts as lagging indefinitely, so the wait is bounded by
+    timeout.
+
+    See:
+        https://dev.mysql.com/doc/refman/en/show-replica-status.html
+        https://www.postgresql.org/docs/current/static/functions-admin.html#FUNCTIONS-RECOVERY-INFO-TABLE
+
+    """
+
+    def __init__(self, aliases, max_lag=1.0, poll_interval=1.0, timeout=None):
+        """
+        Args:
+            aliases (iterable): The aliases of the replica databases.
+            max_lag (float): The maximum acceptable lag in seconds.
+            poll_interval (float): The number of seconds between measurements.
+            timeout (float): The maximum number of seconds to wait per call. When None, waits
+                indefinitely.
+
+        """
+        self.aliases = list(aliases)
+        self.max_lag = max_lag
+        self.poll_interval = poll_interval
+        self.timeout = timeout
+
+    def __call__(self, progress=None):
+        """
+        Wait until the replication lag is acceptable.
+
+        Args:
+            progress (PurgeProgress): The purge's progress. Unused.
+
+        Returns:
+            float: The number of seconds waited.
+
+        Raises:
+            django.db.utils.OperationalError: If the lag remains too high for timeout seconds.
+
+        """
+        start_time = time.monotonic()
+        while True:
+            lag = self.get_lag()
+            waited = time.monotonic() - start_time
+            if lag is None or lag <= self.max_lag:
+                return waited
+            if self.timeout is not None and waited >= self.timeout:
+                raise django.db.utils.OperationalError(
+                    'Replication lag exceeded {!s} seconds for {!s} seconds.'.format(
+                        self.max_lag,
+                        self.timeout
+                    )
+                )
+            time.sleep(self.poll_interval)
+
+    @staticmethod
+    def get_replica_lag(connection):
+        """
+        Measure the replication lag of a database.
+
+        An idle PostgreSQL replica that has replayed all received WAL has no lag, regardless of the
+        time of the last replayed transaction.
+
+        Args:
+            connection: The Django connection object.
+
+        Returns:
+            float: The lag in seconds, or None if the database is not a replica.
+
+        """
+        if connection.vendor == 'mysql':
+            minimum_version = (10, 5, 1) if connection.mysql_is_mariadb else (8, 0, 22)
+            if connection.mysql_version >= minimum_version:
+                sql = 'SHOW REPLICA STATUS'
+            else:
+                sql = 'SHOW SLAVE STATUS'
+            with connection.cursor() as cursor:
+                cursor.execute(sql)
+                row = cursor.fetchone()
+                columns = [column[0] for column in cursor.description or ()]
+            if row is None:
+                return None
+            status = dict(zip(columns, row))
+            lag = status.get('Seconds_Behind_Source', status.get('Seconds_Behind_Master'))
+            return float('inf') if lag is None else float(lag)
+
+        if connection.vendor == 'postgresql':
+            sql = """
+                SELECT
+                    CASE
+                        WHEN NOT pg_is_in_recovery() THEN NULL
+                        WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+                        ELSE EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp())
+                    END
+            """
+            with connection.cursor() as cursor:
+                cursor.execute(sql)
+                lag = cursor.fetchone()[0]
+            return None if lag is None else float(lag)
+
+        return None
+
+    def get_lag(self):
+        """
+        Measure the greatest replication lag among the replica databases.
+
+        Returns:
+            float: The lag in seconds, or None if none of the databases is a replica.
+
+        """
+        lags = [
+            lag for lag in (
+                self.get_replica_lag(django.db.connections[alias]) for alias in self.aliases
+            )
+            if lag is not None
+        ]
+        return max(lags) if lags else None
+
+
+class TimestampPurgeCommand(django.core.management.base.BaseCommand):
+    """
+    A management command that deletes expired rows with TimestampQuerySetMixin.purge().
+
+    Like TimestampPartitionCommand, it must be installed in one of the project's apps, e.g. in
+    "myapp/management/commands/purge.py":
+
+        from django_forcedfields import TimestampPurgeCommand as Command
+
+    See:
+        https://docs.djangoproject.com/en/dev/howto/custom-management-commands/
+
+    """
+
+    help = 'Deletes the rows of a model whose TimestampField is older than a number of days.'
+
+    def add_arguments(self, parser):
+        """
+        Define the command's arguments.
+
+        """
+        parser.add_argument('model_label', metavar='app_label.ModelName', help='The model.')
+        parser.add_argument('field_name', help='The name of the TimestampField.')
+        parser.add_argument(
+            'days',
+            type=float,
+            help='Rows whose field value is older than this number of days are deleted.'
+        )
+        parser.add_argument(
+            '--chunk-interval',
+            type=float,
+            help='The maximum range of values in seconds deleted by a single statement.'
+        )
+        parser.add_argument(
+            '--chunk-size',
+            default=1000,
+            type=int,
+            help='The maximum number of rows deleted by a single statement. Defaults to 1000.'
+        )
+        parser.add_argument(
+            '--database',
+            default=django.db.DEFAULT_DB_ALIAS,
+            help='The database alias. Defaults to "default".'
+        )
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='Count the expired rows without deleting them.'
+        )
+        parser.add_argument(
+            '--max-replica-lag',
+            default=1.0,
+            type=float,
+            help='The maximum replication lag in seconds of the --replica databases. Defaults to 1.'
+        )
+        parser.add_argument(
+            '--replica',
+            action='append',
+            default=[],
+            dest='replicas',
+            help='The alias of a replica database whose lag throttles deletion. May be repeated.'
+        )
+        parser.add_argument(
+            '--sleep',
+            default=0.0,
+            type=float,
+            help='The number of seconds to sleep between chunks.'
+        )
+
+    def handle(self, *args, **options):
+        """
+        Delete the expired rows and report the deletion rate.
+
+        """
+        try:
+            model = django.apps.apps.get_model(options['model_label'])
+        except (LookupError, ValueError) as error:
+            raise django.core.management.base.CommandError(error)
+        if options['chunk_size'] < 1:
+            raise django.core.management.base.CommandError(
+                'The option --chunk-size must be positive.'
+            )
+
+        before = django.utils.timezone.now() - datetime.timedelta(days=options['days'])
+        queryset = TimestampQuerySet(model, using=options['database'])
+        if options['dry_run']:
+            try:
+                count = queryset.filter(**{options['field_name'] + '__lt': before}).count()
+            except django.core.exceptions.FieldError as error:
+                raise django.core.management.base.CommandError(error)
+            self.stdout.write('{:d} rows would be deleted.'.format(count))
+            return
+
+        replica_throttle = None
+        if options['replicas']:
+            replica_throttle = ReplicaLagThrottle(
+                options['replicas'],
+                max_lag=options['max_replica_lag']
+            )
+
+        def throttle(progress):
+            """
+            Report the progress at verbosity 2 and wait for the replicas.
+
+            """
+            if options['verbosity'] >= 2:
+                self.stdout.write(
+                    'Deleted {:d} rows in {:d} chunks, {:.1f} rows/s.'.format(
+                        progress.rows_deleted,
+                        progress.chunks,
+                        progress.rows_per_second
+                    )
+                )
+            if replica_throttle is not None:
+                replica_throttle(progress)
+
+        chunk_interval = None
+        if options['chunk_interval']:
+            chunk_interval = datetime.timedelta(seconds=options['chunk_interval'])
+        try:
+            progress = queryset.purge(
+                options['field_name'],
+                before,
+                chunk_size=options['chunk_size'],
+                chunk_interval=chunk_interval,
+                sleep=options['sleep'],
+                throttle=throttle
+            )
+        except (django.core.exceptions.FieldDoesNotExist, ValueError) as error:
+            raise django.core.management.base.CommandError(error)
+
+        self.stdout.write(
+            'Deleted {:d} rows of {!s} in {:d} chunks and {:.1f} seconds, {:.1f} rows/s.'.format(
+                progress.rows_deleted,
+                model._meta.label,
+                progress.chunks,
+                progress.elapsed,
+                progress.rows_per_second
+            )
+        )
+
+
+class TimestampCursorPage(collections.abc.Sequence):
+    """
+    A page of objects returned by TimestampCursorPaginator.page().
+
+    Like Django's Page, it is a sequence of its objects.
+
+    """
+
+    def __init__(self, object_list, next_cursor, paginator):
+        """
+        Args:
+            object_list (list): The page's objects.
+            next_cursor (str): The cursor of the following page, or None on the last page.
+            paginator (TimestampCursorPaginator): The paginator.
+
+        """
+        self.next_cursor = next_cursor
+        self.object_list = object_list
+        self.paginator = paginator
+
+    def __getitem__(self, index):
+        return self.object_list[index]
+
+    def __len__(self):
+        return len(self.object_list)
+
+    def __repr__(self):
+        return '<TimestampCursorPage of {:d} objects>'.format(len(self))
+
+    def has_next(self):
+        """
+        Determine whether a following page exists.
+
+        Returns:
+            boolean: True if next_cursor is set.
+
+        """
+        return self.next_cursor is not None
+
+
+class TimestampCursorPaginator:
+    """
+    Paginates a queryset by keyset over a TimestampField and the primary key.
+
+    Django's Paginator selects each page with OFFSET, which reads and discards all the rows of the
+    preceding pages, so that the latency of a page grows with its depth. Moreover, rows inserted
+    meanwhile shift the pages of a feed. This paginator instead orders the rows by the
+    TimestampField and, among equal timestamps, by primary key and resumes after the last row of
+    the previous page, encoded in an opaque cursor. Each page is then a range scan of an index on
+    both columns, of the same cost at any depth. The primary key of an InnoDB table is part of each
+    secondary index, so in MySQL an index on the TimestampField suffices. PostgreSQL and SQLite
+    require a composite index, e.g. Meta.indexes = [Index(fields=['created', 'id'])].
+
+    The position is compared with a row value, "(created, id) > (%s, %s)", where the database uses
+    indexes for it, and otherwise with the equivalent expanded form,
+    "created >= %s AND (created > %s OR (created = %s AND id > %s))". See RowValueComparison.
+
+    Only following pages can be requested and there are neither page numbers nor a total count,
+    which would require scanning all rows. The TimestampField should not be null.
+
+    See:
+        https://use-the-index-luke.com/no-offset
+        https://docs.djangoproject.com/en/dev/topics/pagination/
+
+    """
+
+    def __init__(self, object_list, field_name, per_page, descending=False):
+        """
+        Args:
+            object_list: The queryset to paginate.
+            field_name (str): The name of a TimestampField of the queryset's model.
+            per_page (int): The maximum number of objects per page. May be None if only
+                get_queryset() is used.
+            descending (boolean): When true, the newest objects come first.
+
+        Raises:
+            ValueError: If the field is not a TimestampField or if per_page is less than 1.
+
+        """
+        if per_page is not None and per_page < 1:
+            raise ValueError('The number of objects per page must be positive.')
+        self.field = object_list.model._meta.get_field(field_name)
+        if not isinstance(self.field, TimestampField):
+            raise ValueError(
+                'The field {!s} of the model {!s} is not a TimestampField.'.format(
+                    field_name,
+                    object_list.model._meta.label
+                )
+            )
+        self.descending = descending
+        self.object_list = object_list
+        self.per_page = per_page
+
+    def decode_cursor(self, cursor):
+        """
+        Decode a cursor into the timestamp and primary key of the last object of a page.
+
+        Args:
+            cursor (str): The cursor.
+
+        Returns:
+            tuple: The timestamp and the primary key.
+
+        Raises:
+            django.core.paginator.InvalidPage: If the cursor is malformed.
+
+        """
+        try:
+            value, pk = json.loads(
+                base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4)).decode('utf-8')
+            )
+            return (
+                self.field.to_python(value),
+                self.object_list.model._meta.pk.to_python(pk)
+            )
+        except (binascii.Error, django.core.exceptions.ValidationError, TypeError,
+                UnicodeDecodeError, ValueError):
+            raise django.core.paginator.InvalidPage('The cursor is invalid.')
+
+    def encode_cursor(self, obj):
+        """
+        Encode the position of an object in an opaque cursor.
+
+        Args:
+            obj: The model instance.
+
+        Returns:
+            str: The URL-safe cursor.
+
+        """
+        position = [
+            self.field.value_to_string(obj),
+            self.object_list.model._meta.pk.value_to_string(obj)
+        ]
+        return base64.urlsafe_b64encode(
+            json.dumps(position, separators=(',', ':')).encode('utf-8')
+        ).decode('ascii').rstrip('=')
+
+    def get_queryset(self, cursor=None):
+        """
+        Return the ordered queryset of the objects following the cursor.
+
+        The queryset is not sliced, so it can also be iterated in full, e.g. with iterator().
+
+        Args:
+            cursor (str): The cursor of the last object already retrieved. When None, starts with
+                the first object.
+
+        Returns:
+            The Django queryset.
+
+        Raises:
+            django.core.paginator.InvalidPage: If the cursor is malformed.
+
+        """
+        prefix = '-' if self.descending else ''
+        queryset = self.object_list.order_by(prefix + self.field.name, prefix + 'pk')
+        if cursor is None:
+            return queryset
+
+        value, pk = self.decode_cursor(cursor)
+        if RowValueComparison.supports_row_values(django.db.connections[queryset.db]):
+            return queryset.filter(
+                RowValueComparison(
+                    [self.field.name, 'pk'],
+                    [value, pk],
+                    operator='<' if self.descending else '>'
+                )
+            )
+
+        # The leading inclusive comparison bounds the index range scanned for the disjunction.
+        lookup = 'lt' if self.descending else 'gt'
+        return queryset.filter(
+            django.db.models.Q(**{'{!s}__{!s}e'.format(self.field.name, lookup): value}),
+            django.db.models.Q(**{'{!s}__{!s}'.format(self.field.name, lookup): value})
+            | django.db.models.Q(**{self.field.name: value, 'pk__' + lookup: pk})
+        )
+
+    def page(self, cursor=None):
+        """
+        Return the page of objects following the cursor.
+
+        One row more than per_page is selected to determine whether a following page exists.
+
+        Args:
+            cursor (str): The next_cursor of the previous page. When None, returns the first page.
+
+        Returns:
+            TimestampCursorPage: The page.
+
+        Raises:
+            django.core.paginator.InvalidPage: If the cursor is malformed.
+            ValueError: If the paginator has no per_page.
+
+        """
+        if self.per_page is None:
+            raise ValueError('per_page is required to build pages')
+
+        object_list = list(self.get_queryset(cursor)[:self.per_page + 1])
+        next_cursor = None
+        if len(object_list) > self.per_page:
+            object_list = object_list[:self.per_page]
+            next_cursor = self.encode_cursor(object_list[-1])
+        return TimestampCursorPage(object_list, next_cursor, self)
+
+    def pages(self, cursor=None):
+        """
+        Iterate over the pages following the cursor up to the last page.
+
+        Args:
+            cursor (str): The cursor at which to start. When None, starts with the first page.
+
+        Yields:
+            TimestampCursorPage: Each page.
+
+        """
+        while True:
+            page = self.page(cursor)
+            yield page
+            if not page.has_next():
+                return
+            cursor = page.next_cursor
+
+
+class OmitDBDefaultsQuerySetMixin:
+    """
+    A QuerySet class mixin that omits fields from INSERT statements when their DEFAULT applies.
+
+    The field classes in this module emit DEFAULT clauses in their column DDL, yet the ORM still
+    sends every field's value in every INSERT statement. This mixin removes from the INSERT column
+    list each field whose DefaultValueMixin.is_db_default() reports that the database would produce
+    the same value, reducing the size of the statement and its parameters. The ORM is otherwise
+    unaware of the omission: pre_save() is still called for the omitted fields so that model
+    instance attributes are set exactly as they would be otherwise.
+
+    In QuerySet.bulk_create(), a field is only omitted if it may be omitted for every instance in
+    the batch. Raw inserts, such as those performed when loading fixtures, are left untouched.
+
+    Django's schema editor drops the default of a column added to an existing table. Fields added
+    by migrations keep their DEFAULT clause only if the schema editor includes
+    DefaultValueSchemaEditorMixin.
+
+    Model.save() performs inserts through the model's base manager. To apply this mixin to save(),
+    set the model's Meta.base_manager_name to a manager using a QuerySet class that includes it.
+
+    See:
+        https://docs.djangoproject.com/en/dev/topics/db/managers/#base-managers
+        https://github.com/django/django/blob/master/django/db/models/query.py
+
+    """
+
+    def _insert(self, objs, fields, *args, **kwargs):
+        """
+        Override the private QuerySet._insert(), through which both Model.save() and
+        QuerySet.bulk_create() perform their inserts.
+
+        """
+        if not kwargs.get('raw'):
+            connection = django.db.connections[kwargs.get('using') or self.db]
+            omitted_fields = [
+                field for field in fields
+                if isinstance(field, DefaultValueMixin)
+                and all(field.is_db_default(obj, connection) for obj in objs)
+            ]
+            for field in omitted_fields:
+                for obj in objs:
+                    field.pre_save(obj, add=True)
+            fields = [field for field in fields if field not in omitted_fields]
+
+        return super()._insert(objs, fields, *args, **kwargs)
+
+
+class DirtyFieldsModelMixin:
+    """
+    A Model class mixin with which Model.save() only writes the columns that changed.
+
+    Model.save() normally writes every column of the row, multiplying write amplification and the
+    volume of the binary log or WAL for wide rows. This mixin records the field values of model
+    instances loaded from the database. Model.save() then passes as update_fields only the fields
+    whose values changed, plus the model's auto_now and auto_now_update fields. If no field
+    changed, the UPDATE statement is skipped entirely, along with the pre_save and post_save
+    signals, unless force_update is given.
+
+    Values are compared by equality. Lists, dicts, and sets, such as those of JSON fields, are
+    recorded as deep copies so that in-place changes are detected as well.
+
+    Inserts, saves with explicit update_fields, force_insert, or a changed primary key, and saves
+    of instances that were not loaded from the database are performed by Django as usual. Unlike a
+    normal save, a save with changed fields raises DatabaseError if the row no longer exists.
+
+    See:
+        https://docs.djangoproject.com/en/dev/ref/models/instances/#customizing-model-loading
+        https://docs.djangoproject.com/en/dev/ref/models/instances/#specifying-which-fields-to-save
+
+    """
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        """
+        Override from_db() to record the loaded field values.
+
+        """
+        instance = super().from_db(db, field_names, values)
+        instance._loaded_values = instance._get_field_values()
+        return instance
+
+    def _get_field_values(self, attnames=None):
+        """
+        Return the current values of the instance's loaded concrete fields.
+
+        Args:
+            attnames (iterable): The attribute names of the fields. Defaults to all fields.
+
+        Returns:
+            dict: The values keyed by field attribute name.
+
+        """
+        if attnames is None:
+            attnames = [field.attname for field in self._meta.concrete_fields]
+        field_values = {}
+        for attname in attnames:
+            if attname in self.__dict__:
+                value = self.__dict__[attname]
+                if isinstance(value, (dict, list, set)):
+                    value = copy.deepcopy(value)
+                field_values[attname] = value
+        return field_values
+
+    def get_changed_fields(self):
+        """
+        Return the names of the fields whose values changed since the instance was loaded.
+
+        Fields that were deferred when loaded and have since been assigned count as changed.
+
+        Returns:
+            list: A list of field names, or None if the instance was not loaded from the database.
+
+        """
+        loaded_values = getattr(self, '_loaded_values', None)
+        if loaded_values is None:
+            return None
+
+        return [
+            field.name for field in self._meta.concrete_fields
+            if field.attname in self.__dict__ and (
+                field.attname not in loaded_values
+                or self.__dict__[field.attname] != loaded_values[field.attname]
+            )
+        ]
+
+    def refresh_from_db(self, using=None, fields=None, **kwargs):
+        """
+        Override refresh_from_db() to record the reloaded field values.
+
+        Deferred fields are loaded through this method as well.
+
+        """
+        super().refresh_from_db(using=using, fields=fields, **kwargs)
+        if getattr(self, '_loaded_values', None) is not None:
+            attnames = None
+            if fields is not None:
+                attnames = [self._meta.get_field(name).attname for name in fields]
+            self._loaded_values.update(self._get_field_values(attnames))
+
+    def save(self, *args, **kwargs):
+        """
+        Override save() to only write changed fields and automatic timestamps.
+
+        Positional arguments are accepted in the order of Model.save()'s keyword arguments. A save
+        with force_update writes the row even if no field changed.
+
+        """
+        argument_names = ('force_insert', 'force_update', 'using', 'update_fields')
+        if len(args) > len(argument_names):
+            raise TypeError('save() takes at most {:d} positional arguments.'.format(
+                len(argument_names)
+            ))
+        kwargs.update(zip(argument_names, args))
+        using = kwargs.get('using')
+
+        changed_fields = self.get_changed_fields()
+        if changed_fields is not None and kwargs.get('update_fields') is None \
+                and not kwargs.get('force_insert') and not self._state.adding \
+                and self._meta.pk.name not in changed_fields \
+                and (using is None or using == self._state.db):
+            if changed_fields:
+                # Django's own DateField and DateTimeField auto_now options are honored as well.
+                kwargs['update_fields'] = changed_fields + [
+                    field.name for field in self._meta.concrete_fields
+                    if (
+                        getattr(field, 'auto_now', False)
+                        or getattr(field, 'auto_now_update', False)
+                    ) and field.name not in changed_fields
+                ]
+            elif not kwargs.get('force_update'):
+                return
+
+        super().save(**kwargs)
+        self._loaded_values = self._get_field_values()
@@ -0,0 +1,83 @@
+"""
+Benchmark of TimestampQuerySet.bulk_create() against QuerySet.bulk_create().
+
+The module name does not match the test runner's default "test*.py" pattern, so the benchmark is
+not part of the test suite. Run it explicitly:
+
+    python src/manage.py test tests.benchmark_bulk_create
+
+"""
+
+
+import statistics
+import time
+
+import django.db
+import django.db.models
+import django.test
+
+import django_forcedfields
+from . import models as test_models
+from . import utils as test_utils
+
+
+BENCHMARK_BATCH_SIZE = 5000
+BENCHMARK_REPEAT = 5
+BENCHMARK_ROW_COUNT = 50000
+
+
+class BenchmarkBulkCreate(django.test.TransactionTestCase):
+    """
+    Compares the bulk insert throughput of rows with automatic timestamps.
+
+    With Django's QuerySet, TimestampField.pre_save() assigns a new Now() expression to each
+    instance, which the SQL compiler then resolves and compiles. TimestampQuerySet compiles one
+    expression for the whole batch. TSBulkRecord has two automatic TimestampFields and no other
+    columns, so that the expression handling dominates the measurement.
+
+    """
+
+    multi_db = True
+
+    def _measure(self, queryset):
+        """
+        Measure the median throughput of bulk inserts.
+
+        Args:
+            queryset: The Django queryset whose bulk_create() method to measure.
+
+        Returns:
+            float: The median number of rows inserted per second.
+
+        """
+        rates = []
+        for _ in range(BENCHMARK_REPEAT):
+            objs = [queryset.model() for _ in range(BENCHMARK_ROW_COUNT)]
+            start = time.perf_counter()
+            queryset.bulk_create(objs, batch_size=BENCHMARK_BATCH_SIZE)
+            rates.append(BENCHMARK_ROW_COUNT / (time.perf_counter() - start))
+            queryset.all().delete()
+        return statistics.median(rates)
+
+    def test_throughput(self):
+        """
+        Benchmark both querysets on each database and report their throughput.
+
+        """
+        model_class = test_models.TSBulkRecord
+        results = []
+        for db_alias in test_utils.get_db_aliases():
+            vendor = django.db.connections[db_alias].vendor
+            for queryset_class in (
+                    django.db.models.QuerySet,
+                    django_forcedfields.TimestampQuerySet):
+                rate = self._measure(queryset_class(model_class, using=db_alias))
+                results.append((vendor, queryset_class.__name__, rate))
+
+        print('\n{:d} rows in batches of {:d}'.format(BENCHMARK_ROW_COUNT, BENCHMARK_BATCH_SIZE))
+        print('{:<12}{:<20}{:>16}'.format('database', 'queryset', 'rows/s'))
+        for vendor, queryset_class_name, rate in results:
+            print('{:<12}{:<20}{:>16,.0f}'.format(vendor, queryset_class_name, rate))
+
+        for index in range(0, len(results), 2):
+            self.assertGreater(results[index + 1][2], results[index][2])
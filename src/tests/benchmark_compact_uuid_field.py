@@ -0,0 +1,95 @@
+"""
+Benchmark of CompactUUIDField against Django's UUIDField.
+
+The module name does not match the test runner's default "test*.py" pattern, so the benchmark is
+not part of the test suite. Run it explicitly:
+
+    python src/manage.py test tests.benchmark_compact_uuid_field
+
+"""
+
+
+# Accessing models' _meta attribute violates pylint rule.
+# pylint: disable=protected-access
+
+
+import statistics
+import time
+import uuid
+
+import django.db
+import django.test
+
+from . import models as test_models
+from . import utils as test_utils
+
+
+BENCHMARK_BATCH_SIZE = 1000
+BENCHMARK_LOOKUP_COUNT = 2000
+BENCHMARK_ROW_COUNT = 100000
+
+
+class BenchmarkCompactUUIDField(django.test.TransactionTestCase):
+    """
+    Compares the insert and point lookup throughput of CompactUUIDField and UUIDField primary keys.
+
+    CUKeyRecord and CUStandardKeyRecord differ only in the class of their fields. Random version 4
+    UUIDs are inserted with bulk_create() in batches, which spreads the inserts over the whole
+    primary key index as in a production table keyed by UUIDs. Point lookups select rows by
+    primary key in random order.
+
+    """
+
+    multi_db = True
+
+    def _measure(self, db_alias, model_class):
+        """
+        Measure the insert and point lookup throughput of a model.
+
+        Args:
+            db_alias (str): The database alias.
+            model_class (class): The model class.
+
+        Returns:
+            tuple: The rows inserted per second and the median lookups per second.
+
+        """
+        queryset = model_class.objects.using(db_alias)
+        keys = [uuid.uuid4() for _ in range(BENCHMARK_ROW_COUNT)]
+
+        start = time.perf_counter()
+        for index in range(0, BENCHMARK_ROW_COUNT, BENCHMARK_BATCH_SIZE):
+            queryset.bulk_create([
+                model_class(id=key) for key in keys[index:index + BENCHMARK_BATCH_SIZE]
+            ])
+        insert_rate = BENCHMARK_ROW_COUNT / (time.perf_counter() - start)
+
+        latencies = []
+        for key in keys[::BENCHMARK_ROW_COUNT // BENCHMARK_LOOKUP_COUNT]:
+            start = time.perf_counter()
+            queryset.get(pk=key)
+            latencies.append(time.perf_counter() - start)
+
+        return insert_rate, 1 / statistics.median(latencies)
+
+    def test_throughput(self):
+        """
+        Benchmark both fields on each database and report their insert and lookup throughput.
+
+        """
+        results = []
+        for db_alias in test_utils.get_db_aliases():
+            vendor = django.db.connections[db_alias].vendor
+            for model_class in (test_models.CUKeyRecord, test_models.CUStandardKeyRecord):
+                field_class = model_class._meta.pk.__class__.__name__
+                results.append((vendor, field_class) + self._measure(db_alias, model_class))
+
+        print('\n{:d} rows'.format(BENCHMARK_ROW_COUNT))
+        print('{:<12}{:<20}{:>16}{:>16}'.format('database', 'field', 'inserts/s', 'lookups/s'))
+        for vendor, field_class, insert_rate, lookup_rate in results:
+            print('{:<12}{:<20}{:>16,.0f}{:>16,.0f}'.format(
+                vendor,
+                field_class,
+                insert_rate,
+                lookup_rate
+            ))
@@ -0,0 +1,160 @@
+"""
+Benchmark of FixedCharField character sets in MySQL.
+
+The module name does not match the test runner's default "test*.py" pattern, so the benchmark is
+not part of the test suite. Run it explicitly:
+
+    python src/manage.py test tests.benchmark_fixed_char_field
+
+"""
+
+
+# Accessing models' _meta attribute violates pylint rule.
+# pylint: disable=protected-access
+
+
+import statistics
+import time
+
+import django.db
+import django.test
+
+import django_forcedfields
+from . import models as test_models
+from . import utils as test_utils
+
+
+BENCHMARK_BATCH_SIZE = 10000
+BENCHMARK_DIGITS = '0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ'
+BENCHMARK_LOOKUP_COUNT = 1000
+BENCHMARK_ROW_COUNT = 500000
+
+
+def get_code(number):
+    """
+    Encode a number as a code of FC_DEFAULT_MAX_LENGTH base 36 digits.
+
+    Args:
+        number (int): A number less than 36 ** FC_DEFAULT_MAX_LENGTH.
+
+    Returns:
+        str: The code.
+
+    """
+    digits = []
+    for _ in range(test_utils.FC_DEFAULT_MAX_LENGTH):
+        number, digit = divmod(number, len(BENCHMARK_DIGITS))
+        digits.append(BENCHMARK_DIGITS[digit])
+    return ''.join(reversed(digits))
+
+
+class BenchmarkFixedCharField(django.test.TransactionTestCase):
+    """
+    Compares the index size and point lookup latency of ascii and utf8mb4 CHAR columns.
+
+    The table is created with the model's ascii column, whose character set is then removed with
+    an altered field so that the column inherits the table's utf8mb4 character set. The index is
+    rebuilt by the ALTER TABLE statement. Index sizes are read from InnoDB's persistent statistics
+    after ANALYZE TABLE.
+
+    See:
+        https://dev.mysql.com/doc/refman/en/innodb-persistent-stats.html
+
+    """
+
+    multi_db = True
+
+    def _measure(self, connection, model_class, field):
+        """
+        Measure the size of the field's index and the median latency of a point lookup.
+
+        Args:
+            connection: The Django connection object.
+            model_class (class): The model class.
+            field: The model's FixedCharField instance.
+
+        Returns:
+            tuple: The character set name, the index size in bytes, and the median latency in
+                milliseconds.
+
+        """
+        charset_sql = """
+            SELECT
+                LOWER(`CHARACTER_SET_NAME`)
+            FROM
+                `information_schema`.`COLUMNS`
+            WHERE
+                `TABLE_SCHEMA` = DATABASE()
+                AND `TABLE_NAME` = %s
+                AND `COLUMN_NAME` = %s
+        """
+        size_sql = """
+            SELECT
+                SUM(`stat_value`) * @@innodb_page_size
+            FROM
+                `mysql`.`innodb_index_stats`
+            WHERE
+                `database_name` = DATABASE()
+                AND `table_name` = %s
+                AND `index_name` != 'PRIMARY'
+                AND `stat_name` = 'size'
+        """
+        queryset = model_class.objects.using(test_utils.ALIAS_MYSQL)
+        step = BENCHMARK_ROW_COUNT // BENCHMARK_LOOKUP_COUNT
+
+        latencies = []
+        with connection.cursor() as cursor:
+            cursor.execute(
+                'ANALYZE TABLE {!s}'.format(connection.ops.quote_name(model_class._meta.db_table))
+            )
+            cursor.fetchall()
+            cursor.execute(charset_sql, [model_class._meta.db_table, field.column])
+            charset = cursor.fetchone()[0]
+            cursor.execute(size_sql, [model_class._meta.db_table])
+            index_size = int(cursor.fetchone()[0])
+        for number in range(0, BENCHMARK_ROW_COUNT, step):
+            start = time.perf_counter()
+            queryset.filter(**{field.name: get_code(number)}).exists()
+            latencies.append((time.perf_counter() - start) * 1000)
+
+        return charset, index_size, statistics.median(latencies)
+
+    def test_charset(self):
+        """
+        Benchmark ascii and utf8mb4 columns and report their index size and point lookup latency.
+
+        """
+        model_class = test_models.FCCharsetRecord
+        connection = django.db.connections[test_utils.ALIAS_MYSQL]
+        old_field = model_class._meta.get_field(test_utils.FC_FIELD_ATTRNAME)
+
+        results = []
+        try:
+            for start in range(0, BENCHMARK_ROW_COUNT, BENCHMARK_BATCH_SIZE):
+                model_class.objects.using(test_utils.ALIAS_MYSQL).bulk_create([
+                    model_class(fc_field_1=get_code(number))
+                    for number in range(start, start + BENCHMARK_BATCH_SIZE)
+                ])
+            results.append(self._measure(connection, model_class, old_field))
+
+            new_field = django_forcedfields.FixedCharField(
+                db_index=True,
+                max_length=test_utils.FC_DEFAULT_MAX_LENGTH
+            )
+            new_field.set_attributes_from_name(test_utils.FC_FIELD_ATTRNAME)
+            new_field.model = model_class
+            with connection.schema_editor() as schema_editor:
+                schema_editor.alter_field(model_class, old_field, new_field)
+            results.append(self._measure(connection, model_class, new_field))
+        finally:
+            with connection.schema_editor() as schema_editor:
+                schema_editor.delete_model(model_class)
+                schema_editor.create_model(model_class)
+
+        print('\n{:d} rows'.format(BENCHMARK_ROW_COUNT))
+        print('{:<10}{:>16}{:>24}'.format('charset', 'size (bytes)', 'median latency (ms)'))
+        for charset, index_size, latency in results:
+            print('{:<10}{:>16,d}{:>24.3f}'.format(charset, index_size, latency))
+
+        self.assertEqual(results[0][0], test_utils.FC_CHARSET)
+        self.assertLess(results[0][1], results[1][1])
@@ -0,0 +1,142 @@
+"""
+Benchmark of the TimestampField index types in PostgreSQL.
+
+The module name does not match the test runner's default "test*.py" pattern, so the benchmark is
+not part of the test suite. Run it explicitly:
+
+    python src/manage.py test tests.benchmark_index_type
+
+"""
+
+
+# Accessing models' _meta attribute violates pylint rule.
+# pylint: disable=protected-access
+
+
+import datetime
+import statistics
+import time
+
+import django.db
+import django.test
+
+import django_forcedfields
+from . import models as test_models
+from . import utils as test_utils
+
+
+BENCHMARK_REPEAT = 20
+BENCHMARK_ROW_COUNT = 1000000
+BENCHMARK_START = datetime.datetime(2000, 1, 1)
+
+
+class BenchmarkIndexType(django.test.TransactionTestCase):
+    """
+    Compares the size and range scan latency of btree and BRIN indexes on an append-only column.
+
+    Rows are inserted with timestamps increasing by one second, so that their physical order
+    matches their timestamps as with an auto_now_add column. The table is created with the model's
+    BRIN index, which is then altered to a btree index with TimestampIndexSchemaEditorMixin. Each
+    range scan selects one hour of rows. Sequential scans are disabled as in
+    TestFixedCharField.test_lookup_index_scan_postgresql() so that each index type is measured.
+
+    """
+
+    multi_db = True
+
+    def _measure(self, connection, model_class, field):
+        """
+        Measure the size of the field's index and the median latency of a range scan.
+
+        Args:
+            connection: The Django connection object.
+            model_class (class): The model class.
+            field: The model's TimestampField instance.
+
+        Returns:
+            tuple: The index size in bytes and the median latency in milliseconds.
+
+        """
+        sql_string = """
+            SELECT
+                pg_relation_size(indexrelid)
+            FROM
+                pg_index
+                JOIN pg_attribute ON attrelid = indrelid AND attnum = ANY(indkey)
+            WHERE
+                indrelid = %s::regclass
+                AND attname = %s
+        """
+        queryset = model_class.objects.using(test_utils.ALIAS_POSTGRESQL).filter(**{
+            field.name + '__range': (
+                BENCHMARK_START + datetime.timedelta(days=1),
+                BENCHMARK_START + datetime.timedelta(days=1, hours=1)
+            )
+        })
+
+        latencies = []
+        with connection.cursor() as cursor:
+            cursor.execute(sql_string, [model_class._meta.db_table, field.column])
+            index_size = cursor.fetchone()[0]
+            cursor.execute('SET enable_seqscan = off')
+            try:
+                for _ in range(BENCHMARK_REPEAT):
+                    start = time.perf_counter()
+                    queryset.count()
+                    latencies.append((time.perf_counter() - start) * 1000)
+            finally:
+                cursor.execute('RESET enable_seqscan')
+
+        return index_size, statistics.median(latencies)
+
+    def test_index_type(self):
+        """
+        Benchmark BRIN and btree indexes and report their size and range scan latency.
+
+        """
+        model_class = test_models.TSBrinRecord
+        connection = django.db.connections[test_utils.ALIAS_POSTGRESQL]
+        old_field = model_class._meta.get_field(test_utils.TS_FIELD_ATTRNAME)
+        insert_sql = """
+            INSERT INTO {table!s} ({column!s})
+            SELECT %s + n * INTERVAL '1 second' FROM generate_series(1, %s) AS n
+        """.format(
+            table=connection.ops.quote_name(model_class._meta.db_table),
+            column=connection.ops.quote_name(old_field.column)
+        )
+
+        results = {}
+        with test_utils.get_schema_editor(
+            connection,
+            django_forcedfields.TimestampIndexSchemaEditorMixin
+        ) as schema_editor:
+            schema_editor.delete_model(model_class)
+            schema_editor.create_model(model_class)
+        try:
+            with connection.cursor() as cursor:
+                cursor.execute(insert_sql, [BENCHMARK_START, BENCHMARK_ROW_COUNT])
+                cursor.execute(
+                    'ANALYZE {!s}'.format(connection.ops.quote_name(model_class._meta.db_table))
+                )
+            results['brin'] = self._measure(connection, model_class, old_field)
+
+            new_field = django_forcedfields.TimestampField(db_index=True, index_type='btree')
+            new_field.set_attributes_from_name(test_utils.TS_FIELD_ATTRNAME)
+            new_field.model = model_class
+            with test_utils.get_schema_editor(
+                connection,
+                django_forcedfields.TimestampIndexSchemaEditorMixin
+            ) as schema_editor:
+                schema_editor.alter_field(model_class, old_field, new_field)
+            results['btree'] = self._measure(connection, model_class, new_field)
+        finally:
+            with connection.schema_editor() as schema_editor:
+                schema_editor.delete_model(model_class)
+                schema_editor.create_model(model_class)
+
+        print('\n{:d} rows'.format(BENCHMARK_ROW_COUNT))
+        print('{:<8}{:>16}{:>24}'.format('index', 'size (bytes)', 'median latency (ms)'))
+        for index_type, (index_size, latency) in results.items():
+            print('{:<8}{:>16,d}{:>24.3f}'.format(index_type, index_size, latency))
+
+        self.assertLess(results['brin'][0], results['btree'][0])
@@ -43,6 +43,7 @@ Note: The model class attribute "__module__" must be added to model class attrib
 """
 
 import sys
+import uuid
 
 import django.db.models
 
@@ -64,6 +65,19 @@ for test_config in test_utils.FC_TEST_CONFIGS:
     setattr(_THIS_MODULE, model_class_name, model_class)
 
 
+# Dynamically generate FixedBinaryField test models.
+for test_config in test_utils.FB_TEST_CONFIGS:
+    model_class_name = test_utils.get_fb_model_class_name(**test_config.kwargs_dict)
+    model_class_attributes = {
+        test_utils.FB_FIELD_ATTRNAME: django_forcedfields.FixedBinaryField(
+            **test_config.kwargs_dict
+        ),
+        '__module__': __name__
+    }
+    model_class = type(model_class_name, (django.db.models.Model,), model_class_attributes)
+    setattr(_THIS_MODULE, model_class_name, model_class)
+
+
 # Dynamically generate TimestampField test models.
 for config in test_utils.TS_TEST_CONFIGS:
     model_class_name = test_utils.get_ts_model_class_name(**config.kwargs_dict)
@@ -74,3 +88,267 @@ for config in test_utils.TS_TEST_CONFIGS:
     }
     model_class = type(model_class_name, (django.db.models.Model,), model_class_attributes)
     setattr(_THIS_MODULE, model_class_name, model_class)
+
+
+class FCIndexedRecord(django.db.models.Model):
+    """
+    A FixedCharField test model with an indexed column, used to test lookups and query plans.
+
+    """
+
+    fc_field_1 = django_forcedfields.FixedCharField(
+        db_index=True,
+        max_length=test_utils.FC_DEFAULT_MAX_LENGTH
+    )
+
+
+class FCStripPaddingRecord(django.db.models.Model):
+    """
+    A FixedCharField test model with the strip_padding option enabled.
+
+    """
+
+    fc_field_1 = django_forcedfields.FixedCharField(
+        max_length=test_utils.FC_DEFAULT_MAX_LENGTH,
+        strip_padding=True
+    )
+
+
+class FCInternRecord(django.db.models.Model):
+    """
+    A FixedCharField test model with a bounded intern table.
+
+    """
+
+    fc_field_1 = django_forcedfields.FixedCharField(
+        intern_cache_size=test_utils.FC_INTERN_CACHE_SIZE,
+        max_length=test_utils.FC_DEFAULT_MAX_LENGTH
+    )
+
+
+class FCCharsetRecord(django.db.models.Model):
+    """
+    A FixedCharField test model with an explicit character set.
+
+    """
+
+    fc_field_1 = django_forcedfields.FixedCharField(
+        charset=test_utils.FC_CHARSET,
+        db_index=True,
+        max_length=test_utils.FC_DEFAULT_MAX_LENGTH
+    )
+
+
+class CUKeyRecord(django.db.models.Model):
+    """
+    A CompactUUIDField test model using the field as its primary key.
+
+    """
+
+    id = django_forcedfields.CompactUUIDField(default=uuid.uuid4, primary_key=True)
+    cu_field_1 = django_forcedfields.CompactUUIDField(default=test_utils.CU_DEFAULT_VALUE)
+
+
+class CUForeignKeyRecord(django.db.models.Model):
+    """
+    A CompactUUIDField test model referencing a CompactUUIDField primary key.
+
+    """
+
+    cu_record = django.db.models.ForeignKey(CUKeyRecord, on_delete=django.db.models.CASCADE)
+
+
+class CUStandardKeyRecord(django.db.models.Model):
+    """
+    A counterpart of CUKeyRecord with Django's UUIDField, used to benchmark CompactUUIDField.
+
+    """
+
+    id = django.db.models.UUIDField(default=uuid.uuid4, primary_key=True)
+    cu_field_1 = django.db.models.UUIDField(default=test_utils.CU_DEFAULT_VALUE)
+
+
+class ULIDRecord(django.db.models.Model):
+    """
+    A ULIDField test model using the field as its primary key.
+
+    """
+
+    id = django_forcedfields.ULIDField(primary_key=True)
+    position = django.db.models.IntegerField(default=0)
+
+
+class UUID7Record(django.db.models.Model):
+    """
+    A UUID7Field test model using the field as its primary key.
+
+    """
+
+    id = django_forcedfields.UUID7Field(primary_key=True)
+    position = django.db.models.IntegerField(default=0)
+
+
+class TSBrinRecord(django.db.models.Model):
+    """
+    A TimestampField test model with an append-only column indexed by a BRIN index in PostgreSQL.
+
+    """
+
+    ts_field_1 = django_forcedfields.TimestampField(
+        auto_now_add=True,
+        db_index=True,
+        index_type='brin',
+        pages_per_range=test_utils.TS_PAGES_PER_RANGE
+    )
+
+
+class TSBulkRecord(django.db.models.Model):
+    """
+    A TimestampField test model with two automatic timestamps, used to benchmark bulk inserts.
+
+    """
+
+    ts_field_1 = django_forcedfields.TimestampField(auto_now_add=True)
+    ts_field_2 = django_forcedfields.TimestampField(auto_now=True)
+
+
+class TSIndexedRecord(django.db.models.Model):
+    """
+    A TimestampField test model with indexed columns of both storage modes, used to test lookups.
+
+    The datetime column stores milliseconds like the epoch_ms column, since MySQL would otherwise
+    round the lookup tests' values to the nearest second.
+
+    """
+
+    ts_field_1 = django_forcedfields.TimestampField(db_index=True, precision=3)
+    ts_field_2 = django_forcedfields.TimestampField(db_index=True, storage='epoch_ms')
+
+
+class TSCursorRecord(django.db.models.Model):
+    """
+    A TimestampField test model with (timestamp, primary key) indexes for keyset pagination.
+
+    """
+
+    ts_field_1 = django_forcedfields.TimestampField()
+    ts_field_2 = django_forcedfields.TimestampField(storage='epoch_ms')
+
+    class Meta:
+        indexes = [
+            django.db.models.Index(fields=['ts_field_1', 'id'], name='tscursor_ts_field_1_id_idx'),
+            django.db.models.Index(fields=['ts_field_2', 'id'], name='tscursor_ts_field_2_id_idx')
+        ]
+
+
+class TSPartitionedRecord(django.db.models.Model):
+    """
+    A TimestampField test model partitioned by month of its creation time.
+
+    A ULIDField primary key is used since PostgreSQL only supports identity columns, with which
+    Django creates AutoFields, in partitioned tables as of version 17.
+
+    """
+
+    id = django_forcedfields.ULIDField(primary_key=True)
+    ts_field_1 = django_forcedfields.TimestampField(
+        auto_now_add=True,
+        partition_interval=test_utils.TS_PARTITION_INTERVAL
+    )
+
+
+class TSYearPartitionedRecord(django.db.models.Model):
+    """
+    A TimestampField test model partitioned by year of its creation time.
+
+    """
+
+    id = django_forcedfields.ULIDField(primary_key=True)
+    ts_field_1 = django_forcedfields.TimestampField(auto_now_add=True, partition_interval='year')
+
+
+class TSManagedRecord(django.db.models.Model):
+    """
+    A TimestampField test model whose manager sets the current timestamp in QuerySet.update().
+
+    """
+
+    ts_field_1 = django_forcedfields.TimestampField(auto_now_update=True, null=True)
+    update_field_1 = django.db.models.SmallIntegerField(null=True)
+
+    objects = django_forcedfields.TimestampManager()
+
+
+class TSPrecisionRecord(django.db.models.Model):
+    """
+    A TimestampField test model with whole-second and default precision automatic timestamps.
+
+    """
+
+    ts_field_1 = django_forcedfields.TimestampField(auto_now=True, precision=0)
+    ts_field_2 = django_forcedfields.TimestampField(auto_now=True)
+    update_field_1 = django.db.models.SmallIntegerField(null=True)
+
+    objects = django_forcedfields.TimestampManager()
+
+
+class TSUpsertRecord(django.db.models.Model):
+    """
+    A TimestampField test model with a unique key for upserts.
+
+    """
+
+    key_field_1 = django.db.models.SmallIntegerField(unique=True)
+    ts_field_1 = django_forcedfields.TimestampField(auto_now_add=True)
+    ts_field_2 = django_forcedfields.TimestampField(auto_now_update=True, null=True)
+    update_field_1 = django.db.models.SmallIntegerField(null=True)
+
+    objects = django_forcedfields.TimestampManager()
+
+
+class TSReturningRecord(django_forcedfields.TimestampModelMixin, django.db.models.Model):
+    """
+    A TimestampField test model retrieving database-generated timestamps on insert and update.
+
+    """
+
+    ts_field_1 = django_forcedfields.TimestampField(auto_now=True)
+    update_field_1 = django.db.models.SmallIntegerField(null=True)
+
+
+class DirtyFieldsRecord(django_forcedfields.DirtyFieldsModelMixin, django.db.models.Model):
+    """
+    A test model whose saves only write changed fields and automatic timestamps.
+
+    """
+
+    fc_field_1 = django_forcedfields.FixedCharField(max_length=test_utils.FC_DEFAULT_MAX_LENGTH)
+    ts_field_1 = django_forcedfields.TimestampField(auto_now_update=True, null=True)
+    update_field_1 = django.db.models.SmallIntegerField(null=True)
+
+
+class OmitDBDefaultsQuerySet(
+        django_forcedfields.OmitDBDefaultsQuerySetMixin, django_forcedfields.TimestampQuerySet):
+    """
+    A QuerySet class omitting fields with applicable DDL DEFAULT clauses from INSERT statements.
+
+    """
+
+
+class OmitDBDefaultsRecord(django.db.models.Model):
+    """
+    A test model whose inserts omit fields with applicable DDL DEFAULT clauses, including in save().
+
+    """
+
+    fc_field_1 = django_forcedfields.FixedCharField(
+        default=test_utils.FC_DEFAULT_VALUE,
+        max_length=test_utils.FC_DEFAULT_MAX_LENGTH
+    )
+    ts_field_1 = django_forcedfields.TimestampField(auto_now_add=True)
+    update_field_1 = django.db.models.SmallIntegerField(null=True)
+
+    objects = django.db.models.Manager.from_queryset(OmitDBDefaultsQuerySet)()
+
+    class Meta:
+        base_manager_name = 'objects'
@@ -0,0 +1,154 @@
+"""
+Tests of CompactUUIDField.
+
+"""
+
+
+# Accessing models' _meta attribute violates pylint rule.
+# pylint: disable=protected-access
+
+
+import uuid
+
+import django.db
+import django.test
+
+import django_forcedfields as forcedfields
+from . import models as test_models
+from . import utils as test_utils
+
+
+class TestCompactUUIDField(django.test.TransactionTestCase):
+    """
+    Defines tests for the compact UUID field class.
+
+    This class inherits from TransactionTestCase for the same reasons as TestFixedCharField.
+
+    """
+
+    multi_db = True
+
+    def test_db_type(self):
+        """
+        Test output of the field's overridden "db_type" and "rel_db_type" methods.
+
+        Callable defaults must not produce a DEFAULT clause.
+
+        """
+        expected_db_types = {
+            test_utils.ALIAS_MYSQL: 'BINARY(16)',
+            test_utils.ALIAS_POSTGRESQL: 'UUID',
+            test_utils.ALIAS_SQLITE: 'BLOB'
+        }
+        expected_default_values = {
+            test_utils.ALIAS_MYSQL: 'X\'{!s}\''.format(test_utils.CU_DEFAULT_VALUE.hex),
+            test_utils.ALIAS_POSTGRESQL: '\'{!s}\''.format(test_utils.CU_DEFAULT_VALUE),
+            test_utils.ALIAS_SQLITE: 'X\'{!s}\''.format(test_utils.CU_DEFAULT_VALUE.hex)
+        }
+        for db_alias, expected_db_type in expected_db_types.items():
+            db_connection = django.db.connections[db_alias]
+            with self.subTest(backend=db_connection.settings_dict['ENGINE']):
+                field = forcedfields.CompactUUIDField()
+                self.assertEqual(field.db_type(db_connection), expected_db_type)
+                self.assertEqual(field.rel_db_type(db_connection), expected_db_type)
+
+                field = forcedfields.CompactUUIDField(default=uuid.uuid4)
+                self.assertEqual(field.db_type(db_connection), expected_db_type)
+
+                field = forcedfields.CompactUUIDField(default=test_utils.CU_DEFAULT_VALUE)
+                self.assertEqual(
+                    field.db_type(db_connection),
+                    '{!s} DEFAULT {!s}'.format(expected_db_type, expected_default_values[db_alias])
+                )
+                self.assertEqual(field.rel_db_type(db_connection), expected_db_type)
+
+    def test_foreign_key(self):
+        """
+        Test that foreign keys to a CompactUUIDField primary key share its data type and values.
+
+        """
+        for db_alias in test_utils.get_db_aliases():
+            db_connection = django.db.connections[db_alias]
+            with self.subTest(backend=db_connection.settings_dict['ENGINE']):
+                key_record = test_models.CUKeyRecord.objects.using(db_alias).create()
+                test_models.CUForeignKeyRecord.objects.using(db_alias).create(
+                    cu_record=key_record
+                )
+                fk_field = test_models.CUForeignKeyRecord._meta.get_field('cu_record')
+                retrieved_record = test_models.CUForeignKeyRecord.objects.using(db_alias) \
+                    .select_related('cu_record').get(cu_record=key_record)
+
+                self.assertEqual(
+                    fk_field.db_type(db_connection),
+                    test_models.CUKeyRecord._meta.pk.rel_db_type(db_connection)
+                )
+                self.assertEqual(retrieved_record.cu_record_id, key_record.id)
+                self.assertEqual(retrieved_record.cu_record.id, key_record.id)
+
+    def test_lookups(self):
+        """
+        Test that lookups accept both uuid.UUID instances and their string representations.
+
+        """
+        for db_alias in test_utils.get_db_aliases():
+            db_connection = django.db.connections[db_alias]
+            with self.subTest(backend=db_connection.settings_dict['ENGINE']):
+                key_record = test_models.CUKeyRecord.objects.using(db_alias).create()
+                queryset = test_models.CUKeyRecord.objects.using(db_alias)
+
+                self.assertTrue(queryset.filter(id=key_record.id).exists())
+                self.assertTrue(queryset.filter(id=str(key_record.id)).exists())
+                self.assertTrue(queryset.filter(id__in=[key_record.id.hex]).exists())
+                self.assertFalse(queryset.filter(id=uuid.uuid4()).exists())
+
+    def test_round_trip(self):
+        """
+        Test that saved values are retrieved as equal uuid.UUID instances.
+
+        """
+        for db_alias in test_utils.get_db_aliases():
+            db_connection = django.db.connections[db_alias]
+            with self.subTest(backend=db_connection.settings_dict['ENGINE']):
+                key_record = test_models.CUKeyRecord.objects.using(db_alias).create()
+                retrieved_record = test_models.CUKeyRecord.objects.using(db_alias) \
+                    .get(id=key_record.id)
+
+                self.assertIsInstance(retrieved_record.id, uuid.UUID)
+                self.assertEqual(retrieved_record.id, key_record.id)
+                self.assertEqual(
+                    getattr(retrieved_record, test_utils.CU_FIELD_ATTRNAME),
+                    test_utils.CU_DEFAULT_VALUE
+                )
+
+    def test_table_structure_mysql(self):
+        """
+        Test the creation of compact UUID field in MySQL/MariaDB.
+
+        See TestFixedCharField.test_table_structure_mysql().
+
+        """
+        connection = django.db.connections[test_utils.ALIAS_MYSQL]
+
+        sql_string = """
+            SELECT
+                LOWER(`DATA_TYPE`) AS `DATA_TYPE`,
+                `CHARACTER_OCTET_LENGTH`
+            FROM
+                `information_schema`.`COLUMNS`
+            WHERE
+                `TABLE_SCHEMA` = %s
+                AND `TABLE_NAME` = %s
+                AND `COLUMN_NAME` = %s
+        """
+        sql_params = [
+            connection.settings_dict['NAME'],
+            test_models.CUKeyRecord._meta.db_table,
+            test_utils.CU_FIELD_ATTRNAME
+        ]
+
+        with connection.cursor() as cursor:
+            cursor.execute(sql_string, sql_params)
+            record = cursor.fetchone()
+
+        self.assertEqual(record[0], 'binary')
+        self.assertEqual(record[1], 16)
@@ -0,0 +1,270 @@
+"""
+Tests of FixedBinaryField.
+
+"""
+
+
+# Accessing models' _meta attribute violates pylint rule.
+# pylint: disable=protected-access
+
+
+import django.db
+import django.test
+
+import django_forcedfields as forcedfields
+from . import models as test_models
+from . import utils as test_utils
+
+
+class TestFixedBinaryField(
+        django.test.TransactionTestCase, test_utils.FieldTestConfigUtilityMixin):
+    """
+    Defines tests for the fixed binary field class.
+
+    This class inherits from TransactionTestCase for the same reasons as TestFixedCharField.
+    Database-level exceptions such as django.db.utils.IntegrityError are intentionally raised and
+    caught as a normal part of tests.
+
+    """
+
+    multi_db = True
+
+    def test_db_check(self):
+        """
+        Test output of the field's overridden "db_check" method.
+
+        MySQL enforces the length through the BINARY(n) data type and needs no CHECK constraint.
+
+        """
+        field = forcedfields.FixedBinaryField(max_length=test_utils.FB_DEFAULT_MAX_LENGTH)
+        field.set_attributes_from_name(test_utils.FB_FIELD_ATTRNAME)
+        expected_db_checks = {
+            test_utils.ALIAS_POSTGRESQL: 'octet_length("{!s}") = {!s}'.format(
+                test_utils.FB_FIELD_ATTRNAME,
+                test_utils.FB_DEFAULT_MAX_LENGTH
+            ),
+            test_utils.ALIAS_SQLITE: 'length("{!s}") = {!s}'.format(
+                test_utils.FB_FIELD_ATTRNAME,
+                test_utils.FB_DEFAULT_MAX_LENGTH
+            )
+        }
+        for db_alias, expected_db_check in expected_db_checks.items():
+            db_connection = django.db.connections[db_alias]
+            with self.subTest(backend=db_connection.settings_dict['ENGINE']):
+                self.assertEqual(field.db_check(db_connection), expected_db_check)
+
+    def test_db_type(self):
+        """
+        Test simple output of the field's overridden "db_type" method.
+
+        """
+        for test_config in test_utils.FB_TEST_CONFIGS:
+            field_kwarg_string = test_utils.create_dict_string(test_config.kwargs_dict)
+            for db_alias in test_utils.get_db_aliases():
+                db_connection = django.db.connections[db_alias]
+                db_backend = db_connection.settings_dict['ENGINE']
+                with self.subTest(backend=db_backend, kwargs=field_kwarg_string):
+                    field = forcedfields.FixedBinaryField(**test_config.kwargs_dict)
+                    returned_db_type = field.db_type(db_connection)
+                    expected_db_type = test_config.db_type_dict[db_alias]
+
+                    self.assertEqual(returned_db_type, expected_db_type)
+
+    def test_field_argument_check(self):
+        """
+        Ensure that max_length is required.
+
+        See:
+            https://docs.djangoproject.com/en/dev/topics/checks/
+
+        """
+        for max_length in [None, 0, '4']:
+            with self.subTest(max_length=max_length):
+                field = forcedfields.FixedBinaryField(max_length=max_length)
+                check_results = field._check_max_length_attribute()
+
+                self.assertEqual(len(check_results), 1)
+                self.assertEqual(check_results[0].id, 'django_forcedfields.E180')
+
+    def test_insert(self):
+        """
+        Test that insert operations produce expected results.
+
+        """
+        for test_config in test_utils.FB_TEST_CONFIGS:
+            kwargs_string = test_utils.create_dict_string(test_config.kwargs_dict)
+            model_class_name = test_utils.get_fb_model_class_name(**test_config.kwargs_dict)
+            model_class = getattr(test_models, model_class_name)
+            for insert_value, expected_value in test_config.insert_values_dict.items():
+                for db_alias in test_utils.get_db_aliases():
+                    db_backend = django.db.connections[db_alias].settings_dict['ENGINE']
+                    with self.subTest(
+                        backend=db_backend,
+                        kwargs=kwargs_string,
+                        insert_value=insert_value
+                    ):
+                        self._test_insert_dict(
+                            db_alias,
+                            model_class,
+                            test_utils.FB_FIELD_ATTRNAME,
+                            insert_value,
+                            expected_value
+                        )
+
+    def test_insert_short_value(self):
+        """
+        Test that values shorter than max_length are padded or rejected by the database.
+
+        MySQL right-pads BINARY(n) values with 0x00 bytes. PostgreSQL and SQLite reject the value
+        through the CHECK constraint.
+
+        """
+        model_class_name = test_utils.get_fb_model_class_name(
+            **test_utils.FB_TEST_CONFIGS[0].kwargs_dict
+        )
+        model_class = getattr(test_models, model_class_name)
+        short_value = test_utils.FB_DEFAULT_VALUE[:-1]
+        expected_values = {
+            test_utils.ALIAS_MYSQL: short_value + b'\x00',
+            test_utils.ALIAS_POSTGRESQL: django.db.utils.IntegrityError,
+            test_utils.ALIAS_SQLITE: django.db.utils.IntegrityError
+        }
+        for db_alias, expected_value in expected_values.items():
+            db_backend = django.db.connections[db_alias].settings_dict['ENGINE']
+            with self.subTest(backend=db_backend):
+                self._test_insert_dict(
+                    db_alias,
+                    model_class,
+                    test_utils.FB_FIELD_ATTRNAME,
+                    short_value,
+                    expected_value
+                )
+
+    def test_retrieved_value_type(self):
+        """
+        Test that retrieved values are passed through from the driver without conversion.
+
+        Values must support the buffer protocol, i.e. be bytes or memoryview, without having been
+        copied into a new bytes object by the field.
+
+        """
+        model_class_name = test_utils.get_fb_model_class_name(
+            **test_utils.FB_TEST_CONFIGS[0].kwargs_dict
+        )
+        model_class = getattr(test_models, model_class_name)
+        for db_alias in test_utils.get_db_aliases():
+            db_backend = django.db.connections[db_alias].settings_dict['ENGINE']
+            with self.subTest(backend=db_backend):
+                model_kwargs = {test_utils.FB_FIELD_ATTRNAME: test_utils.FB_DEFAULT_VALUE}
+                model = model_class(**model_kwargs)
+                model.save(using=db_alias)
+                retrieved_value = model_class.objects.using(db_alias).values_list(
+                    test_utils.FB_FIELD_ATTRNAME,
+                    flat=True
+                ).get(id=model.id)
+
+                self.assertIsInstance(retrieved_value, (bytes, memoryview))
+                self.assertEqual(bytes(retrieved_value), test_utils.FB_DEFAULT_VALUE)
+
+    def test_table_structure_mysql(self):
+        """
+        Test the creation of fixed binary field in MySQL/MariaDB.
+
+        See TestFixedCharField.test_table_structure_mysql().
+
+        """
+        model_class_name = test_utils.get_fb_model_class_name(
+            **test_utils.FB_TEST_CONFIGS[2].kwargs_dict
+        )
+        model_class = getattr(test_models, model_class_name)
+        connection = django.db.connections[test_utils.ALIAS_MYSQL]
+
+        sql_string = """
+            SELECT
+                LOWER(`DATA_TYPE`) AS `DATA_TYPE`,
+                LOWER(`IS_NULLABLE`) AS `IS_NULLABLE`,
+                `CHARACTER_OCTET_LENGTH`
+            FROM
+                `information_schema`.`COLUMNS`
+            WHERE
+                `TABLE_SCHEMA` = %s
+                AND `TABLE_NAME` = %s
+                AND `COLUMN_NAME` = %s
+        """
+        sql_params = [
+            connection.settings_dict['NAME'],
+            model_class._meta.db_table,
+            model_class._meta.fields[1].get_attname_column()[1]
+        ]
+
+        with connection.cursor() as cursor:
+            cursor.execute(sql_string, sql_params)
+            record = cursor.fetchone()
+
+        self.assertEqual(record[0], 'binary')
+        self.assertEqual(record[1], 'no')
+        self.assertEqual(record[2], test_utils.FB_DEFAULT_MAX_LENGTH)
+
+    def test_table_structure_postgresql(self):
+        """
+        Test the creation of fixed binary field in PostgreSQL.
+
+        See TestFixedCharField.test_table_structure_postgresql().
+
+        """
+        model_class_name = test_utils.get_fb_model_class_name(
+            **test_utils.FB_TEST_CONFIGS[2].kwargs_dict
+        )
+        model_class = getattr(test_models, model_class_name)
+        connection = django.db.connections[test_utils.ALIAS_POSTGRESQL]
+
+        sql_string = """
+            SELECT
+                LOWER(data_type) AS data_type,
+                LOWER(is_nullable) AS is_nullable
+            FROM
+                information_schema.columns
+            WHERE
+                table_catalog = %s
+                AND table_name = %s
+                AND column_name = %s
+        """
+        sql_params = [
+            connection.settings_dict['NAME'],
+            model_class._meta.db_table,
+            model_class._meta.fields[1].get_attname_column()[1]
+        ]
+
+        with connection.cursor() as cursor:
+            cursor.execute(sql_string, sql_params)
+            record = cursor.fetchone()
+
+        self.assertEqual(record[0], 'bytea')
+        self.assertEqual(record[1], 'no')
+
+    def test_table_structure_sqlite(self):
+        """
+        Test correct DB table structures with sqlite3 backend.
+
+        See TestFixedCharField.test_table_structure_sqlite().
+
+        """
+        model_class_name = test_utils.get_fb_model_class_name(
+            **test_utils.FB_TEST_CONFIGS[2].kwargs_dict
+        )
+        model_class = getattr(test_models, model_class_name)
+        connection = django.db.connections[test_utils.ALIAS_SQLITE]
+
+        sql_string = 'PRAGMA table_info({!s})'.format(model_class._meta.db_table)
+
+        with connection.cursor() as cursor:
+            cursor.execute(sql_string)
+            records = cursor.fetchall()
+        record = records[1]
+
+        self.assertEqual(record[2], 'BLOB') # type
+        self.assertEqual(record[3], 1) # notnull
+        self.assertEqual(
+            record[4],
+            'X\'{!s}\''.format(test_utils.FB_DEFAULT_VALUE_HEX)
+        ) # dflt_value
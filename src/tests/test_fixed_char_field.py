@@ -57,6 +57,85 @@ class TestFixedCharField(django.test.TransactionTestCase, test_utils.FieldTestCo
 
                     self.assertEqual(returned_db_type, expected_db_type)
 
+    def test_db_type_charset_collation(self):
+        """
+        Test the column DDL of a field with the charset and the inherited db_collation options.
+
+        The character set is only emitted for MySQL. The COLLATE clause is emitted once, by Django's
+        schema editor rather than by db_type().
+
+        """
+        expected_db_types = {
+            test_utils.ALIAS_MYSQL: 'CHAR(4) CHARACTER SET ascii DEFAULT \'four\'',
+            test_utils.ALIAS_POSTGRESQL: 'CHAR(4) DEFAULT \'four\'',
+            test_utils.ALIAS_SQLITE: 'CHAR(4) DEFAULT \'four\''
+        }
+        for db_alias, expected_db_type in expected_db_types.items():
+            db_connection = django.db.connections[db_alias]
+            with self.subTest(backend=db_connection.settings_dict['ENGINE']):
+                field = forcedfields.FixedCharField(
+                    charset=test_utils.FC_CHARSET,
+                    db_collation=test_utils.FC_COLLATION[db_connection.vendor],
+                    default=test_utils.FC_DEFAULT_VALUE,
+                    max_length=test_utils.FC_DEFAULT_MAX_LENGTH
+                )
+                field.set_attributes_from_name(test_utils.FC_FIELD_ATTRNAME)
+                column_sql = db_connection.SchemaEditorClass(db_connection).column_sql(
+                    test_models.FCCharsetRecord,
+                    field
+                )[0]
+
+                self.assertEqual(field.db_type(db_connection), expected_db_type)
+                self.assertTrue(column_sql.startswith(expected_db_type))
+                self.assertEqual(column_sql.count('COLLATE'), 1)
+                self.assertIn(test_utils.FC_COLLATION[db_connection.vendor], column_sql)
+
+    def test_field_argument_check(self):
+        """
+        Ensure keyword argument rules are enforced.
+
+        See:
+            https://docs.djangoproject.com/en/dev/topics/checks/
+
+        """
+        for intern_cache_size in [0, -1, 1.5, True]:
+            with self.subTest(intern_cache_size=intern_cache_size):
+                field = forcedfields.FixedCharField(
+                    intern_cache_size=intern_cache_size,
+                    max_length=test_utils.FC_DEFAULT_MAX_LENGTH
+                )
+                check_results = field._check_intern_cache_size()
+
+                self.assertEqual(len(check_results), 1)
+                self.assertEqual(check_results[0].id, 'django_forcedfields.E170')
+
+    def test_field_deconstruction(self):
+        """
+        Test the custom field's deconstruct() method.
+
+        See:
+            https://docs.djangoproject.com/en/dev/howto/custom-model-fields/#field-deconstruction
+
+        """
+        test_field = forcedfields.FixedCharField(
+            charset=test_utils.FC_CHARSET,
+            db_collation=test_utils.FC_COLLATION['postgresql'],
+            intern_cache_size=test_utils.FC_INTERN_CACHE_SIZE,
+            max_length=test_utils.FC_DEFAULT_MAX_LENGTH,
+            strip_padding=True
+        )
+        name, path, args, kwargs = test_field.deconstruct() # pylint: disable=unused-variable
+        reconstructed_test_field = forcedfields.FixedCharField(*args, **kwargs)
+
+        self.assertEqual(test_field.charset, reconstructed_test_field.charset)
+        self.assertEqual(test_field.db_collation, reconstructed_test_field.db_collation)
+        self.assertEqual(
+            test_field.intern_cache_size,
+            reconstructed_test_field.intern_cache_size
+        )
+        self.assertEqual(test_field.max_length, reconstructed_test_field.max_length)
+        self.assertEqual(test_field.strip_padding, reconstructed_test_field.strip_padding)
+
     def test_insert(self):
         """
         Test that insert operations produce expected results.
@@ -82,6 +161,147 @@ class TestFixedCharField(django.test.TransactionTestCase, test_utils.FieldTestCo
                             expected_value
                         )
 
+    def test_intern_cache(self):
+        """
+        Test that equal values share one str instance and that the intern table stays bounded.
+
+        """
+        model_class = test_models.FCInternRecord
+        field = model_class._meta.get_field(test_utils.FC_FIELD_ATTRNAME)
+        insert_values = ['ab', 'ab', 'cd', 'ef', 'ef']
+        for db_alias in test_utils.get_db_aliases():
+            db_backend = django.db.connections[db_alias].settings_dict['ENGINE']
+            with self.subTest(backend=db_backend):
+                field.intern_cache_clear()
+                model_class.objects.using(db_alias).bulk_create([
+                    model_class(fc_field_1=value) for value in insert_values
+                ])
+                retrieved_values = list(
+                    model_class.objects.using(db_alias).order_by('id').values_list(
+                        test_utils.FC_FIELD_ATTRNAME,
+                        flat=True
+                    )
+                )
+                cache_info = field.intern_cache_info()
+
+                self.assertIs(retrieved_values[0], retrieved_values[1])
+                self.assertEqual(cache_info.hits + cache_info.misses, len(insert_values))
+                self.assertEqual(cache_info.maxsize, test_utils.FC_INTERN_CACHE_SIZE)
+                self.assertEqual(cache_info.currsize, test_utils.FC_INTERN_CACHE_SIZE)
+
+    def test_lookup_index_scan_postgresql(self):
+        """
+        Test that PostgreSQL uses the bpchar index for FixedCharField lookups.
+
+        The test table is far too small for the planner to prefer an index over a sequential scan
+        on its own. Sequential scans are therefore disabled for the session, which only discourages
+        them. If the comparison could not use the index, the planner would still choose a
+        sequential scan.
+
+        See:
+            https://www.postgresql.org/docs/current/static/runtime-config-query.html
+            https://www.postgresql.org/docs/current/static/using-explain.html
+
+        """
+        connection = django.db.connections[test_utils.ALIAS_POSTGRESQL]
+        model_manager = test_models.FCIndexedRecord.objects.using(test_utils.ALIAS_POSTGRESQL)
+        model_manager.bulk_create([
+            test_models.FCIndexedRecord(fc_field_1=value) for value in ['ab', 'cd', 'four']
+        ])
+
+        querysets = {
+            'exact': model_manager.filter(fc_field_1='ab'),
+            'in': model_manager.filter(fc_field_1__in=['ab', 'cd']),
+            'gt': model_manager.filter(fc_field_1__gt='ab'),
+            'lt': model_manager.filter(fc_field_1__lt='cd'),
+            'range': model_manager.filter(fc_field_1__range=('ab', 'cd'))
+        }
+
+        with connection.cursor() as cursor:
+            cursor.execute('SET enable_seqscan = off')
+            try:
+                for lookup_name, queryset in querysets.items():
+                    with self.subTest(lookup=lookup_name):
+                        sql_string, sql_params = queryset.query.get_compiler(queryset.db).as_sql()
+                        cursor.execute('EXPLAIN ' + sql_string, sql_params)
+                        query_plan = '\n'.join(record[0] for record in cursor.fetchall())
+
+                        self.assertIn('Index', query_plan)
+                        self.assertNotIn('Seq Scan', query_plan)
+            finally:
+                cursor.execute('RESET enable_seqscan')
+
+    def test_lookup_sql_postgresql(self):
+        """
+        Test that lookup parameters are cast to bpchar(n) and padded to max_length in PostgreSQL.
+
+        Values longer than max_length must not be truncated by the cast.
+
+        """
+        model_manager = test_models.FCIndexedRecord.objects.using(test_utils.ALIAS_POSTGRESQL)
+        padded_cast = '%s::bpchar({!s})'.format(test_utils.FC_DEFAULT_MAX_LENGTH)
+
+        queryset = model_manager.filter(fc_field_1='ab')
+        sql_string, sql_params = queryset.query.get_compiler(queryset.db).as_sql()
+        self.assertIn(padded_cast, sql_string)
+        self.assertEqual(sql_params, ('ab'.ljust(test_utils.FC_DEFAULT_MAX_LENGTH),))
+
+        queryset = model_manager.filter(fc_field_1__in=['ab', 'cd'])
+        sql_string, sql_params = queryset.query.get_compiler(queryset.db).as_sql()
+        self.assertEqual(sql_string.count(padded_cast), 2)
+
+        queryset = model_manager.filter(fc_field_1__gt='violate max_length')
+        sql_string, sql_params = queryset.query.get_compiler(queryset.db).as_sql()
+        self.assertNotIn(padded_cast, sql_string)
+        self.assertIn('%s::bpchar', sql_string)
+        self.assertEqual(sql_params, ('violate max_length',))
+
+    def test_lookups(self):
+        """
+        Test that the overridden FixedCharField lookups return correct results on all backends.
+
+        """
+        for db_alias in test_utils.get_db_aliases():
+            db_backend = django.db.connections[db_alias].settings_dict['ENGINE']
+            model_manager = test_models.FCIndexedRecord.objects.using(db_alias)
+            model_manager.bulk_create([
+                test_models.FCIndexedRecord(fc_field_1=value) for value in ['ab', 'cd', 'four']
+            ])
+            expected_counts = {
+                'fc_field_1': ('ab', 1),
+                'fc_field_1__in': (['ab', 'four'], 2),
+                'fc_field_1__gt': ('ab', 2),
+                'fc_field_1__gte': ('ab', 3),
+                'fc_field_1__lt': ('cd', 1),
+                'fc_field_1__lte': ('cd', 2),
+                'fc_field_1__range': (('ab', 'cd'), 2)
+            }
+            for lookup, (lookup_value, expected_count) in expected_counts.items():
+                with self.subTest(backend=db_backend, lookup=lookup):
+                    lookup_kwargs = {lookup: lookup_value}
+                    self.assertEqual(model_manager.filter(**lookup_kwargs).count(), expected_count)
+
+            with self.subTest(backend=db_backend, lookup='fc_field_1 (exceeds max_length)'):
+                self.assertEqual(model_manager.filter(fc_field_1='abcdef').count(), 0)
+
+    def test_lookups_charset(self):
+        """
+        Test that lookups on a column with an explicit character set are correct.
+
+        """
+        model_class = test_models.FCCharsetRecord
+        for db_alias in test_utils.get_db_aliases():
+            db_backend = django.db.connections[db_alias].settings_dict['ENGINE']
+            with self.subTest(backend=db_backend):
+                model_manager = model_class.objects.using(db_alias)
+                model_manager.bulk_create([
+                    model_class(fc_field_1=value) for value in ['USD', 'GBP', 'EUR']
+                ])
+
+                self.assertEqual(model_manager.filter(fc_field_1='USD').count(), 1)
+                self.assertEqual(model_manager.filter(fc_field_1__in=['USD', 'EUR']).count(), 2)
+                self.assertEqual(model_manager.filter(fc_field_1__lt='H').count(), 2)
+
     def test_max_length_validation(self):
         """
         Test that max_length validation functions correctly.
@@ -142,6 +362,69 @@ class TestFixedCharField(django.test.TransactionTestCase, test_utils.FieldTestCo
 
                 self.assertEqual(getattr(result_record, test_utils.FC_FIELD_ATTRNAME), None)
 
+    def test_strip_padding(self):
+        """
+        Test that values shorter than max_length are returned without pad spaces.
+
+        Without strip_padding, PostgreSQL returns CHAR values padded to max_length. Both model
+        instances and values_list() results are tested since both are produced by the same SELECT
+        expression.
+
+        """
+        short_value = 'ab'
+        model_class = test_models.FCStripPaddingRecord
+        for db_alias in test_utils.get_db_aliases():
+            db_backend = django.db.connections[db_alias].settings_dict['ENGINE']
+            with self.subTest(backend=db_backend):
+                model = model_class(fc_field_1=short_value)
+                model.save(using=db_alias)
+                retrieved_model = model_class.objects.using(db_alias).get(id=model.id)
+                retrieved_values = model_class.objects.using(db_alias).filter(
+                    id=model.id
+                ).values_list(test_utils.FC_FIELD_ATTRNAME, flat=True)
+
+                self.assertEqual(retrieved_model.fc_field_1, short_value)
+                self.assertEqual(list(retrieved_values), [short_value])
+
+    def test_table_structure_charset_mysql(self):
+        """
+        Test the character set and storage size of a FixedCharField column in MySQL.
+
+        CHARACTER_OCTET_LENGTH is the maximum column length in bytes, which also determines the
+        size of each index key. With an ascii character set, it equals max_length. Under utf8mb4,
+        it would be four times max_length.
+
+        See:
+            https://dev.mysql.com/doc/refman/en/columns-table.html
+
+        """
+        model_class = test_models.FCCharsetRecord
+        connection = django.db.connections[test_utils.ALIAS_MYSQL]
+
+        sql_string = """
+            SELECT
+                LOWER(`CHARACTER_SET_NAME`) AS `CHARACTER_SET_NAME`,
+                `CHARACTER_OCTET_LENGTH`
+            FROM
+                `information_schema`.`COLUMNS`
+            WHERE
+                `TABLE_SCHEMA` = %s
+                AND `TABLE_NAME` = %s
+                AND `COLUMN_NAME` = %s
+        """
+        sql_params = [
+            connection.settings_dict['NAME'],
+            model_class._meta.db_table,
+            model_class._meta.fields[1].get_attname_column()[1]
+        ]
+
+        with connection.cursor() as cursor:
+            cursor.execute(sql_string, sql_params)
+            record = cursor.fetchone()
+
+        self.assertEqual(record[0], test_utils.FC_CHARSET)
+        self.assertEqual(record[1], test_utils.FC_DEFAULT_MAX_LENGTH)
+
     def test_table_structure_mysql(self):
         """
         Test the creation of fixed char field in MySQL/MariaDB.
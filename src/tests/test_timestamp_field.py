@@ -9,11 +9,15 @@ Tests for TimestampField.
 
 
 import datetime
+import io
+import unittest.mock
 
 import django.core.exceptions
 import django.core.management
+import django.core.paginator
 import django.db
 import django.test
+import django.test.utils
 
 import django_forcedfields
 from . import models as test_models
@@ -156,6 +160,58 @@ class TestTimestampField(django.test.TransactionTestCase, test_utils.FieldTestCo
 
         self._assert_datetime_not_equal(inserted_value, updated_value)
 
+    def _test_update_trigger(self, alias):
+        """
+        Test that a trigger sets the current timestamp in QuerySet.update().
+
+        The trigger must not override values explicitly set by the UPDATE statement and must not
+        fire for no-op updates. The test model's table is recreated with the triggers and restored
+        afterward.
+
+        Args:
+            alias (string): The DATABASES Django settings key used to specify a specific database
+                backend for an operation.
+
+        """
+        test_model_class_name = test_utils.get_ts_model_class_name(
+            auto_now_update=True,
+            null=True
+        )
+        test_model_class = getattr(test_models, test_model_class_name)
+        connection = django.db.connections[alias]
+        queryset = test_model_class.objects.using(alias)
+        past_value = datetime.datetime(2000, 1, 1)
+
+        with test_utils.get_schema_editor(
+            connection,
+            django_forcedfields.TimestampTriggerSchemaEditorMixin
+        ) as schema_editor:
+            schema_editor.delete_model(test_model_class)
+            schema_editor.create_model(test_model_class)
+        try:
+            test_model = test_model_class()
+            test_model.save(using=alias)
+
+            queryset.update(**{test_utils.TS_FIELD_ATTRNAME: past_value})
+            explicit_value = getattr(queryset.get(), test_utils.TS_FIELD_ATTRNAME)
+            self.assertEqual(explicit_value, past_value)
+
+            queryset.update(**{test_utils.TS_UPDATE_FIELD_ATTRNAME: 1})
+            updated_value = getattr(queryset.get(), test_utils.TS_FIELD_ATTRNAME)
+            self._assert_datetime_equal(updated_value, datetime.datetime.now())
+
+            queryset.update(**{test_utils.TS_UPDATE_FIELD_ATTRNAME: 1})
+            no_op_value = getattr(queryset.get(), test_utils.TS_FIELD_ATTRNAME)
+            self.assertEqual(no_op_value, updated_value)
+        finally:
+            with test_utils.get_schema_editor(
+                connection,
+                django_forcedfields.TimestampTriggerSchemaEditorMixin
+            ) as schema_editor:
+                schema_editor.delete_model(test_model_class)
+            with connection.schema_editor() as schema_editor:
+                schema_editor.create_model(test_model_class)
+
     def test_automatic_datetime(self):
         """
         Test that the automatic timestamp value is the current datetime.
@@ -183,6 +239,111 @@ class TestTimestampField(django.test.TransactionTestCase, test_utils.FieldTestCo
 
                 self._assert_datetime_equal(retrieved_value, expected_value)
 
+    def test_cursor_pagination(self):
+        """
+        Test that TimestampCursorPaginator pages by (timestamp, pk) in both directions.
+
+        Timestamps are repeated so that pages break within equal timestamps. The position is
+        compared with a row value where the database uses indexes for it and otherwise with the
+        expanded form. As in test_lookup_date_index_scan(), the query plan of a following page must
+        show a scan of the composite index, which in PostgreSQL and SQLite also spares the sort.
+
+        See:
+            https://dev.mysql.com/doc/refman/en/explain-output.html
+            https://www.postgresql.org/docs/current/static/using-explain.html
+            https://www.sqlite.org/eqp.html
+
+        """
+        model_class = test_models.TSCursorRecord
+        start = datetime.datetime(2001, 2, 3)
+        for alias in test_utils.get_db_aliases():
+            connection = django.db.connections[alias]
+            with self.subTest(backend=connection.settings_dict['ENGINE']):
+                model_class.objects.using(alias).bulk_create([
+                    model_class(
+                        ts_field_1=start + datetime.timedelta(hours=index // 2),
+                        ts_field_2=start - datetime.timedelta(hours=index // 3)
+                    )
+                    for index in range(10)
+                ])
+                queryset = django_forcedfields.TimestampQuerySet(model_class, using=alias)
+                for field_name in ('ts_field_1', 'ts_field_2'):
+                    for descending in (False, True):
+                        prefix = '-' if descending else ''
+                        expected_pks = list(
+                            queryset.order_by(prefix + field_name, prefix + 'pk')
+                            .values_list('pk', flat=True)
+                        )
+                        paginator = django_forcedfields.TimestampCursorPaginator(
+                            queryset,
+                            field_name,
+                            per_page=3,
+                            descending=descending
+                        )
+                        with django.test.utils.CaptureQueriesContext(connection) as context:
+                            pages = list(paginator.pages())
+
+                        self.assertEqual(
+                            [record.pk for page in pages for record in page],
+                            expected_pks
+                        )
+                        self.assertEqual([len(page) for page in pages], [3, 3, 3, 1])
+                        self.assertFalse(pages[-1].has_next())
+                        self.assertEqual(
+                            list(
+                                queryset.seek(field_name, pages[1].next_cursor, descending)
+                                .values_list('pk', flat=True)
+                            ),
+                            expected_pks[6:]
+                        )
+                        last_sql = context.captured_queries[-1]['sql']
+                        if connection.vendor == 'mysql':
+                            self.assertIn(' OR ', last_sql)
+                        else:
+                            self.assertIn(') {!s} ('.format('<' if descending else '>'), last_sql)
+
+                        page_queryset = paginator.get_queryset(pages[0].next_cursor)[:4]
+                        sql_string, sql_params = page_queryset.query.get_compiler(alias).as_sql()
+                        with connection.cursor() as cursor:
+                            if connection.vendor == 'mysql':
+                                cursor.execute('EXPLAIN ' + sql_string, sql_params)
+                                columns = [column[0] for column in cursor.description]
+                                query_plan = dict(zip(columns, cursor.fetchone()))
+                                self.assertIn(field_name, query_plan['possible_keys'] or '')
+                            elif connection.vendor == 'postgresql':
+                                cursor.execute('SET enable_seqscan = off')
+                                try:
+                                    cursor.execute('EXPLAIN ' + sql_string, sql_params)
+                                    query_plan = '\n'.join(
+                                        record[0] for record in cursor.fetchall()
+                                    )
+                                finally:
+                                    cursor.execute('RESET enable_seqscan')
+                                self.assertIn('Index', query_plan)
+                                self.assertNotIn('Seq Scan', query_plan)
+                                self.assertNotIn('Sort', query_plan)
+                            else:
+                                cursor.execute('EXPLAIN QUERY PLAN ' + sql_string, sql_params)
+                                query_plan = '\n'.join(record[-1] for record in cursor.fetchall())
+                                self.assertIn('USING INDEX', query_plan)
+                                self.assertNotIn('TEMP B-TREE', query_plan)
+
+                with self.assertRaises(django.core.paginator.InvalidPage):
+                    paginator.page('invalid')
+                with self.assertRaises(ValueError):
+                    queryset.seek('id')
+                with self.assertRaises(ValueError):
+                    django_forcedfields.TimestampCursorPaginator(queryset, 'ts_field_1', 0)
+                paginator = django_forcedfields.TimestampCursorPaginator(
+                    queryset,
+                    'ts_field_1',
+                    None
+                )
+                with self.assertRaises(ValueError):
+                    paginator.page()
+                with self.assertRaises(ValueError):
+                    next(paginator.pages())
+
     def test_db_type(self):
         """
         Test output of the field's overridden "db_type" method.
@@ -201,6 +362,105 @@ class TestTimestampField(django.test.TransactionTestCase, test_utils.FieldTestCo
                 with self.subTest(backend=connection_engine, kwargs=test_kwargs_string):
                     self.assertEqual(test_field.db_type(connection), expected_output)
 
+    def test_dirty_fields(self):
+        """
+        Test that DirtyFieldsModelMixin only writes changed fields and automatic timestamps.
+
+        An unchanged instance must only be written with force_update. Model.save()'s arguments must
+        also be accepted positionally.
+
+        """
+        model_class = test_models.DirtyFieldsRecord
+        for alias in test_utils.get_db_aliases():
+            connection = django.db.connections[alias]
+            with self.subTest(backend=connection.settings_dict['ENGINE']):
+                model_class.objects.using(alias).create(fc_field_1='a')
+                test_model = model_class.objects.using(alias).get()
+                with django.test.utils.CaptureQueriesContext(connection) as captured_queries:
+                    test_model.save()
+                self.assertEqual(len(captured_queries), 0)
+                with django.test.utils.CaptureQueriesContext(connection) as captured_queries:
+                    test_model.save(force_update=True)
+                self.assertEqual(len(captured_queries), 1)
+                self.assertTrue(captured_queries.captured_queries[0]['sql'].startswith('UPDATE'))
+
+                setattr(test_model, test_utils.TS_UPDATE_FIELD_ATTRNAME, 1)
+                self.assertEqual(
+                    test_model.get_changed_fields(),
+                    [test_utils.TS_UPDATE_FIELD_ATTRNAME]
+                )
+                with django.test.utils.CaptureQueriesContext(connection) as captured_queries:
+                    test_model.save(False, False, alias)
+                update_sql = captured_queries.captured_queries[-1]['sql']
+                retrieved_model = model_class.objects.using(alias).get()
+
+                self.assertIn(test_utils.TS_UPDATE_FIELD_ATTRNAME, update_sql)
+                self.assertIn(test_utils.TS_FIELD_ATTRNAME, update_sql)
+                self.assertNotIn('fc_field_1', update_sql)
+                self.assertEqual(test_model.get_changed_fields(), [])
+                getattr(test_model, test_utils.TS_FIELD_ATTRNAME)
+                self.assertEqual(test_model.get_changed_fields(), [])
+                self.assertEqual(getattr(retrieved_model, test_utils.TS_UPDATE_FIELD_ATTRNAME), 1)
+                self._assert_datetime_equal(
+                    getattr(retrieved_model, test_utils.TS_FIELD_ATTRNAME),
+                    datetime.datetime.now()
+                )
+
+    def test_epoch_ms_storage(self):
+        """
+        Test that storage='epoch_ms' stores integers and exposes millisecond-resolution datetimes.
+
+        """
+        test_value = datetime.datetime(2001, 2, 3, 4, 5, 6, 789123)
+        expected_value = test_value.replace(microsecond=789000)
+        test_model_class = getattr(
+            test_models,
+            test_utils.get_ts_model_class_name(auto_now=True, storage='epoch_ms')
+        )
+        for alias in test_utils.get_db_aliases():
+            connection = django.db.connections[alias]
+            with self.subTest(backend=connection.settings_dict['ENGINE']):
+                queryset = test_model_class.objects.using(alias)
+                test_model = test_model_class()
+                test_model.save(using=alias)
+                with connection.cursor() as cursor:
+                    cursor.execute(
+                        'SELECT {!s} FROM {!s}'.format(
+                            connection.ops.quote_name(test_utils.TS_FIELD_ATTRNAME),
+                            connection.ops.quote_name(test_model_class._meta.db_table)
+                        )
+                    )
+                    raw_value = cursor.fetchone()[0]
+                retrieved_value = getattr(queryset.get(), test_utils.TS_FIELD_ATTRNAME)
+
+                self.assertIsInstance(raw_value, int)
+                self.assertIsInstance(retrieved_value, datetime.datetime)
+                self._assert_datetime_equal(retrieved_value, datetime.datetime.now())
+                self.assertEqual(
+                    getattr(test_model, test_utils.TS_FIELD_ATTRNAME),
+                    retrieved_value
+                )
+
+                queryset.update(**{test_utils.TS_FIELD_ATTRNAME: test_value})
+                self.assertEqual(
+                    getattr(queryset.get(), test_utils.TS_FIELD_ATTRNAME),
+                    expected_value
+                )
+                self.assertTrue(
+                    queryset.filter(**{test_utils.TS_FIELD_ATTRNAME: expected_value}).exists()
+                )
+                self.assertTrue(
+                    queryset.filter(
+                        **{test_utils.TS_FIELD_ATTRNAME + '__lt': datetime.datetime(2001, 2, 4)}
+                    ).exists()
+                )
+
+                django_forcedfields.TimestampQuerySet(test_model_class, using=alias).touch()
+                self._assert_datetime_equal(
+                    getattr(queryset.get(), test_utils.TS_FIELD_ATTRNAME),
+                    datetime.datetime.now()
+                )
+
     def test_field_argument_check(self):
         """
         Ensure keyword argument rules are enforced.
@@ -236,6 +496,28 @@ class TestTimestampField(django.test.TransactionTestCase, test_utils.FieldTestCo
             'django_forcedfields.E160' : {
                 'auto_now': True,
                 'auto_now_update': True
+            },
+            'django_forcedfields.E190' : {
+                'precision': 7
+            },
+            'django_forcedfields.E200' : {
+                'storage': 'epoch'
+            },
+            'django_forcedfields.E210' : {
+                'precision': 3,
+                'storage': 'epoch_ms'
+            },
+            'django_forcedfields.E220' : {
+                'db_index': True,
+                'index_type': 'gist'
+            },
+            'django_forcedfields.E230' : {
+                'index_type': 'brin'
+            },
+            'django_forcedfields.E240' : {
+                'db_index': True,
+                'index_type': 'hash',
+                'pages_per_range': 16
             }
         }
 
@@ -270,7 +552,8 @@ class TestTimestampField(django.test.TransactionTestCase, test_utils.FieldTestCo
         test_field = django_forcedfields.TimestampField(
             auto_now_add=True,
             auto_now_update=True,
-            null=True
+            null=True,
+            precision=3
         )
         name, path, args, kwargs = test_field.deconstruct() # pylint: disable=unused-variable
         reconstructed_test_field = django_forcedfields.TimestampField(*args, **kwargs)
@@ -278,6 +561,105 @@ class TestTimestampField(django.test.TransactionTestCase, test_utils.FieldTestCo
         self.assertEqual(test_field.auto_now, reconstructed_test_field.auto_now)
         self.assertEqual(test_field.auto_now_update, reconstructed_test_field.auto_now_update)
         self.assertEqual(test_field.null, reconstructed_test_field.null)
+        self.assertEqual(test_field.precision, reconstructed_test_field.precision)
+        self.assertNotIn('precision', django_forcedfields.TimestampField().deconstruct()[3])
+        self.assertNotIn('storage', django_forcedfields.TimestampField().deconstruct()[3])
+        self.assertNotIn('index_type', django_forcedfields.TimestampField().deconstruct()[3])
+
+        test_field = django_forcedfields.TimestampField(storage='epoch_ms')
+        reconstructed_test_field = django_forcedfields.TimestampField(
+            **test_field.deconstruct()[3]
+        )
+        self.assertEqual(reconstructed_test_field.storage, 'epoch_ms')
+
+        test_field = test_models.TSBrinRecord._meta.get_field(test_utils.TS_FIELD_ATTRNAME)
+        reconstructed_test_field = django_forcedfields.TimestampField(
+            **test_field.deconstruct()[3]
+        )
+        self.assertEqual(reconstructed_test_field.index_type, 'brin')
+        self.assertEqual(reconstructed_test_field.pages_per_range, test_utils.TS_PAGES_PER_RANGE)
+
+    def test_index_type_postgresql(self):
+        """
+        Test that PostgreSQL indexes are created and altered with the field's index method.
+
+        The test model's table is recreated with TimestampIndexSchemaEditorMixin and restored
+        afterward.
+
+        """
+        model_class = test_models.TSBrinRecord
+        connection = django.db.connections[test_utils.ALIAS_POSTGRESQL]
+        old_field = model_class._meta.get_field(test_utils.TS_FIELD_ATTRNAME)
+        sql_string = 'SELECT indexdef FROM pg_indexes WHERE tablename = %s AND indexdef LIKE %s'
+        sql_params = [model_class._meta.db_table, '%({!s})%'.format(test_utils.TS_FIELD_ATTRNAME)]
+
+        with test_utils.get_schema_editor(
+            connection,
+            django_forcedfields.TimestampIndexSchemaEditorMixin
+        ) as schema_editor:
+            schema_editor.delete_model(model_class)
+            schema_editor.create_model(model_class)
+        try:
+            with connection.cursor() as cursor:
+                cursor.execute(sql_string, sql_params)
+                index_definitions = [record[0] for record in cursor.fetchall()]
+            self.assertEqual(len(index_definitions), 1)
+            self.assertIn('USING brin', index_definitions[0])
+            self.assertIn(
+                'pages_per_range=\'{:d}\''.format(test_utils.TS_PAGES_PER_RANGE),
+                index_definitions[0]
+            )
+
+            for new_kwargs, expected_method in (({'index_type': 'hash'}, 'hash'), ({}, 'btree')):
+                with self.subTest(index_type=expected_method):
+                    new_field = django_forcedfields.TimestampField(db_index=True, **new_kwargs)
+                    new_field.set_attributes_from_name(test_utils.TS_FIELD_ATTRNAME)
+                    new_field.model = model_class
+                    with test_utils.get_schema_editor(
+                        connection,
+                        django_forcedfields.TimestampIndexSchemaEditorMixin
+                    ) as schema_editor:
+                        schema_editor.alter_field(model_class, old_field, new_field)
+                    old_field = new_field
+                    with connection.cursor() as cursor:
+                        cursor.execute(sql_string, sql_params)
+                        index_definitions = [record[0] for record in cursor.fetchall()]
+
+                    self.assertEqual(len(index_definitions), 1)
+                    self.assertIn('USING {!s}'.format(expected_method), index_definitions[0])
+        finally:
+            with connection.schema_editor() as schema_editor:
+                schema_editor.delete_model(model_class)
+                schema_editor.create_model(model_class)
+
+    def test_index_type_sql(self):
+        """
+        Test that the index method is only emitted for PostgreSQL, falling back to btree elsewhere.
+
+        """
+        for alias in test_utils.get_db_aliases():
+            connection = django.db.connections[alias]
+            with self.subTest(backend=connection.settings_dict['ENGINE']):
+                with test_utils.get_schema_editor(
+                    connection,
+                    django_forcedfields.TimestampIndexSchemaEditorMixin,
+                    collect_sql=True
+                ) as schema_editor:
+                    schema_editor.create_model(test_models.TSBrinRecord)
+                index_sql = [
+                    sql for sql in schema_editor.collected_sql if sql.startswith('CREATE INDEX')
+                ]
+
+                self.assertEqual(len(index_sql), 1)
+                if connection.vendor == 'postgresql':
+                    self.assertIn('USING brin', index_sql[0])
+                    self.assertIn(
+                        'WITH (pages_per_range = {:d})'.format(test_utils.TS_PAGES_PER_RANGE),
+                        index_sql[0]
+                    )
+                else:
+                    self.assertNotIn('USING', index_sql[0])
+                    self.assertNotIn('pages_per_range', index_sql[0])
 
     def test_insert(self):
         """
@@ -341,6 +723,791 @@ class TestTimestampField(django.test.TransactionTestCase, test_utils.FieldTestCo
             using=test_utils.ALIAS_MYSQL
         )
 
+    def test_lazy_refresh(self):
+        """
+        Test that pending timestamp expressions are resolved in batches on first access.
+
+        """
+        descriptor = test_models.TSManagedRecord.__dict__[test_utils.TS_FIELD_ATTRNAME]
+        for alias in test_utils.get_db_aliases():
+            connection = django.db.connections[alias]
+            with self.subTest(backend=connection.settings_dict['ENGINE']):
+                queryset = test_models.TSManagedRecord.objects.using(alias)
+                test_models_list = [queryset.create() for _ in range(3)]
+                queryset.bulk_update(test_models_list, [test_utils.TS_UPDATE_FIELD_ATTRNAME])
+                with django.test.utils.CaptureQueriesContext(connection) as captured_queries:
+                    values = [
+                        getattr(test_model, test_utils.TS_FIELD_ATTRNAME)
+                        for test_model in test_models_list
+                    ]
+
+                self.assertEqual(len(captured_queries), 1)
+                self.assertEqual(
+                    values,
+                    [
+                        getattr(queryset.get(id=test_model.id), test_utils.TS_FIELD_ATTRNAME)
+                        for test_model in test_models_list
+                    ]
+                )
+
+                descriptor.batch_size = 2
+                try:
+                    queryset.bulk_update(test_models_list, [test_utils.TS_UPDATE_FIELD_ATTRNAME])
+                    with django.test.utils.CaptureQueriesContext(connection) as captured_queries:
+                        for test_model in test_models_list:
+                            getattr(test_model, test_utils.TS_FIELD_ATTRNAME)
+                finally:
+                    del descriptor.batch_size
+
+                self.assertEqual(len(captured_queries), 2)
+
+                # Instances leave their batch when their batch is resolved after another value is
+                # set or when collected.
+                queryset.bulk_update(test_models_list, [test_utils.TS_UPDATE_FIELD_ATTRNAME])
+                state = descriptor._get_state()
+                setattr(test_models_list[0], test_utils.TS_FIELD_ATTRNAME, None)
+                getattr(test_models_list[1], test_utils.TS_FIELD_ATTRNAME)
+                self.assertEqual(state.batch_numbers, {})
+                queryset.bulk_update(test_models_list, [test_utils.TS_UPDATE_FIELD_ATTRNAME])
+                self.assertEqual(
+                    set(state.batch_numbers),
+                    {id(test_model) for test_model in test_models_list}
+                )
+                test_models_list = test_model = None
+                self.assertEqual(state.batch_numbers, {})
+
+                # Loaded instances are never registered and fields without an auto option keep
+                # Django's descriptor.
+                list(queryset.all())
+                self.assertEqual(state.batch_numbers, {})
+                self.assertIs(
+                    django_forcedfields.TimestampField().descriptor_class,
+                    django.db.models.query_utils.DeferredAttribute
+                )
+
+    def test_lookup_date_index_scan(self):
+        """
+        Test that date and year lookups are rewritten to ranges that the column's index can serve.
+
+        Each database's query plan must show an index range scan. As in
+        TestFixedCharField.test_lookup_index_scan_postgresql(), the PostgreSQL planner is
+        discouraged from sequential scans. MySQL must list the index among the possible keys since
+        the table is too small for MySQL to choose it.
+
+        See:
+            https://dev.mysql.com/doc/refman/en/explain-output.html
+            https://www.postgresql.org/docs/current/static/using-explain.html
+            https://www.sqlite.org/eqp.html
+
+        """
+        lookup_values = {
+            'date': datetime.date(2001, 2, 3),
+            'date__gt': datetime.date(2001, 2, 3),
+            'date__lte': datetime.date(2001, 2, 3),
+            'date__range': (datetime.date(2001, 2, 3), datetime.date(2001, 2, 4)),
+            'date__in': [datetime.date(2001, 2, 3), datetime.date(2001, 3, 4)],
+            'year': 2001,
+            'year__lt': 2001
+        }
+        for alias in test_utils.get_db_aliases():
+            connection = django.db.connections[alias]
+            model_manager = test_models.TSIndexedRecord.objects.using(alias)
+            for field_name in ('ts_field_1', 'ts_field_2'):
+                for lookup, lookup_value in lookup_values.items():
+                    queryset = model_manager.filter(
+                        **{'{!s}__{!s}'.format(field_name, lookup): lookup_value}
+                    )
+                    sql_string, sql_params = queryset.query.get_compiler(alias).as_sql()
+                    with self.subTest(
+                        backend=connection.settings_dict['ENGINE'],
+                        field=field_name,
+                        lookup=lookup
+                    ), connection.cursor() as cursor:
+                        if connection.vendor == 'mysql':
+                            cursor.execute('EXPLAIN ' + sql_string, sql_params)
+                            columns = [column[0] for column in cursor.description]
+                            query_plan = dict(zip(columns, cursor.fetchone()))
+                            self.assertIn(field_name, query_plan['possible_keys'] or '')
+                        elif connection.vendor == 'postgresql':
+                            cursor.execute('SET enable_seqscan = off')
+                            try:
+                                cursor.execute('EXPLAIN ' + sql_string, sql_params)
+                                query_plan = '\n'.join(record[0] for record in cursor.fetchall())
+                            finally:
+                                cursor.execute('RESET enable_seqscan')
+                            self.assertIn('Index', query_plan)
+                            self.assertNotIn('Seq Scan', query_plan)
+                        else:
+                            cursor.execute('EXPLAIN QUERY PLAN ' + sql_string, sql_params)
+                            query_plan = '\n'.join(record[-1] for record in cursor.fetchall())
+                            self.assertIn('USING INDEX', query_plan)
+                            self.assertNotIn('SCAN', query_plan)
+
+    def test_lookup_date_results(self):
+        """
+        Test that rewritten date and year lookups match the same rows as the transformed values.
+
+        """
+        values = [
+            datetime.datetime(2000, 12, 31, 23, 59, 59, 999000),
+            datetime.datetime(2001, 1, 1),
+            datetime.datetime(2001, 2, 3, 12),
+            datetime.datetime(2001, 2, 3, 23, 59, 59, 999000),
+            datetime.datetime(2001, 2, 4)
+        ]
+        expected_counts = {
+            'date': (datetime.date(2001, 2, 3), 2),
+            'date__gt': (datetime.date(2001, 2, 3), 1),
+            'date__gte': (datetime.date(2001, 2, 3), 3),
+            'date__lt': (datetime.date(2001, 2, 3), 2),
+            'date__lte': ('2001-02-03', 4),
+            'date__range': ((datetime.date(2001, 1, 1), datetime.date(2001, 2, 3)), 3),
+            'date__in': ([datetime.date(2000, 12, 31), datetime.date(2001, 2, 4)], 2),
+            'year': (2001, 4),
+            'year__gt': (2000, 4),
+            'year__lte': (2000, 1)
+        }
+        for alias in test_utils.get_db_aliases():
+            connection = django.db.connections[alias]
+            model_manager = test_models.TSIndexedRecord.objects.using(alias)
+            model_manager.bulk_create([
+                test_models.TSIndexedRecord(ts_field_1=value, ts_field_2=value) for value in values
+            ])
+            for field_name in ('ts_field_1', 'ts_field_2'):
+                for lookup, (lookup_value, expected_count) in expected_counts.items():
+                    with self.subTest(
+                        backend=connection.settings_dict['ENGINE'],
+                        field=field_name,
+                        lookup=lookup
+                    ):
+                        lookup_kwargs = {'{!s}__{!s}'.format(field_name, lookup): lookup_value}
+                        self.assertEqual(
+                            model_manager.filter(**lookup_kwargs).count(),
+                            expected_count
+                        )
+                        self.assertEqual(
+                            model_manager.exclude(**lookup_kwargs).count(),
+                            len(values) - expected_count
+                        )
+
+            with self.subTest(backend=connection.settings_dict['ENGINE'], lookup='expression'):
+                self.assertEqual(
+                    model_manager.filter(
+                        ts_field_1__date=django.db.models.functions.TruncDate('ts_field_1')
+                    ).count(),
+                    len(values)
+                )
+
+    def test_omit_db_defaults(self):
+        """
+        Test that OmitDBDefaultsQuerySetMixin omits fields whose DDL DEFAULT applies from INSERTs.
+
+        The omitted columns must still be filled by the database.
+
+        """
+        model_class = test_models.OmitDBDefaultsRecord
+        for alias in test_utils.get_db_aliases():
+            connection = django.db.connections[alias]
+            with self.subTest(backend=connection.settings_dict['ENGINE']):
+                with django.test.utils.CaptureQueriesContext(connection) as captured_queries:
+                    test_model = model_class(**{test_utils.TS_UPDATE_FIELD_ATTRNAME: 1})
+                    test_model.save(using=alias)
+                    model_class.objects.using(alias).bulk_create(
+                        [model_class(), model_class(fc_field_1='bulk')]
+                    )
+                # Omitted fields may still appear in a RETURNING clause. See test_returning().
+                insert_sql = [
+                    query['sql'].split(' RETURNING ')[0]
+                    for query in captured_queries.captured_queries
+                    if query['sql'].startswith('INSERT')
+                ]
+                retrieved_values = model_class.objects.using(alias).values_list(
+                    'fc_field_1',
+                    test_utils.TS_FIELD_ATTRNAME
+                )
+
+                self.assertEqual(len(insert_sql), 2)
+                self.assertNotIn('fc_field_1', insert_sql[0])
+                self.assertNotIn(test_utils.TS_FIELD_ATTRNAME, insert_sql[0])
+                self.assertIn('fc_field_1', insert_sql[1])
+                self.assertNotIn(test_utils.TS_FIELD_ATTRNAME, insert_sql[1])
+                self.assertEqual(
+                    sorted(value[0] for value in retrieved_values),
+                    ['bulk', test_utils.FC_DEFAULT_VALUE, test_utils.FC_DEFAULT_VALUE]
+                )
+                for retrieved_value in retrieved_values:
+                    self._assert_datetime_equal(retrieved_value[1], datetime.datetime.now())
+
+    def test_omit_db_defaults_add_field(self):
+        """
+        Test that omitted columns are still filled by the database after being added to a table.
+
+        Django's schema editor would drop the DEFAULT clauses of the added columns. See
+        DefaultValueSchemaEditorMixin.
+
+        """
+        model_class = test_models.OmitDBDefaultsRecord
+        fields = [
+            model_class._meta.get_field(field_name)
+            for field_name in ('fc_field_1', test_utils.TS_FIELD_ATTRNAME)
+        ]
+        for alias in test_utils.get_db_aliases():
+            connection = django.db.connections[alias]
+            with self.subTest(backend=connection.settings_dict['ENGINE']):
+                model_class.objects.using(alias).create()
+                with connection.schema_editor() as schema_editor:
+                    for field in fields:
+                        schema_editor.remove_field(model_class, field)
+                with test_utils.get_schema_editor(
+                    connection,
+                    django_forcedfields.DefaultValueSchemaEditorMixin
+                ) as schema_editor:
+                    for field in fields:
+                        schema_editor.add_field(model_class, field)
+                model_class.objects.using(alias).create()
+                retrieved_values = model_class.objects.using(alias).values_list(
+                    'fc_field_1',
+                    test_utils.TS_FIELD_ATTRNAME
+                )
+
+                self.assertEqual(len(retrieved_values), 2)
+                for retrieved_value in retrieved_values:
+                    self.assertEqual(retrieved_value[0], test_utils.FC_DEFAULT_VALUE)
+                    self._assert_datetime_equal(retrieved_value[1], datetime.datetime.now())
+
+    @django.test.utils.isolate_apps('tests', kwarg_name='apps')
+    def test_partition_check(self, apps):
+        """
+        Test the checks of the partition_interval option.
+
+        """
+        # pylint: disable=unused-variable
+        class PartitionKeysRecord(django.db.models.Model):
+            """A model with two partition keys."""
+            ts_field_1 = django_forcedfields.TimestampField(partition_interval='month')
+            ts_field_2 = django_forcedfields.TimestampField(partition_interval='month')
+
+        class PartitionNullRecord(django.db.models.Model):
+            """A model partitioned by a null TimestampField."""
+            ts_field_1 = django_forcedfields.TimestampField(null=True, partition_interval='month')
+
+        class PartitionIntervalRecord(django.db.models.Model):
+            """A model partitioned by an invalid interval."""
+            ts_field_1 = django_forcedfields.TimestampField(partition_interval='week')
+
+        failed_checks = django_forcedfields.check_partition_keys([apps.get_app_config('tests')])
+        field_check_ids = [
+            [
+                check.id for check in model_class._meta.get_field(test_utils.TS_FIELD_ATTRNAME)
+                .check()
+                if check.id in ('django_forcedfields.E260', 'django_forcedfields.E270')
+            ]
+            for model_class in (PartitionKeysRecord, PartitionNullRecord, PartitionIntervalRecord)
+        ]
+
+        self.assertEqual(
+            [(check.obj.__name__, check.id) for check in failed_checks],
+            [('PartitionKeysRecord', 'django_forcedfields.E250')]
+        )
+        self.assertEqual(
+            field_check_ids,
+            [[], ['django_forcedfields.E260'], ['django_forcedfields.E270']]
+        )
+        self.assertEqual(django_forcedfields.check_partition_keys(), [])
+
+    def test_partition_command(self):
+        """
+        Test that TimestampPartitionCommand creates upcoming partitions and drops expired ones.
+
+        The current time is moved forward two periods to expire the partitions created so far. The
+        partitions of models other than the given one must be left untouched. SQLite does not
+        support partitions.
+
+        """
+        model_class = test_models.TSPartitionedRecord
+        other_model_class = test_models.TSYearPartitionedRecord
+        command = django_forcedfields.TimestampPartitionCommand()
+        for alias in test_utils.get_db_aliases():
+            connection = django.db.connections[alias]
+            with self.subTest(backend=connection.settings_dict['ENGINE']):
+                if connection.vendor == 'sqlite':
+                    with self.assertRaises(django.core.management.CommandError):
+                        django.core.management.call_command(
+                            command,
+                            model_class._meta.label,
+                            database=alias,
+                            stdout=io.StringIO()
+                        )
+                    continue
+
+                with test_utils.get_schema_editor(
+                    connection,
+                    django_forcedfields.TimestampPartitionSchemaEditorMixin
+                ) as schema_editor:
+                    for partitioned_model_class in (model_class, other_model_class):
+                        schema_editor.delete_model(partitioned_model_class)
+                        schema_editor.create_model(partitioned_model_class)
+                try:
+                    partitioning = django_forcedfields.TimestampPartitioning(
+                        model_class,
+                        connection
+                    )
+                    other_partitioning = django_forcedfields.TimestampPartitioning(
+                        other_model_class,
+                        connection
+                    )
+                    start = partitioning.get_current_period_start()
+                    model_class.objects.using(alias).create()
+                    django.core.management.call_command(
+                        command,
+                        model_class._meta.label,
+                        ahead=2,
+                        database=alias,
+                        stdout=io.StringIO()
+                    )
+
+                    self.assertEqual(
+                        list(partitioning.get_partitions()),
+                        [partitioning.get_period_start(start, periods) for periods in range(3)]
+                    )
+                    self.assertEqual(
+                        list(other_partitioning.get_partitions()),
+                        [other_partitioning.get_current_period_start()]
+                    )
+                    self.assertEqual(model_class.objects.using(alias).count(), 1)
+
+                    future_start = partitioning.get_period_start(start, 2)
+                    with unittest.mock.patch(
+                        'django.utils.timezone.now',
+                        return_value=future_start
+                    ):
+                        if connection.vendor == 'mysql':
+                            with self.assertRaises(django.core.management.CommandError):
+                                django.core.management.call_command(
+                                    command,
+                                    model_class._meta.label,
+                                    database=alias,
+                                    retain=0,
+                                    stdout=io.StringIO()
+                                )
+                        django.core.management.call_command(
+                            command,
+                            model_class._meta.label,
+                            ahead=0,
+                            database=alias,
+                            drop=True,
+                            retain=0,
+                            stdout=io.StringIO()
+                        )
+
+                    self.assertEqual(list(partitioning.get_partitions()), [future_start])
+                    self.assertEqual(model_class.objects.using(alias).count(), 0)
+                finally:
+                    with connection.schema_editor() as schema_editor:
+                        for partitioned_model_class in (model_class, other_model_class):
+                            schema_editor.delete_model(partitioned_model_class)
+                            schema_editor.create_model(partitioned_model_class)
+
+    def test_partition_sql(self):
+        """
+        Test the DDL of partitioned tables and partitions.
+
+        """
+        model_class = test_models.TSPartitionedRecord
+        expected_sql_dict = {
+            'mysql': [
+                'PRIMARY KEY (`id`, `ts_field_1`)) '
+                'PARTITION BY RANGE (UNIX_TIMESTAMP(`ts_field_1`)) '
+                '(PARTITION `p{start:%Y%m%d}` VALUES LESS THAN '
+                '(UNIX_TIMESTAMP(\'{end:%Y-%m-%d %H:%M:%S}\')));'
+            ],
+            'postgresql': [
+                'PRIMARY KEY ("id", "ts_field_1")) PARTITION BY RANGE ("ts_field_1");',
+                'CREATE TABLE "tests_tspartitionedrecord_p{start:%Y%m%d}" '
+                'PARTITION OF "tests_tspartitionedrecord" '
+                'FOR VALUES FROM (MINVALUE) TO (\'{end:%Y-%m-%d %H:%M:%S}\');'
+            ],
+            'sqlite': [
+                '"id" CHAR(26) NOT NULL PRIMARY KEY, '
+                '"ts_field_1" DATETIME DEFAULT CURRENT_TIMESTAMP NOT NULL);'
+            ]
+        }
+        for alias in test_utils.get_db_aliases():
+            connection = django.db.connections[alias]
+            with self.subTest(backend=connection.settings_dict['ENGINE']):
+                start = datetime.datetime.now().replace(
+                    day=1,
+                    hour=0,
+                    minute=0,
+                    second=0,
+                    microsecond=0
+                )
+                end = (start + datetime.timedelta(days=31)).replace(day=1)
+                with test_utils.get_schema_editor(
+                    connection,
+                    django_forcedfields.TimestampPartitionSchemaEditorMixin,
+                    collect_sql=True
+                ) as schema_editor:
+                    schema_editor.create_model(model_class)
+                expected_sql = [
+                    sql.format(start=start, end=end)
+                    for sql in expected_sql_dict[connection.vendor]
+                ]
+
+                self.assertEqual(len(schema_editor.collected_sql), len(expected_sql))
+                self.assertTrue(schema_editor.collected_sql[0].endswith(expected_sql[0]))
+                self.assertEqual(schema_editor.collected_sql[1:], expected_sql[1:])
+
+                if connection.vendor == 'postgresql':
+                    # A parenthesis in the table options must not end the column definitions.
+                    with unittest.mock.patch.object(model_class._meta, 'db_tablespace', 'ts)1'):
+                        with test_utils.get_schema_editor(
+                            connection,
+                            django_forcedfields.TimestampPartitionSchemaEditorMixin,
+                            collect_sql=True
+                        ) as schema_editor:
+                            schema_editor.create_model(model_class)
+                    self.assertTrue(
+                        schema_editor.collected_sql[0].endswith(
+                            'PRIMARY KEY ("id", "ts_field_1")) PARTITION BY RANGE ("ts_field_1") '
+                            'TABLESPACE "ts)1";'
+                        )
+                    )
+
+        partitioning = django_forcedfields.TimestampPartitioning(
+            model_class,
+            django.db.connections[test_utils.ALIAS_POSTGRESQL]
+        )
+        self.assertEqual(
+            partitioning.get_remove_partition_sql(datetime.datetime(2018, 1, 1)),
+            'ALTER TABLE "tests_tspartitionedrecord" '
+            'DETACH PARTITION "tests_tspartitionedrecord_p20180101"'
+        )
+        self.assertEqual(
+            partitioning.get_remove_partition_sql(datetime.datetime(2018, 1, 1), drop=True),
+            'DROP TABLE "tests_tspartitionedrecord_p20180101"'
+        )
+
+    def test_precision_sqlite(self):
+        """
+        Test that ORM writes of the current timestamp follow the field's precision in sqlite3.
+
+        Django's Now() would store milliseconds regardless of the precision. Fields without a
+        precision must keep using Now() and therefore store milliseconds.
+
+        """
+        model_class = test_models.TSPrecisionRecord
+        connection = django.db.connections[test_utils.ALIAS_SQLITE]
+        queryset = model_class.objects.using(test_utils.ALIAS_SQLITE)
+        select_sql = 'SELECT CAST({!s} AS TEXT), CAST({!s} AS TEXT) FROM {!s}'.format(
+            connection.ops.quote_name('ts_field_1'),
+            connection.ops.quote_name('ts_field_2'),
+            connection.ops.quote_name(model_class._meta.db_table)
+        )
+        writes = [
+            queryset.create,
+            lambda: queryset.bulk_create([model_class()]),
+            lambda: queryset.update(update_field_1=1),
+            queryset.touch,
+            lambda: queryset.first().save()
+        ]
+        for write in writes:
+            write()
+            with connection.cursor() as cursor:
+                cursor.execute(select_sql)
+                raw_values = cursor.fetchall()
+
+            for raw_value, default_raw_value in raw_values:
+                self.assertRegex(raw_value, r'^\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}$')
+                self.assertRegex(
+                    default_raw_value,
+                    r'^\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}\.\d{3}$'
+                )
+
+    def test_queryset_bulk_create(self):
+        """
+        Test that TimestampQuerySet.bulk_create() shares one compiled expression among all rows.
+
+        """
+        test_model_class_name = test_utils.get_ts_model_class_name(auto_now_add=True)
+        test_model_class = getattr(test_models, test_model_class_name)
+        for alias in test_utils.get_db_aliases():
+            engine = django.db.connections[alias].settings_dict['ENGINE']
+            with self.subTest(backend=engine):
+                queryset = django_forcedfields.TimestampQuerySet(test_model_class, using=alias)
+                test_models_list = [test_model_class() for _ in range(3)]
+                queryset.bulk_create(test_models_list)
+                values = [
+                    getattr(test_model, test_utils.TS_FIELD_ATTRNAME)
+                    for test_model in test_models_list
+                ]
+                retrieved_values = queryset.values_list(test_utils.TS_FIELD_ATTRNAME, flat=True)
+
+                if django.db.connections[alias].features.can_return_rows_from_bulk_insert:
+                    # The shared expression has been replaced by values returned by the INSERT.
+                    self.assertIsInstance(values[0], datetime.datetime)
+                    self.assertEqual(len(set(values)), 1)
+                else:
+                    self.assertIsInstance(values[0], django_forcedfields.CompiledExpression)
+                    self.assertEqual(len({id(value) for value in values}), 1)
+                self.assertEqual(len(retrieved_values), 3)
+                for retrieved_value in retrieved_values:
+                    self._assert_datetime_equal(retrieved_value, datetime.datetime.now())
+
+        # The expressions are compiled for the database written to, not the one read from.
+        with unittest.mock.patch.object(
+            django.db.router,
+            'db_for_read',
+            return_value=test_utils.ALIAS_SQLITE
+        ), unittest.mock.patch.object(
+            django_forcedfields.CompiledExpression,
+            'compile',
+            wraps=django_forcedfields.CompiledExpression.compile
+        ) as compile_mock:
+            queryset = django_forcedfields.TimestampQuerySet(test_model_class)
+            queryset.bulk_create([test_model_class()])
+        self.assertEqual(compile_mock.call_args[0][2], django.db.DEFAULT_DB_ALIAS)
+
+        # An expression compiled for one database is compiled again for another vendor's database.
+        compiled_expression = django_forcedfields.CompiledExpression.compile(
+            django.db.models.functions.Now(),
+            django.db.models.sql.InsertQuery(test_model_class),
+            test_utils.ALIAS_SQLITE
+        )
+        for alias in test_utils.get_db_aliases():
+            connection = django.db.connections[alias]
+            with self.subTest(backend=connection.settings_dict['ENGINE']):
+                compiler = django.db.models.sql.InsertQuery(test_model_class).get_compiler(alias)
+                sql, params = compiled_expression.as_sql(compiler, connection)
+                expected_sql, expected_params = compiler.compile(compiled_expression.expression)
+
+                self.assertEqual((sql, tuple(params)), (expected_sql, tuple(expected_params)))
+
+    def test_queryset_bulk_update(self):
+        """
+        Test that TimestampQuerySet.bulk_update() sets the current timestamp.
+
+        """
+        past_value = datetime.datetime(2000, 1, 1)
+        for alias in test_utils.get_db_aliases():
+            engine = django.db.connections[alias].settings_dict['ENGINE']
+            with self.subTest(backend=engine):
+                queryset = test_models.TSManagedRecord.objects.using(alias)
+                test_model = queryset.create(**{test_utils.TS_FIELD_ATTRNAME: past_value})
+                setattr(test_model, test_utils.TS_UPDATE_FIELD_ATTRNAME, 1)
+                queryset.bulk_update([test_model], [test_utils.TS_UPDATE_FIELD_ATTRNAME])
+                updated_value = getattr(
+                    queryset.get(id=test_model.id),
+                    test_utils.TS_FIELD_ATTRNAME
+                )
+
+                self._assert_datetime_equal(updated_value, datetime.datetime.now())
+                self.assertEqual(getattr(test_model, test_utils.TS_FIELD_ATTRNAME), updated_value)
+
+    def test_queryset_purge(self):
+        """
+        Test that TimestampQuerySet.purge() deletes expired rows in chunks of rows and of time.
+
+        The throttle is called between chunks but not after the last one.
+
+        """
+        model_class = test_models.TSIndexedRecord
+        start = datetime.datetime(2001, 2, 3)
+        for alias in test_utils.get_db_aliases():
+            connection = django.db.connections[alias]
+            with self.subTest(backend=connection.settings_dict['ENGINE']):
+                model_class.objects.using(alias).bulk_create([
+                    model_class(
+                        ts_field_1=start + datetime.timedelta(hours=hours),
+                        ts_field_2=start + datetime.timedelta(hours=hours)
+                    )
+                    for hours in range(10)
+                ])
+                queryset = django_forcedfields.TimestampQuerySet(model_class, using=alias)
+                throttle_progress = []
+                progress = queryset.purge(
+                    'ts_field_1',
+                    start + datetime.timedelta(hours=7),
+                    chunk_size=3,
+                    throttle=throttle_progress.append
+                )
+
+                self.assertEqual((progress.chunks, progress.rows_deleted), (3, 7))
+                self.assertEqual(
+                    [(item.chunks, item.rows_deleted) for item in throttle_progress],
+                    [(1, 3), (2, 6)]
+                )
+                self.assertEqual(
+                    min(queryset.values_list('ts_field_1', flat=True)),
+                    start + datetime.timedelta(hours=7)
+                )
+
+                output = io.StringIO()
+                django.core.management.call_command(
+                    django_forcedfields.TimestampPurgeCommand(),
+                    model_class._meta.label,
+                    'ts_field_2',
+                    '0',
+                    database=alias,
+                    dry_run=True,
+                    stdout=output
+                )
+                self.assertEqual(output.getvalue(), '3 rows would be deleted.\n')
+
+                progress = queryset.purge(
+                    'ts_field_2',
+                    start + datetime.timedelta(hours=10),
+                    chunk_interval=datetime.timedelta(hours=2)
+                )
+
+                self.assertEqual((progress.chunks, progress.rows_deleted), (2, 3))
+                self.assertFalse(queryset.exists())
+
+                with self.assertRaises(TypeError):
+                    queryset[:1].purge('ts_field_1', start)
+                with self.assertRaises(ValueError):
+                    queryset.purge('id', start)
+                with self.assertRaises(ValueError):
+                    queryset.purge('ts_field_1', start, chunk_size=0)
+
+    def test_queryset_touch(self):
+        """
+        Test that TimestampQuerySet.touch() sets the current timestamp in chunks of rows.
+
+        """
+        past_value = datetime.datetime(2000, 1, 1)
+        for alias in test_utils.get_db_aliases():
+            connection = django.db.connections[alias]
+            with self.subTest(backend=connection.settings_dict['ENGINE']):
+                queryset = test_models.TSManagedRecord.objects.using(alias)
+                for update_value in range(5):
+                    queryset.create(**{test_utils.TS_UPDATE_FIELD_ATTRNAME: update_value})
+                queryset.update(**{test_utils.TS_FIELD_ATTRNAME: past_value})
+                touched_queryset = queryset.filter(
+                    **{test_utils.TS_UPDATE_FIELD_ATTRNAME + '__gte': 1}
+                )
+                with django.test.utils.CaptureQueriesContext(connection) as captured_queries:
+                    rows_updated = touched_queryset.touch(chunk_size=2)
+                update_sql = [
+                    query['sql'] for query in captured_queries.captured_queries
+                    if query['sql'].startswith('UPDATE')
+                ]
+
+                self.assertEqual(rows_updated, 4)
+                self.assertEqual(len(update_sql), 2)
+                self.assertEqual(
+                    getattr(
+                        queryset.get(**{test_utils.TS_UPDATE_FIELD_ATTRNAME: 0}),
+                        test_utils.TS_FIELD_ATTRNAME
+                    ),
+                    past_value
+                )
+                for value in touched_queryset.values_list(test_utils.TS_FIELD_ATTRNAME, flat=True):
+                    self._assert_datetime_equal(value, datetime.datetime.now())
+                self.assertEqual(touched_queryset.touch(), 4)
+
+    def test_queryset_update(self):
+        """
+        Test that TimestampQuerySet.update() sets the current timestamp unless explicitly assigned.
+
+        """
+        past_value = datetime.datetime(2000, 1, 1)
+        for alias in test_utils.get_db_aliases():
+            engine = django.db.connections[alias].settings_dict['ENGINE']
+            with self.subTest(backend=engine):
+                queryset = test_models.TSManagedRecord.objects.using(alias)
+                test_model = queryset.create()
+
+                queryset.update(**{test_utils.TS_FIELD_ATTRNAME: past_value})
+                explicit_value = getattr(
+                    queryset.get(id=test_model.id),
+                    test_utils.TS_FIELD_ATTRNAME
+                )
+                self.assertEqual(explicit_value, past_value)
+
+                queryset.update(**{test_utils.TS_UPDATE_FIELD_ATTRNAME: 1})
+                updated_value = getattr(
+                    queryset.get(id=test_model.id),
+                    test_utils.TS_FIELD_ATTRNAME
+                )
+                self._assert_datetime_equal(updated_value, datetime.datetime.now())
+
+    def test_returning(self):
+        """
+        Test that database-generated timestamps replace Now() expressions on insert and update.
+
+        INSERT ... RETURNING is used where Django reports support for it. UPDATE ... RETURNING is
+        only supported by PostgreSQL and SQLite 3.35 or later.
+
+        """
+        for alias in test_utils.get_db_aliases():
+            connection = django.db.connections[alias]
+            with self.subTest(backend=connection.settings_dict['ENGINE']):
+                queryset = test_models.TSReturningRecord.objects.using(alias)
+                test_model = queryset.create()
+                inserted_value = test_model.__dict__[test_utils.TS_FIELD_ATTRNAME]
+                if connection.features.can_return_columns_from_insert:
+                    self.assertEqual(
+                        inserted_value,
+                        getattr(queryset.get(id=test_model.id), test_utils.TS_FIELD_ATTRNAME)
+                    )
+                else:
+                    self.assertIsInstance(inserted_value, django.db.models.functions.Now)
+
+                setattr(test_model, test_utils.TS_UPDATE_FIELD_ATTRNAME, 1)
+                test_model.save()
+                updated_value = test_model.__dict__[test_utils.TS_FIELD_ATTRNAME]
+                if connection.vendor == 'postgresql' or (
+                        connection.vendor == 'sqlite'
+                        and connection.Database.sqlite_version_info >= (3, 35)):
+                    self.assertEqual(
+                        updated_value,
+                        getattr(queryset.get(id=test_model.id), test_utils.TS_FIELD_ATTRNAME)
+                    )
+                else:
+                    self.assertIsInstance(updated_value, django.db.models.functions.Now)
+
+    def test_queryset_upsert(self):
+        """
+        Test that TimestampQuerySet.upsert() inserts and updates rows in a single statement.
+
+        On conflict, the auto_now_add field must be left untouched and the auto_now_update field
+        must be set to the current timestamp.
+
+        """
+        past_value = datetime.datetime(2000, 1, 1)
+        for alias in test_utils.get_db_aliases():
+            connection = django.db.connections[alias]
+            with self.subTest(backend=connection.settings_dict['ENGINE']):
+                queryset = test_models.TSUpsertRecord.objects.using(alias)
+                queryset.create(key_field_1=1, update_field_1=1)
+                queryset.update(ts_field_1=past_value, ts_field_2=past_value)
+                with django.test.utils.CaptureQueriesContext(connection) as captured_queries:
+                    upserted_records = queryset.upsert(
+                        [
+                            test_models.TSUpsertRecord(key_field_1=1, update_field_1=2),
+                            test_models.TSUpsertRecord(key_field_1=2, update_field_1=3)
+                        ],
+                        unique_fields=['key_field_1']
+                    )
+                insert_sql = [
+                    query['sql'] for query in captured_queries.captured_queries
+                    if query['sql'].startswith('INSERT')
+                ]
+                updated_record = queryset.get(key_field_1=1)
+                inserted_record = queryset.get(key_field_1=2)
+
+                self.assertEqual(len(insert_sql), 1)
+                for upserted_record in upserted_records:
+                    self.assertFalse(upserted_record._state.adding)
+                    self.assertEqual(upserted_record._state.db, alias)
+                self.assertEqual(updated_record.update_field_1, 2)
+                self.assertEqual(updated_record.ts_field_1, past_value)
+                self._assert_datetime_equal(updated_record.ts_field_2, datetime.datetime.now())
+                self.assertEqual(inserted_record.update_field_1, 3)
+                self._assert_datetime_equal(inserted_record.ts_field_1, datetime.datetime.now())
+                self.assertIsNone(inserted_record.ts_field_2)
+
     def test_table_structure_mysql(self):
         """
         Test correct DB table structures with MySQL backend.
@@ -471,6 +1638,112 @@ class TestTimestampField(django.test.TransactionTestCase, test_utils.FieldTestCo
         self.assertEqual(ts_record[3], 1) # notnull
         self.assertEqual(ts_record[4], 'CURRENT_TIMESTAMP') # dflt_value
 
+    def test_touch_buffer(self):
+        """
+        Test that TimestampTouchBuffer coalesces touches into one UPDATE statement per flush.
+
+        The touches of a failed flush must remain pending for the next flush. Touches inside an
+        atomic block must not be flushed until outside of it or by the thread started by start().
+
+        """
+        past_value = datetime.datetime(2000, 1, 1)
+        model_class = test_models.TSManagedRecord
+        for alias in test_utils.get_db_aliases():
+            connection = django.db.connections[alias]
+            with self.subTest(backend=connection.settings_dict['ENGINE']):
+                queryset = model_class.objects.using(alias)
+                pks = [queryset.create().pk for _ in range(2)]
+                queryset.update(**{test_utils.TS_FIELD_ATTRNAME: past_value})
+                touch_buffer = django_forcedfields.TimestampTouchBuffer(
+                    using=alias,
+                    max_size=2,
+                    interval=3600
+                )
+
+                with django.test.utils.CaptureQueriesContext(connection) as captured_queries:
+                    for _ in range(3):
+                        self.assertEqual(touch_buffer.touch(model_class, pks[0]), 0)
+                    self.assertEqual(touch_buffer.touch(model_class, pks[1]), 2)
+                self.assertEqual(len(captured_queries), 1)
+                self.assertEqual(touch_buffer.flush_count, 1)
+                for value in queryset.values_list(test_utils.TS_FIELD_ATTRNAME, flat=True):
+                    self._assert_datetime_equal(value, datetime.datetime.now())
+
+                touch_buffer.touch(model_class, pks[0], pks[0])
+                self.assertEqual(touch_buffer.flush(), 1)
+                self.assertEqual(touch_buffer.flush_count, 2)
+                self.assertEqual(touch_buffer.coalescing_ratio, 2.0)
+
+                touch_buffer.touch(model_class, pks[0])
+                with unittest.mock.patch.object(
+                    django_forcedfields.TimestampQuerySet,
+                    'touch',
+                    side_effect=django.db.utils.OperationalError
+                ):
+                    self.assertRaises(django.db.utils.OperationalError, touch_buffer.flush)
+                self.assertEqual(touch_buffer.flush_count, 2)
+                self.assertEqual(touch_buffer.touch(model_class, pks[1]), 2)
+                self.assertEqual(touch_buffer.flush_count, 3)
+                self.assertRaises(
+                    ValueError,
+                    touch_buffer.touch,
+                    test_models.OmitDBDefaultsRecord,
+                    1
+                )
+
+                with django.db.transaction.atomic(using=alias):
+                    self.assertEqual(touch_buffer.touch(model_class, *pks), 0)
+                    self.assertRaises(
+                        django.db.transaction.TransactionManagementError,
+                        touch_buffer.flush
+                    )
+                self.assertEqual(touch_buffer.flush_count, 3)
+                self.assertEqual(touch_buffer.flush(), 2)
+                self.assertEqual(touch_buffer.flush_count, 4)
+
+                touch_buffer.touch(model_class, pks[0])
+                touch_buffer.start()
+                self.assertRaises(RuntimeError, touch_buffer.start)
+                touch_buffer.stop()
+                self.assertEqual(touch_buffer.flush_count, 5)
+                self.assertEqual(touch_buffer.flush(), 0)
+
+    def test_trigger_sql(self):
+        """
+        Test the statements generated by get_trigger_sql() and get_drop_trigger_sql().
+
+        Triggers are only generated for auto_now and auto_now_update and only where no ON UPDATE
+        clause is available.
+
+        """
+        expected_statement_counts = {
+            test_utils.ALIAS_MYSQL: (0, 0),
+            test_utils.ALIAS_POSTGRESQL: (2, 2),
+            test_utils.ALIAS_SQLITE: (1, 1)
+        }
+        for test_config in test_utils.TS_TEST_CONFIGS:
+            test_model_class_name = test_utils.get_ts_model_class_name(**test_config.kwargs_dict)
+            test_model_class = getattr(test_models, test_model_class_name)
+            test_field = test_model_class._meta.get_field(test_utils.TS_FIELD_ATTRNAME)
+            db_table = test_model_class._meta.db_table
+            fields = test_model_class._meta.local_concrete_fields
+            has_trigger = test_field.auto_now or test_field.auto_now_update
+            for alias, expected_counts in expected_statement_counts.items():
+                if alias == test_utils.ALIAS_MYSQL and test_field.storage == 'epoch_ms':
+                    # MySQL has no ON UPDATE clause for integer columns.
+                    expected_counts = (1, 1)
+                connection = django.db.connections[alias]
+                schema_editor = connection.schema_editor()
+                with self.subTest(
+                    backend=connection.settings_dict['ENGINE'],
+                    kwargs=', '.join(test_config.kwargs_dict.keys())
+                ):
+                    trigger_sql = test_field.get_trigger_sql(schema_editor, db_table, fields)
+                    drop_sql = test_field.get_drop_trigger_sql(schema_editor, db_table)
+
+                    self.assertEqual(len(trigger_sql), expected_counts[0] if has_trigger else 0)
+                    self.assertEqual(len(drop_sql), expected_counts[1])
+
     def test_update(self):
         """
         Test that an UPDATE statement works correctly in specific cases.
@@ -487,3 +1760,17 @@ class TestTimestampField(django.test.TransactionTestCase, test_utils.FieldTestCo
             with self.subTest(backend=engine):
                 self._test_update_no_auto(alias)
                 self._test_update_auto(alias)
+
+    def test_update_trigger_postgresql(self):
+        """
+        Test that the PostgreSQL trigger sets the current timestamp in QuerySet.update().
+
+        """
+        self._test_update_trigger(test_utils.ALIAS_POSTGRESQL)
+
+    def test_update_trigger_sqlite(self):
+        """
+        Test that the sqlite3 trigger sets the current timestamp in QuerySet.update().
+
+        """
+        self._test_update_trigger(test_utils.ALIAS_SQLITE)
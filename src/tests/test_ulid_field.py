@@ -0,0 +1,150 @@
+"""
+Tests of ULIDField and the time-ordered identifier generation it shares with UUID7Field.
+
+"""
+
+
+# Accessing models' _meta attribute violates pylint rule.
+# pylint: disable=protected-access
+
+
+import datetime
+
+import django.db
+import django.test
+
+import django_forcedfields as forcedfields
+from . import models as test_models
+from . import utils as test_utils
+
+
+class TestULIDField(django.test.TransactionTestCase):
+    """
+    Defines tests for the ULID field class.
+
+    This class inherits from TransactionTestCase for the same reasons as TestFixedCharField.
+
+    """
+
+    multi_db = True
+
+    def test_bulk_create_order(self):
+        """
+        Test that batch-generated primary keys sort in generation order in the database.
+
+        """
+        field = test_models.ULIDRecord._meta.pk
+        for db_alias in test_utils.get_db_aliases():
+            db_connection = django.db.connections[db_alias]
+            with self.subTest(backend=db_connection.settings_dict['ENGINE']):
+                records = field.populate_ids(
+                    test_models.ULIDRecord(position=position)
+                    for position in range(test_utils.TOID_BATCH_SIZE)
+                )
+                test_models.ULIDRecord.objects.using(db_alias).bulk_create(records)
+                positions = list(
+                    test_models.ULIDRecord.objects.using(db_alias)
+                    .order_by('pk')
+                    .values_list('position', flat=True)
+                )
+
+                self.assertEqual(positions, list(range(test_utils.TOID_BATCH_SIZE)))
+
+    def test_db_type(self):
+        """
+        Test output of the field's inherited "db_type" method.
+
+        """
+        expected_db_types = {
+            test_utils.ALIAS_MYSQL: 'CHAR(26) CHARACTER SET ascii',
+            test_utils.ALIAS_POSTGRESQL: 'CHAR(26)',
+            test_utils.ALIAS_SQLITE: 'CHAR(26)'
+        }
+        field = forcedfields.ULIDField()
+        for db_alias, expected_db_type in expected_db_types.items():
+            db_connection = django.db.connections[db_alias]
+            with self.subTest(backend=db_connection.settings_dict['ENGINE']):
+                self.assertEqual(field.db_type(db_connection), expected_db_type)
+
+    def test_field_deconstruction(self):
+        """
+        Test that the fixed max_length and the default charset are omitted from deconstruction.
+
+        """
+        field = forcedfields.ULIDField()
+        kwargs = field.deconstruct()[3]
+        self.assertNotIn('max_length', kwargs)
+        self.assertNotIn('charset', kwargs)
+
+        field = forcedfields.ULIDField(charset=None)
+        kwargs = field.deconstruct()[3]
+        self.assertIsNone(kwargs['charset'])
+        self.assertIsNone(forcedfields.ULIDField(**kwargs).charset)
+
+    def test_generate_ids(self):
+        """
+        Test that generated identifiers are valid, strictly increasing, and carry their timestamp.
+
+        """
+        field = forcedfields.ULIDField()
+        before = datetime.datetime.now(datetime.timezone.utc).replace(microsecond=0)
+        values = field.generate_ids(test_utils.TOID_BATCH_SIZE) + field.generate_ids(2)
+        after = datetime.datetime.now(datetime.timezone.utc) + datetime.timedelta(milliseconds=1)
+
+        self.assertEqual(values, sorted(set(values)))
+        for value in values:
+            self.assertRegex(value, r'^[0-9A-HJKMNP-TV-Z]{26}$')
+            self.assertTrue(before <= field.get_timestamp(value) <= after)
+
+    def test_generator_overflow(self):
+        """
+        Test that the timestamp is advanced when the random bits would overflow.
+
+        """
+        generator = forcedfields.TimeOrderedIDGenerator(8)
+        generator.generate()
+        last_timestamp_ms = generator._last_timestamp_ms
+        generator._last_random = 250
+        values = generator.generate(10)
+
+        self.assertEqual(values, sorted(set(values)))
+        self.assertEqual(values[0] >> 8, last_timestamp_ms + 1)
+
+    def test_id_range(self):
+        """
+        Test that get_id_range() selects records by creation time.
+
+        """
+        field = test_models.ULIDRecord._meta.pk
+        for db_alias in test_utils.get_db_aliases():
+            db_connection = django.db.connections[db_alias]
+            with self.subTest(backend=db_connection.settings_dict['ENGINE']):
+                record = test_models.ULIDRecord.objects.using(db_alias).create()
+                timestamp = field.get_timestamp(record.pk)
+                queryset = test_models.ULIDRecord.objects.using(db_alias)
+
+                self.assertTrue(
+                    queryset.filter(pk__range=field.get_id_range(timestamp, timestamp)).exists()
+                )
+                self.assertFalse(
+                    queryset.filter(
+                        pk__range=field.get_id_range(
+                            timestamp + datetime.timedelta(milliseconds=1),
+                            timestamp + datetime.timedelta(hours=1)
+                        )
+                    ).exists()
+                )
+
+    def test_insert(self):
+        """
+        Test that an identifier is generated on insert and that lookups are case insensitive.
+
+        """
+        for db_alias in test_utils.get_db_aliases():
+            db_connection = django.db.connections[db_alias]
+            with self.subTest(backend=db_connection.settings_dict['ENGINE']):
+                record = test_models.ULIDRecord.objects.using(db_alias).create()
+                queryset = test_models.ULIDRecord.objects.using(db_alias)
+
+                self.assertEqual(len(record.pk), 26)
+                self.assertTrue(queryset.filter(pk=record.pk.lower()).exists())
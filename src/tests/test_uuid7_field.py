@@ -0,0 +1,110 @@
+"""
+Tests of UUID7Field.
+
+"""
+
+
+# Accessing models' _meta attribute violates pylint rule.
+# pylint: disable=protected-access
+
+
+import datetime
+import uuid
+
+import django.db
+import django.test
+
+import django_forcedfields as forcedfields
+from . import models as test_models
+from . import utils as test_utils
+
+
+class TestUUID7Field(django.test.TransactionTestCase):
+    """
+    Defines tests for the version 7 UUID field class.
+
+    This class inherits from TransactionTestCase for the same reasons as TestFixedCharField.
+
+    """
+
+    multi_db = True
+
+    def test_bulk_create_order(self):
+        """
+        Test that batch-generated primary keys sort in generation order in the database.
+
+        """
+        field = test_models.UUID7Record._meta.pk
+        for db_alias in test_utils.get_db_aliases():
+            db_connection = django.db.connections[db_alias]
+            with self.subTest(backend=db_connection.settings_dict['ENGINE']):
+                records = field.populate_ids(
+                    test_models.UUID7Record(position=position)
+                    for position in range(test_utils.TOID_BATCH_SIZE)
+                )
+                test_models.UUID7Record.objects.using(db_alias).bulk_create(records)
+                positions = list(
+                    test_models.UUID7Record.objects.using(db_alias)
+                    .order_by('pk')
+                    .values_list('position', flat=True)
+                )
+
+                self.assertEqual(positions, list(range(test_utils.TOID_BATCH_SIZE)))
+
+    def test_generate_ids(self):
+        """
+        Test that generated identifiers are valid, strictly increasing, and carry their timestamp.
+
+        Byte order must match integer order since the databases compare the stored bytes.
+
+        """
+        field = forcedfields.UUID7Field()
+        before = datetime.datetime.now(datetime.timezone.utc).replace(microsecond=0)
+        values = field.generate_ids(test_utils.TOID_BATCH_SIZE)
+        after = datetime.datetime.now(datetime.timezone.utc) + datetime.timedelta(milliseconds=1)
+
+        self.assertEqual(values, sorted(set(values)))
+        self.assertEqual([value.bytes for value in values], sorted(value.bytes for value in values))
+        for value in values:
+            self.assertEqual(value.version, 7)
+            self.assertEqual(value.variant, uuid.RFC_4122)
+            self.assertTrue(before <= field.get_timestamp(value) <= after)
+
+    def test_id_range(self):
+        """
+        Test that get_id_range() selects records by creation time.
+
+        """
+        field = test_models.UUID7Record._meta.pk
+        for db_alias in test_utils.get_db_aliases():
+            db_connection = django.db.connections[db_alias]
+            with self.subTest(backend=db_connection.settings_dict['ENGINE']):
+                record = test_models.UUID7Record.objects.using(db_alias).create()
+                timestamp = field.get_timestamp(record.pk)
+                queryset = test_models.UUID7Record.objects.using(db_alias)
+
+                self.assertTrue(
+                    queryset.filter(pk__range=field.get_id_range(timestamp, timestamp)).exists()
+                )
+                self.assertFalse(
+                    queryset.filter(
+                        pk__range=field.get_id_range(
+                            timestamp + datetime.timedelta(milliseconds=1),
+                            timestamp + datetime.timedelta(hours=1)
+                        )
+                    ).exists()
+                )
+
+    def test_insert(self):
+        """
+        Test that an identifier is generated on insert and retrieved unchanged.
+
+        """
+        for db_alias in test_utils.get_db_aliases():
+            db_connection = django.db.connections[db_alias]
+            with self.subTest(backend=db_connection.settings_dict['ENGINE']):
+                record = test_models.UUID7Record.objects.using(db_alias).create()
+                retrieved_record = test_models.UUID7Record.objects.using(db_alias).get()
+
+                self.assertEqual(record.pk.version, 7)
+                self.assertEqual(retrieved_record.pk, record.pk)
@@ -15,11 +15,14 @@ import datetime
 import inspect
 import re
 import sys
+import uuid
 
 import django.db.models
 import django.db.utils
 import django.utils.timezone
 
+import django_forcedfields
+
 
 # Utilities to assist with referencing DATABASES settings dictionary.
 #
@@ -200,6 +203,8 @@ def get_model_class_name(prefix, **kwargs):
         key_string = str(key).replace('_', '').title()
         if isinstance(value, datetime.datetime):
             value_string = 'Datetime'
+        elif isinstance(value, bytes):
+            value_string = 'Bytes'
         else:
             value_string = re.sub(r'[\s:\-\.]', '', str(value)).title()
         kwargs_strings.append(key_string + value_string)
@@ -207,6 +212,17 @@ def get_model_class_name(prefix, **kwargs):
     return prefix + suffix
 
 
+def get_fb_model_class_name(**kwargs):
+    """
+    Generate the model class name for use in FixedBinaryField tests.
+
+    Returns:
+        str: The model class name.
+
+    """
+    return get_model_class_name(FB_MODEL_CLASS_NAME_PREFIX, **kwargs)
+
+
 def get_fc_model_class_name(**kwargs):
     """
     Generate the model class name for use in FixedCharField tests.
@@ -229,6 +245,31 @@ def get_ts_model_class_name(**kwargs):
     return get_model_class_name(TS_MODEL_CLASS_NAME_PREFIX, **kwargs)
 
 
+def get_schema_editor(connection, mixin, collect_sql=False):
+    """
+    Create a schema editor that combines a schema editor mixin with the connection's schema editor.
+
+    The test settings use the stock database backends. Rather than defining a custom backend for
+    each, the mixin, such as TimestampTriggerSchemaEditorMixin, is combined with each connection's
+    schema editor class here.
+
+    Args:
+        connection: The Django connection object.
+        mixin (class): The schema editor mixin class.
+        collect_sql (boolean): When true, statements are collected instead of executed.
+
+    Returns:
+        A schema editor instance. Use it as a context manager.
+
+    """
+    schema_editor_class = type(
+        mixin.__name__.replace('Mixin', ''),
+        (mixin, connection.SchemaEditorClass),
+        {}
+    )
+    return schema_editor_class(connection, collect_sql=collect_sql)
+
+
 #######################
 # Test Configurations #
 #######################
@@ -240,9 +281,12 @@ def get_ts_model_class_name(**kwargs):
 # Configurations for FixedCharField tests.
 # Note that empty string insert values are not tested. PostgreSQL returns an empty string of
 # max_length while MySQL and SQLite return an empty string.
+FC_CHARSET = 'ascii'
+FC_COLLATION = {'mysql': 'ascii_bin', 'postgresql': 'C', 'sqlite': 'BINARY'}
 FC_DEFAULT_VALUE = 'four'
 FC_DEFAULT_MAX_LENGTH = 4
 FC_FIELD_ATTRNAME = 'fc_field_1'
+FC_INTERN_CACHE_SIZE = 2
 FC_TEST_CONFIGS = [
     FieldTestConfig(
         kwargs_dict={'max_length': FC_DEFAULT_MAX_LENGTH},
@@ -317,9 +361,101 @@ FC_TEST_CONFIGS = [
 FC_MODEL_CLASS_NAME_PREFIX = 'FCRecord'
 
 
+# Configurations for FixedBinaryField tests.
+FB_DEFAULT_VALUE = b'\x00\x01\xab\xff'
+FB_DEFAULT_VALUE_HEX = FB_DEFAULT_VALUE.hex()
+FB_DEFAULT_MAX_LENGTH = 4
+FB_FIELD_ATTRNAME = 'fb_field_1'
+FB_TEST_CONFIGS = [
+    FieldTestConfig(
+        kwargs_dict={'max_length': FB_DEFAULT_MAX_LENGTH},
+        db_type_dict={
+            ALIAS_MYSQL: 'BINARY(4)',
+            ALIAS_POSTGRESQL: 'BYTEA',
+            ALIAS_SQLITE: 'BLOB'
+        },
+        insert_values_dict={
+            django.db.models.NOT_PROVIDED: django.db.utils.IntegrityError,
+            None: django.db.utils.IntegrityError,
+            FB_DEFAULT_VALUE: FB_DEFAULT_VALUE
+        }
+    ),
+    FieldTestConfig(
+        kwargs_dict={'max_length': FB_DEFAULT_MAX_LENGTH, 'null': True},
+        db_type_dict={
+            ALIAS_MYSQL: 'BINARY(4)',
+            ALIAS_POSTGRESQL: 'BYTEA',
+            ALIAS_SQLITE: 'BLOB'
+        },
+        insert_values_dict={
+            django.db.models.NOT_PROVIDED: None,
+            None: None,
+            FB_DEFAULT_VALUE: FB_DEFAULT_VALUE
+        }
+    ),
+    FieldTestConfig(
+        kwargs_dict={'default': FB_DEFAULT_VALUE, 'max_length': FB_DEFAULT_MAX_LENGTH},
+        db_type_dict={
+            ALIAS_MYSQL: 'BINARY(4) DEFAULT X\'{!s}\''.format(FB_DEFAULT_VALUE_HEX),
+            ALIAS_POSTGRESQL: 'BYTEA DEFAULT \'\\x{!s}\'::bytea'.format(FB_DEFAULT_VALUE_HEX),
+            ALIAS_SQLITE: 'BLOB DEFAULT X\'{!s}\''.format(FB_DEFAULT_VALUE_HEX)
+        },
+        insert_values_dict={
+            django.db.models.NOT_PROVIDED: FB_DEFAULT_VALUE,
+            None: django.db.utils.IntegrityError,
+            FB_DEFAULT_VALUE: FB_DEFAULT_VALUE
+        }
+    ),
+    FieldTestConfig(
+        kwargs_dict={
+            'default': FB_DEFAULT_VALUE,
+            'max_length': FB_DEFAULT_MAX_LENGTH,
+            'null': True
+        },
+        db_type_dict={
+            ALIAS_MYSQL: 'BINARY(4) DEFAULT X\'{!s}\''.format(FB_DEFAULT_VALUE_HEX),
+            ALIAS_POSTGRESQL: 'BYTEA DEFAULT \'\\x{!s}\'::bytea'.format(FB_DEFAULT_VALUE_HEX),
+            ALIAS_SQLITE: 'BLOB DEFAULT X\'{!s}\''.format(FB_DEFAULT_VALUE_HEX)
+        },
+        insert_values_dict={
+            django.db.models.NOT_PROVIDED: FB_DEFAULT_VALUE,
+            None: None,
+            FB_DEFAULT_VALUE: FB_DEFAULT_VALUE
+        }
+    ),
+    FieldTestConfig(
+        kwargs_dict={'default': None, 'max_length': FB_DEFAULT_MAX_LENGTH, 'null': True},
+        db_type_dict={
+            ALIAS_MYSQL: 'BINARY(4) DEFAULT NULL',
+            ALIAS_POSTGRESQL: 'BYTEA DEFAULT NULL',
+            ALIAS_SQLITE: 'BLOB DEFAULT NULL'
+        },
+        insert_values_dict={
+            django.db.models.NOT_PROVIDED: None,
+            None: None,
+            FB_DEFAULT_VALUE: FB_DEFAULT_VALUE
+        }
+    )
+]
+FB_MODEL_CLASS_NAME_PREFIX = 'FBRecord'
+
+
+# Configurations for CompactUUIDField tests.
+CU_DEFAULT_VALUE = uuid.UUID('0f8f5d6c-4a4b-4e0e-9c3f-7d2a1b6e5c4d')
+CU_FIELD_ATTRNAME = 'cu_field_1'
+
+
+# Configurations for ULIDField and UUID7Field tests.
+TOID_BATCH_SIZE = 100
+
+
 # Configurations for TimestampField tests.
 TS_DEFAULT_VALUE = datetime.datetime.now().replace(microsecond=0)
 TS_DEFAULT_VALUE_STR = str(TS_DEFAULT_VALUE)
+# The test settings' TIME_ZONE, in which naive datetimes are interpreted, is UTC.
+TS_DEFAULT_VALUE_EPOCH_MS = int(
+    TS_DEFAULT_VALUE.replace(tzinfo=datetime.timezone.utc).timestamp()
+) * 1000
 TS_FIELD_ATTRNAME = 'ts_field_1'
 TS_TEST_CONFIGS = [
     FieldTestConfig(
@@ -528,7 +664,69 @@ TS_TEST_CONFIGS = [
             None: None,
             TS_DEFAULT_VALUE: TS_DEFAULT_VALUE
         }
+    ),
+    FieldTestConfig(
+        kwargs_dict={'auto_now': True, 'precision': 3},
+        db_type_dict={
+            ALIAS_MYSQL: 'TIMESTAMP(3) DEFAULT CURRENT_TIMESTAMP(3) ON UPDATE CURRENT_TIMESTAMP(3)',
+            ALIAS_POSTGRESQL: 'TIMESTAMP(3) WITHOUT TIME ZONE DEFAULT CURRENT_TIMESTAMP(3)',
+            ALIAS_SQLITE: 'DATETIME DEFAULT (STRFTIME(\'%Y-%m-%d %H:%M:%f\', \'now\'))'
+        },
+        insert_values_dict={
+            django.db.models.NOT_PROVIDED: datetime.datetime,
+            None: datetime.datetime,
+            TS_DEFAULT_VALUE: datetime.datetime
+        }
+    ),
+    FieldTestConfig(
+        kwargs_dict={'auto_now_add': True, 'auto_now_update': True, 'precision': 1},
+        db_type_dict={
+            ALIAS_MYSQL: 'TIMESTAMP(1) DEFAULT CURRENT_TIMESTAMP(1) ON UPDATE CURRENT_TIMESTAMP(1)',
+            ALIAS_POSTGRESQL: 'TIMESTAMP(1) WITHOUT TIME ZONE DEFAULT CURRENT_TIMESTAMP(1)',
+            ALIAS_SQLITE: (
+                'DATETIME DEFAULT (SUBSTR(STRFTIME(\'%Y-%m-%d %H:%M:%f\', \'now\'), 1, 21))'
+            )
+        },
+        insert_values_dict={
+            django.db.models.NOT_PROVIDED: datetime.datetime,
+            None: datetime.datetime,
+            TS_DEFAULT_VALUE: datetime.datetime
+        }
+    ),
+    FieldTestConfig(
+        kwargs_dict={'auto_now': True, 'storage': 'epoch_ms'},
+        db_type_dict={
+            ALIAS_MYSQL: 'BIGINT DEFAULT (FLOOR(UNIX_TIMESTAMP(CURRENT_TIMESTAMP(3)) * 1000))',
+            ALIAS_POSTGRESQL: (
+                'BIGINT DEFAULT (CAST(FLOOR(EXTRACT(EPOCH FROM CURRENT_TIMESTAMP) * 1000)'
+                ' AS BIGINT))'
+            ),
+            ALIAS_SQLITE: (
+                'BIGINT DEFAULT (CAST(STRFTIME(\'%s\', \'now\') AS INTEGER) * 1000'
+                ' + CAST(SUBSTR(STRFTIME(\'%f\', \'now\'), 4) AS INTEGER))'
+            )
+        },
+        insert_values_dict={
+            django.db.models.NOT_PROVIDED: datetime.datetime,
+            None: datetime.datetime,
+            TS_DEFAULT_VALUE: datetime.datetime
+        }
+    ),
+    FieldTestConfig(
+        kwargs_dict={'default': TS_DEFAULT_VALUE, 'storage': 'epoch_ms'},
+        db_type_dict={
+            ALIAS_MYSQL: 'BIGINT DEFAULT {:d}'.format(TS_DEFAULT_VALUE_EPOCH_MS),
+            ALIAS_POSTGRESQL: 'BIGINT DEFAULT {:d}'.format(TS_DEFAULT_VALUE_EPOCH_MS),
+            ALIAS_SQLITE: 'BIGINT DEFAULT {:d}'.format(TS_DEFAULT_VALUE_EPOCH_MS)
+        },
+        insert_values_dict={
+            django.db.models.NOT_PROVIDED: TS_DEFAULT_VALUE,
+            None: django.db.utils.IntegrityError,
+            TS_DEFAULT_VALUE: TS_DEFAULT_VALUE
+        }
     )
 ]
 TS_MODEL_CLASS_NAME_PREFIX = 'TsRecord'
+TS_PAGES_PER_RANGE = 16
+TS_PARTITION_INTERVAL = 'month'
 TS_UPDATE_FIELD_ATTRNAME = 'update_field_1'